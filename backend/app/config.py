@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List
 
 from pydantic_settings import BaseSettings
@@ -32,7 +33,18 @@ class Settings(BaseSettings):
     supabase_url: str = ""
     supabase_anon_key: str = ""
 
-    model_config = {"env_file": ["../.env", ".env"], "env_file_encoding": "utf-8", "extra": "ignore"}
+    model_config = {
+        "env_file": ["../.env", ".env"],
+        "env_file_encoding": "utf-8",
+        "extra": "ignore",
+        "frozen": True,
+    }
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse env files once per process; later calls return the same instance."""
+    return Settings()
+
+
+settings = get_settings()
@@ -2,17 +2,19 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from app.utils.enums import FastEnum
 
-class UrgencyLevel(str, Enum):
+
+class UrgencyLevel(FastEnum, str, Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
 
 
-class ActionCategory(str, Enum):
+class ActionCategory(FastEnum, str, Enum):
     THERMOSTAT = "thermostat"
     APPLIANCE = "appliance"
     EV = "ev"
@@ -67,6 +69,8 @@ class ProfileType(str, Enum):
 
 
 class ConsumerProfile(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     profile_id: str
     name: str
     profile_type: ProfileType
@@ -75,7 +79,7 @@ class ConsumerProfile(BaseModel):
     has_solar: bool = False
     has_battery: bool = False
     has_ev: bool = False
-    hvac_type: str = Field(examples=["central_ac"])
+    hvac_type: str
     avg_monthly_kwh: float
 
 
@@ -139,6 +143,8 @@ class Appliance(BaseModel):
 
 
 class OptimizedSchedule(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     appliance: str
     original_start: int
     optimized_start: int
@@ -149,6 +155,8 @@ class OptimizedSchedule(BaseModel):
 
 
 class Alert(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     severity: AlertSeverity
     title: str
     description: str
@@ -1,18 +1,59 @@
 import requests
-import json
 import os 
+from functools import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 # EIA Open Data API v2
 # Get your API key at: https://www.eia.gov/opendata/register.php
-API_KEY = os.getenv("EIA_API_KEY")
+@cache
+def _api_key():
+    # Read lazily (once) so the key can be set after import.
+    return os.getenv("EIA_API_KEY")
 
 
 BASE_URL = "https://api.eia.gov/v2"
 
+# One keep-alive session for every pull so the TCP/TLS connection to
+# api.eia.gov is reused instead of re-handshaking per request.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    ),
+)
+SESSION.mount("https://", _adapter)
+
+
+def _get(url, params, dest=None):
+    """GET an EIA dataset.
+
+    Without ``dest`` the parsed JSON is returned.  With ``dest`` the body is
+    streamed straight to that file in 64 KiB chunks and the byte count is
+    returned, skipping the parse / re-encode round trip.
+    """
+    if dest is None:
+        resp = SESSION.get(url, params=params, timeout=(3.05, 30))
+        resp.raise_for_status()
+        return resp.json()
+    with SESSION.get(url, params=params, timeout=(3.05, 30), stream=True) as resp:
+        resp.raise_for_status()
+        written = 0
+        with open(dest, "wb", buffering=1024 * 1024) as out:
+            for chunk in resp.iter_content(64 * 1024):
+                out.write(chunk)
+                written += len(chunk)
+    return written
+
 # --- Electricity demand (hourly) for Texas (ERCOT region) ---
-def pull_electricity_demand():
+def pull_electricity_demand(dest=None):
     url = f"{BASE_URL}/electricity/rto/region-data/data/"
     params = {
-        "api_key": API_KEY,
+        "api_key": _api_key(),
         "frequency": "hourly",
         "data[0]": "value",
         "facets[respondent][]": "TEX",
@@ -23,15 +64,13 @@ def pull_electricity_demand():
         "sort[0][direction]": "asc",
         "length": 5000,
     }
-    resp = requests.get(url, params=params)
-    resp.raise_for_status()
-    return resp.json()
+    return _get(url, params, dest)
 
 # --- Net generation by energy source for Texas ---
-def pull_generation_by_source():
+def pull_generation_by_source(dest=None):
     url = f"{BASE_URL}/electricity/rto/fuel-type-data/data/"
     params = {
-        "api_key": API_KEY,
+        "api_key": _api_key(),
         "frequency": "hourly",
         "data[0]": "value",
         "facets[respondent][]": "TEX",
@@ -41,15 +80,13 @@ def pull_generation_by_source():
         "sort[0][direction]": "asc",
         "length": 5000,
     }
-    resp = requests.get(url, params=params)
-    resp.raise_for_status()
-    return resp.json()
+    return _get(url, params, dest)
 
 # --- Interchange (imports/exports) for Texas ---
-def pull_interchange():
+def pull_interchange(dest=None):
     url = f"{BASE_URL}/electricity/rto/interchange-data/data/"
     params = {
-        "api_key": API_KEY,
+        "api_key": _api_key(),
         "frequency": "hourly",
         "data[0]": "value",
         "facets[fromba][]": "ERCO",
@@ -59,28 +96,21 @@ def pull_interchange():
         "sort[0][direction]": "asc",
         "length": 5000,
     }
-    resp = requests.get(url, params=params)
-    resp.raise_for_status()
-    return resp.json()
+    return _get(url, params, dest)
+
 
 
 if __name__ == "__main__":
     print("Pulling ERCOT electricity demand...")
-    demand = pull_electricity_demand()
-    with open("eia_texas_demand.json", "w") as f:
-        json.dump(demand, f, indent=2)
-    print(f"  -> {demand['response']['total']} records saved to eia_texas_demand.json")
+    size = pull_electricity_demand(dest="eia_texas_demand.json")
+    print(f"  -> {size:,} bytes saved to eia_texas_demand.json")
 
     print("Pulling ERCOT generation by fuel type...")
-    generation = pull_generation_by_source()
-    with open("eia_texas_generation.json", "w") as f:
-        json.dump(generation, f, indent=2)
-    print(f"  -> {generation['response']['total']} records saved to eia_texas_generation.json")
+    size = pull_generation_by_source(dest="eia_texas_generation.json")
+    print(f"  -> {size:,} bytes saved to eia_texas_generation.json")
 
     print("Pulling ERCOT interchange data...")
-    interchange = pull_interchange()
-    with open("eia_texas_interchange.json", "w") as f:
-        json.dump(interchange, f, indent=2)
-    print(f"  -> {interchange['response']['total']} records saved to eia_texas_interchange.json")
+    size = pull_interchange(dest="eia_texas_interchange.json")
+    print(f"  -> {size:,} bytes saved to eia_texas_interchange.json")
 
     print("Done.")
@@ -1,18 +1,92 @@
-import requests
-import json
+import asyncio
+import httpx
 import os 
+from functools import cache
 # EIA Open Data API v2
 # Get your API key at: https://www.eia.gov/opendata/register.php
-API_KEY = os.getenv("EIA_API_KEY")
+@cache
+def _api_key():
+    # Read lazily (once) so the key can be set after import.
+    return os.getenv("EIA_API_KEY")
 
 
 BASE_URL = "https://api.eia.gov/v2"
 
+# Bounded (connect, read) timeouts so a stalled EIA endpoint can't hang the
+# pipeline, plus exponential backoff on throttling / transient 5xx.
+TIMEOUT = httpx.Timeout(30.0, connect=3.05)
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+WRITE_QUEUE_DEPTH = 32  # 64 KiB chunks buffered between downloads and the writer
+
+
+async def _fetch(client: httpx.AsyncClient, url: str, params: dict, dest=None, queue=None):
+    """GET an EIA dataset, retrying transient failures.
+
+    Without ``dest`` the parsed JSON is returned.  With ``dest`` the body is
+    streamed to that file in 64 KiB chunks and the byte count is returned,
+    skipping the parse / re-encode round trip.  If a ``queue`` is given the
+    chunks are handed to a ``_writer`` task instead of written inline.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with client.stream("GET", url, params=params) as resp:
+                if resp.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    resp.raise_for_status()
+                    if dest is None:
+                        await resp.aread()
+                        return resp.json()
+                    written = 0
+                    if queue is not None:
+                        # "open" (re)truncates the file, so a retried attempt starts clean
+                        await queue.put(("open", dest, None))
+                        async for chunk in resp.aiter_bytes(64 * 1024):
+                            await queue.put(("data", dest, chunk))
+                            written += len(chunk)
+                        await queue.put(("close", dest, None))
+                        return written
+                    with open(dest, "wb", buffering=1024 * 1024) as out:
+                        async for chunk in resp.aiter_bytes(64 * 1024):
+                            out.write(chunk)
+                            written += len(chunk)
+                    return written
+        except httpx.TransportError:
+            if attempt == MAX_RETRIES:
+                raise
+        await asyncio.sleep(BACKOFF_FACTOR * 2 ** attempt)
+
+
+async def _writer(queue):
+    """Consume ``(op, path, chunk)`` messages and do the file I/O in a thread.
+
+    Downloads keep receiving while earlier chunks are flushed; the bounded
+    queue applies backpressure if disk falls behind.  ``None`` stops it.
+    """
+    files = {}
+    try:
+        while True:
+            msg = await queue.get()
+            if msg is None:
+                return
+            op, path, chunk = msg
+            if op == "open":
+                if path in files:
+                    await asyncio.to_thread(files.pop(path).close)
+                files[path] = open(path, "wb", buffering=1024 * 1024)
+            elif op == "data":
+                await asyncio.to_thread(files[path].write, chunk)
+            else:
+                await asyncio.to_thread(files.pop(path).close)
+    finally:
+        for f in files.values():
+            f.close()
+
 # --- Electricity demand (hourly) for Texas (ERCOT region) ---
-def pull_electricity_demand():
+async def pull_electricity_demand(client: httpx.AsyncClient, dest=None, queue=None):
     url = f"{BASE_URL}/electricity/rto/region-data/data/"
     params = {
-        "api_key": API_KEY,
+        "api_key": _api_key(),
         "frequency": "hourly",
         "data[0]": "value",
         "facets[respondent][]": "TEX",
@@ -23,15 +97,13 @@ def pull_electricity_demand():
         "sort[0][direction]": "asc",
         "length": 5000,
     }
-    resp = requests.get(url, params=params)
-    resp.raise_for_status()
-    return resp.json()
+    return await _fetch(client, url, params, dest, queue)
 
 # --- Net generation by energy source for Texas ---
-def pull_generation_by_source():
+async def pull_generation_by_source(client: httpx.AsyncClient, dest=None, queue=None):
     url = f"{BASE_URL}/electricity/rto/fuel-type-data/data/"
     params = {
-        "api_key": API_KEY,
+        "api_key": _api_key(),
         "frequency": "hourly",
         "data[0]": "value",
         "facets[respondent][]": "TEX",
@@ -41,15 +113,13 @@ def pull_generation_by_source():
         "sort[0][direction]": "asc",
         "length": 5000,
     }
-    resp = requests.get(url, params=params)
-    resp.raise_for_status()
-    return resp.json()
+    return await _fetch(client, url, params, dest, queue)
 
 # --- Interchange (imports/exports) for Texas ---
-def pull_interchange():
+async def pull_interchange(client: httpx.AsyncClient, dest=None, queue=None):
     url = f"{BASE_URL}/electricity/rto/interchange-data/data/"
     params = {
-        "api_key": API_KEY,
+        "api_key": _api_key(),
         "frequency": "hourly",
         "data[0]": "value",
         "facets[fromba][]": "ERCO",
@@ -59,28 +129,32 @@ def pull_interchange():
         "sort[0][direction]": "asc",
         "length": 5000,
     }
-    resp = requests.get(url, params=params)
-    resp.raise_for_status()
-    return resp.json()
+    return await _fetch(client, url, params, dest, queue)
+
+
+async def pull_all():
+    # One client for all three pulls so the connection to api.eia.gov is shared;
+    # the requests are independent, so run them concurrently.  Their bodies
+    # feed a single writer task through a bounded queue.
+    queue = asyncio.Queue(maxsize=WRITE_QUEUE_DEPTH)
+    writer = asyncio.create_task(_writer(queue))
+    try:
+        async with httpx.AsyncClient(timeout=TIMEOUT) as client:
+            return await asyncio.gather(
+                pull_electricity_demand(client, dest="eia_texas_demand.json", queue=queue),
+                pull_generation_by_source(client, dest="eia_texas_generation.json", queue=queue),
+                pull_interchange(client, dest="eia_texas_interchange.json", queue=queue),
+            )
+    finally:
+        await queue.put(None)
+        await writer
 
 
 if __name__ == "__main__":
-    print("Pulling ERCOT electricity demand...")
-    demand = pull_electricity_demand()
-    with open("eia_texas_demand.json", "w") as f:
-        json.dump(demand, f, indent=2)
-    print(f"  -> {demand['response']['total']} records saved to eia_texas_demand.json")
-
-    print("Pulling ERCOT generation by fuel type...")
-    generation = pull_generation_by_source()
-    with open("eia_texas_generation.json", "w") as f:
-        json.dump(generation, f, indent=2)
-    print(f"  -> {generation['response']['total']} records saved to eia_texas_generation.json")
-
-    print("Pulling ERCOT interchange data...")
-    interchange = pull_interchange()
-    with open("eia_texas_interchange.json", "w") as f:
-        json.dump(interchange, f, indent=2)
-    print(f"  -> {interchange['response']['total']} records saved to eia_texas_interchange.json")
+    print("Pulling ERCOT demand, generation by fuel type, and interchange...")
+    demand, generation, interchange = asyncio.run(pull_all())
+    print(f"  -> {demand:,} bytes saved to eia_texas_demand.json")
+    print(f"  -> {generation:,} bytes saved to eia_texas_generation.json")
+    print(f"  -> {interchange:,} bytes saved to eia_texas_interchange.json")
 
     print("Done.")
@@ -2,10 +2,15 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+# The canonical price schemas (served by /api/forecast/prices) live in
+# app.models.price; re-exported here rather than defined twice.
+from app.models.price import HourlyPrice, PriceForecastResponse  # noqa: F401
+from app.utils.enums import FastEnum
 
-class ISORegion(str, Enum):
+
+class ISORegion(FastEnum, str, Enum):
     CAISO = "CAISO"
     ERCOT = "ERCOT"
     PJM = "PJM"
@@ -39,6 +44,8 @@ class WeatherForecastRequest(BaseModel):
 
 
 class HourlyWeather(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     timestamp: datetime
     temperature_f: float
     humidity_pct: float
@@ -50,7 +57,7 @@ class HourlyWeather(BaseModel):
 class WeatherForecastResponse(BaseModel):
     latitude: float
     longitude: float
-    model: str = Field(examples=["earth2-fourcastnet"])
+    model: str
     generated_at: datetime
     hourly: List[HourlyWeather]
 
@@ -76,17 +83,3 @@ class PriceForecastRequest(BaseModel):
             ]
         }
     }
-
-
-class HourlyPrice(BaseModel):
-    timestamp: datetime
-    lmp_dollar_per_mwh: float
-    congestion_dollar_per_mwh: float
-    loss_dollar_per_mwh: float
-
-
-class PriceForecastResponse(BaseModel):
-    iso: ISORegion
-    node_id: Optional[str]
-    generated_at: datetime
-    hourly: List[HourlyPrice]
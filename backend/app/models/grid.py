@@ -1,19 +1,22 @@
 """Pydantic models for grid topology, node status, and cascade probability."""
 
 from datetime import datetime
-from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
-# ── Enums ───────────────────────────────────────────────────────────
+# ── Status literals ─────────────────────────────────────────────────
+# Literal rather than str-Enum: these sit on every node of 2k-node lists,
+# and pydantic-core checks a Literal with a plain string compare.
 
+NodeStatus = Literal["failed", "stressed", "nominal"]
+HotspotStatus = Literal["critical", "stressed", "normal"]
 
-class NodeStatus(str, Enum):
-    FAILED = "failed"
-    STRESSED = "stressed"
-    NOMINAL = "nominal"
+# Wire precision for globe payloads: 5 decimals of lat/lon is ~1 m, and
+# MW / percent readings need no more than 3.  Applied to JSON output only.
+COORD_DECIMALS = 5
+VALUE_DECIMALS = 3
 
 
 # ── Topology ────────────────────────────────────────────────────────
@@ -48,6 +51,8 @@ class GridTopologyResponse(BaseModel):
 
 
 class GridStatusNode(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore", json_schema_mode_override="serialization")
+
     id: str
     lat: float
     lon: float
@@ -56,6 +61,14 @@ class GridStatusNode(BaseModel):
     load_mw: float
     capacity_mw: float
 
+    @field_serializer("lat", "lon", when_used="json")
+    def _round_coord(self, v: float) -> float:
+        return round(v, COORD_DECIMALS)
+
+    @field_serializer("load_pct", "load_mw", "capacity_mw", when_used="json")
+    def _round_value(self, v: float) -> float:
+        return round(v, VALUE_DECIMALS)
+
 
 class GridStatusSummary(BaseModel):
     total_nodes: int
@@ -112,13 +125,23 @@ class GridHotspot(BaseModel):
     name: str
     lat: float
     lon: float
-    status: str = Field(description="critical / stressed / normal")
+    status: HotspotStatus
     load_mw: float
     capacity_mw: float
     outage_risk_pct: float
 
+    @field_serializer("lat", "lon", when_used="json")
+    def _round_coord(self, v: float) -> float:
+        return round(v, COORD_DECIMALS)
+
+    @field_serializer("load_mw", "capacity_mw", "outage_risk_pct", when_used="json")
+    def _round_value(self, v: float) -> float:
+        return round(v, VALUE_DECIMALS)
+
 
 class GridArc(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     source: str
     target: str
     source_coords: List[float] = Field(description="[lat, lon]")
@@ -126,7 +149,7 @@ class GridArc(BaseModel):
     flow_mw: float
     capacity_mw: float
     utilization_pct: float
-    status: str = Field(description="critical / stressed / normal")
+    status: HotspotStatus
 
 
 class HotspotsResponse(BaseModel):
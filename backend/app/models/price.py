@@ -4,16 +4,20 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from app.utils.enums import FastEnum
 
-class PricingMode(str, Enum):
+
+class PricingMode(FastEnum, str, Enum):
     ML = "ml"
     RULES = "rules"
     HYBRID = "hybrid"
 
 
 class HourlyPrice(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_mode_override="serialization")
+
     hour: int = Field(ge=0, le=47)
     timestamp: datetime
     price_mwh: float
@@ -32,6 +36,15 @@ class PriceForecastResponse(BaseModel):
     prices: List[HourlyPrice]
 
 
+class CombinedPriceForecastResponse(BaseModel):
+    region: str
+    zone: str
+    start_time: datetime
+    mode: PricingMode
+    region_prices: List[HourlyPrice]
+    zone_prices: List[HourlyPrice]
+
+
 class ModelInfoResponse(BaseModel):
     model_loaded: bool
     training_date: Optional[datetime] = None
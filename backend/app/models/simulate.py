@@ -1,9 +1,13 @@
 """Pydantic models for cascade simulation request / response."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from typing import Annotated, Any, Dict, List, Mapping, get_args
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator, WithJsonSchema
+
+from app.models.grid import NodeStatus
 
 
 # ── Request ─────────────────────────────────────────────────────────
@@ -34,6 +38,8 @@ class CascadeRequest(BaseModel):
 
 
 class FailedNodeInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore", json_schema_mode_override="serialization")
+
     id: str
     lat: float
     lon: float
@@ -52,6 +58,8 @@ class RerouteArc(BaseModel):
 
 
 class CascadeStep(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore", json_schema_mode_override="serialization")
+
     step: int
     new_failures: List[FailedNodeInfo]
     reroutes: List[RerouteArc] = []
@@ -60,12 +68,84 @@ class CascadeStep(BaseModel):
 
 
 class FinalNodeState(BaseModel):
-    status: str  # "failed" | "stressed" | "nominal"
+    model_config = ConfigDict(json_schema_mode_override="serialization")
+
+    status: NodeStatus
     current_load_mw: float
     capacity_mw: float
     load_pct: float
 
 
+# Status code → label; ``NodeStates.status`` stores indices into this tuple.
+NODE_STATUS_LABELS: tuple[str, ...] = get_args(NodeStatus)
+NODE_STATUS_CODES: Dict[str, int] = {s: i for i, s in enumerate(NODE_STATUS_LABELS)}
+
+
+@dataclass(frozen=True)
+class NodeStates:
+    """Final per-node cascade state as parallel arrays, one slot per node.
+
+    Replaces a dict of ``FinalNodeState`` rows: one allocation per column
+    instead of one model per node.  The ``{id: FinalNodeState}`` mapping is
+    only materialized when the result is serialized.
+    """
+
+    ids: List[str]
+    status: np.ndarray  # uint8 codes, see NODE_STATUS_LABELS
+    current_load_mw: np.ndarray
+    capacity_mw: np.ndarray
+    load_pct: np.ndarray
+
+    @classmethod
+    def from_mapping(cls, states: Mapping[str, Mapping[str, Any]]) -> "NodeStates":
+        rows = list(states.values())
+        return cls(
+            ids=list(states.keys()),
+            status=np.array([NODE_STATUS_CODES[r["status"]] for r in rows], dtype=np.uint8),
+            current_load_mw=np.array([r["current_load_mw"] for r in rows], dtype=np.float64),
+            capacity_mw=np.array([r["capacity_mw"] for r in rows], dtype=np.float64),
+            load_pct=np.array([r["load_pct"] for r in rows], dtype=np.float64),
+        )
+
+    def to_mapping(self) -> Dict[str, Dict[str, Any]]:
+        labels = [NODE_STATUS_LABELS[c] for c in self.status.tolist()]
+        return {
+            nid: {"status": st, "current_load_mw": load, "capacity_mw": cap, "load_pct": pct}
+            for nid, st, load, cap, pct in zip(
+                self.ids,
+                labels,
+                self.current_load_mw.tolist(),
+                self.capacity_mw.tolist(),
+                self.load_pct.tolist(),
+            )
+        }
+
+
+def _as_node_states(value: Any) -> NodeStates:
+    return value if isinstance(value, NodeStates) else NodeStates.from_mapping(value)
+
+
+# Wire shape stays ``{node_id: FinalNodeState}``.
+FinalNodeStates = Annotated[
+    NodeStates,
+    PlainValidator(_as_node_states),
+    PlainSerializer(lambda v: v.to_mapping(), return_type=Dict[str, Dict[str, Any]]),
+    WithJsonSchema({
+        "type": "object",
+        "additionalProperties": {
+            "type": "object",
+            "properties": {
+                "status": {"type": "string", "enum": list(NODE_STATUS_LABELS)},
+                "current_load_mw": {"type": "number"},
+                "capacity_mw": {"type": "number"},
+                "load_pct": {"type": "number"},
+            },
+            "required": ["status", "current_load_mw", "capacity_mw", "load_pct"],
+        },
+    }),
+]
+
+
 class CascadeResult(BaseModel):
     scenario: str
     forecast_hour: int
@@ -77,4 +157,4 @@ class CascadeResult(BaseModel):
     cascade_depth: int
     total_load_shed_mw: float
     failed_node_ids: List[str]
-    final_node_states: Dict[str, FinalNodeState]
+    final_node_states: FinalNodeStates
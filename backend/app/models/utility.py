@@ -4,7 +4,9 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from app.utils.enums import FastEnum
 
 
 # ── Enums ───────────────────────────────────────────────────────────
@@ -17,7 +19,7 @@ class RegionStatus(str, Enum):
     BLACKOUT = "blackout"
 
 
-class CrewStatus(str, Enum):
+class CrewStatus(FastEnum, str, Enum):
     STANDBY = "standby"
     DISPATCHED = "dispatched"
     EN_ROUTE = "en_route"
@@ -28,7 +30,7 @@ class CrewStatus(str, Enum):
     DEPLOYED = "deployed"
 
 
-class EventSeverity(str, Enum):
+class EventSeverity(FastEnum, str, Enum):
     INFO = "info"
     WARNING = "warning"
     CRITICAL = "critical"
@@ -39,6 +41,8 @@ class EventSeverity(str, Enum):
 
 
 class WeatherThreat(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     temp_f: float
     wind_mph: float
     condition: str
@@ -91,6 +95,8 @@ class CrewOptimizationResponse(BaseModel):
 
 
 class TimelineEvent(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     event_id: str
     timestamp_offset_minutes: int
     title: str
@@ -1,14 +1,30 @@
 """Pydantic models for weather forecast endpoints (Open-Meteo API)."""
 
 from datetime import datetime
-from typing import Dict, List
+from typing import Annotated, Any, Dict, List
 
-from pydantic import BaseModel, ConfigDict, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator, WithJsonSchema
 
 
 # ── Grid forecast ───────────────────────────────────────────────────
 
 
+def _as_grid(value: Any) -> np.ndarray:
+    return np.asarray(value, dtype=np.float64)
+
+
+# 2D [lat][lon] grid held as a dense float array; lists (e.g. from the disk
+# cache) are converted on the way in and it leaves as nested lists, so the
+# JSON shape is unchanged.
+Grid2D = Annotated[
+    np.ndarray,
+    PlainValidator(_as_grid),
+    PlainSerializer(lambda a: a.tolist(), return_type=List[List[float]]),
+    WithJsonSchema({"type": "array", "items": {"type": "array", "items": {"type": "number"}}}),
+]
+
+
 class GridBounds(BaseModel):
     lat_min: float
     lat_max: float
@@ -24,9 +40,9 @@ class GridTimestep(BaseModel):
     step: int
     hour: int
     timestamp: str
-    temperature_f: List[List[float]]
-    wind_mph: List[List[float]]
-    pressure_hpa: List[List[float]]
+    temperature_f: Grid2D
+    wind_mph: Grid2D
+    pressure_hpa: Grid2D
     grid_bounds: GridBounds
 
 
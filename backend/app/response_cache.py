@@ -0,0 +1,140 @@
+"""In-process TTL cache for read-heavy GET endpoints.
+
+A small pure-ASGI middleware that stores the rendered body of successful
+GET responses keyed on path + query string.  Per-route TTLs are declared
+in ``CACHE_RULES``; write endpoints listed in ``DROP_RULES`` clear the
+matching entries so clients never see a stale list after a create.  The
+store is bounded: expired entries are purged and the oldest evicted once it
+reaches ``CACHE_MAX_ENTRIES``.
+
+Headers are stored with the body, so the middleware must run inside
+``CORSMiddleware``; otherwise one origin's CORS headers are replayed to all.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Tuple
+
+# ── Route rules ─────────────────────────────────────────────────────
+
+# path → max age (seconds).  A trailing "/" matches any sub-path, so
+# "/api/consumer/recommendations/" covers every profile id.
+CACHE_RULES: Dict[str, float] = {
+    "/api/grid/status": 30,
+    "/api/grid/topology": 300,
+    "/api/grid/hotspots": 60,
+    "/api/grid/arcs": 60,
+    "/api/consumer/profiles": 300,
+    "/api/consumer/recommendations/": 60,
+    "/api/utility/overview": 60,
+    "/api/utility/overview/": 60,
+    "/api/utility/crews": 60,
+    "/api/utility/events": 60,
+    "/api/utility/outcomes": 60,
+}
+
+# Cached responses kept at most.  Keys include the raw query string and
+# some rules match any sub-path, so the key space is client-controlled.
+CACHE_MAX_ENTRIES = 512
+
+# write path prefix → cached path prefixes to drop.  Dispatch mutates crew
+# state (the crew list and anything under it), and an orchestrated run
+# writes new live alerts.
+DROP_RULES: Dict[str, Tuple[str, ...]] = {
+    "/api/consumer/profiles": ("/api/consumer/profiles",),
+    "/api/utility/crews/dispatch": ("/api/utility/crews",),
+    "/api/orchestrate": ("/api/utility/events",),
+}
+
+
+def _match_ttl(path: str) -> float:
+    """Return the TTL configured for ``path``, or 0 if it is not cached."""
+    for rule, max_age in CACHE_RULES.items():
+        if path == rule or (rule.endswith("/") and path.startswith(rule)):
+            return max_age
+    return 0.0
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware caching GET responses per ``CACHE_RULES``."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+        # key → (expires_at, status, headers, body)
+        self._store: Dict[str, Tuple[float, int, List[Tuple[bytes, bytes]], bytes]] = {}
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop every cached entry whose path starts with ``prefix``."""
+        for key in [k for k in self._store if k.startswith(prefix)]:
+            self._store.pop(key, None)
+
+    def _invalidate_for_write(self, path: str) -> None:
+        for write_prefix, targets in DROP_RULES.items():
+            if path.startswith(write_prefix):
+                for target in targets:
+                    self.invalidate(target)
+
+    def _put(self, key: str, entry: Tuple[float, int, List[Tuple[bytes, bytes]], bytes]) -> None:
+        """Store ``entry``, purging expired entries and evicting the oldest when full."""
+        self._store.pop(key, None)
+        if len(self._store) >= CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for stale in [k for k, v in self._store.items() if v[0] <= now]:
+                del self._store[stale]
+            if len(self._store) >= CACHE_MAX_ENTRIES:
+                self._store.pop(next(iter(self._store)))
+        self._store[key] = entry
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+
+        if method != "GET":
+            # Invalidate again once the write has finished, so a GET that
+            # re-cached the pre-write body while it ran is dropped too
+            self._invalidate_for_write(path)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self._invalidate_for_write(path)
+            return
+
+        ttl = _match_ttl(path)
+        if ttl <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        query = scope.get("query_string", b"").decode("latin-1")
+        key = f"{path}?{query}"
+        now = time.monotonic()
+
+        entry = self._store.get(key)
+        if entry is not None and entry[0] > now:
+            _, status, headers, body = entry
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        captured: Dict[str, Any] = {"status": 0, "headers": [], "body": []}
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                captured["status"] = message["status"]
+                captured["headers"] = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                captured["body"].append(message.get("body", b""))
+                if not message.get("more_body", False) and captured["status"] == 200:
+                    self._put(key, (
+                        time.monotonic() + ttl,
+                        captured["status"],
+                        captured["headers"],
+                        b"".join(captured["body"]),
+                    ))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,6 +1,8 @@
 """Consumer endpoints — optimization recommendations, savings, profiles."""
 
-from fastapi import APIRouter, Query
+from typing import Annotated
+
+from fastapi import APIRouter, Query, Response
 
 from app.models.consumer import (
     ConsumerProfile,
@@ -9,7 +11,7 @@ from app.models.consumer import (
     CreateCustomProfileRequest,
     SavingsSummary,
 )
-from app.schemas.responses import SuccessResponse
+from app.schemas.responses import SuccessResponse, success_response
 from app.services import consumer_service
 
 router = APIRouter(prefix="/api/consumer", tags=["consumer"])
@@ -21,14 +23,14 @@ router = APIRouter(prefix="/api/consumer", tags=["consumer"])
 )
 async def recommendations(
     profile_id: str,
-    region: str = Query(default="ERCOT", examples=["ERCOT"]),
-    scenario: str = Query(default="live", examples=["live", "uri", "normal"]),
-) -> SuccessResponse[ConsumerRecommendation]:
+    region: Annotated[str, Query(examples=["ERCOT"])] = "ERCOT",
+    scenario: Annotated[str, Query(examples=["live", "uri", "normal"])] = "live",
+) -> Response:
     """Optimized appliance schedule, battery/solar savings, readiness score."""
     data = await consumer_service.get_recommendations(
         profile_id=profile_id, region=region, scenario=scenario,
     )
-    return SuccessResponse(data=data)
+    return success_response(data)
 
 
 @router.get(
@@ -37,21 +39,21 @@ async def recommendations(
 )
 async def savings(
     profile_id: str,
-    region: str = Query(default="ERCOT", examples=["ERCOT"]),
-    scenario: str = Query(default="live", examples=["live", "uri", "normal"]),
-) -> SuccessResponse[SavingsSummary]:
+    region: Annotated[str, Query(examples=["ERCOT"])] = "ERCOT",
+    scenario: Annotated[str, Query(examples=["live", "uri", "normal"])] = "live",
+) -> Response:
     """Savings summary — total dollars/kWh saved, readiness, status."""
     data = await consumer_service.get_savings(
         profile_id=profile_id, region=region, scenario=scenario,
     )
-    return SuccessResponse(data=data)
+    return success_response(data)
 
 
 @router.get("/profiles", response_model=SuccessResponse[ConsumerProfilesResponse])
-async def profiles() -> SuccessResponse[ConsumerProfilesResponse]:
+async def profiles() -> Response:
     """List all pre-made and user-saved consumer profiles."""
     data = await consumer_service.get_profiles()
-    return SuccessResponse(data=data)
+    return success_response(data)
 
 
 @router.post(
@@ -61,7 +63,7 @@ async def profiles() -> SuccessResponse[ConsumerProfilesResponse]:
 )
 async def create_custom_profile(
     request: CreateCustomProfileRequest,
-) -> SuccessResponse[ConsumerProfile]:
+) -> Response:
     """Create a new custom consumer profile."""
     data = await consumer_service.create_custom_profile(request=request)
-    return SuccessResponse(data=data)
+    return success_response(data, status_code=201)
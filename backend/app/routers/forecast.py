@@ -1,70 +1,181 @@
 """Price forecast endpoints — wholesale + retail price predictions."""
 
-from typing import Optional
+import asyncio
+import time
+from typing import Annotated, Callable, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 
-from app.models.price import ModelInfoResponse, PriceForecastResponse, PricingMode
-from app.schemas.responses import SuccessResponse
+from app.models.price import (
+    CombinedPriceForecastResponse,
+    HourlyPrice,
+    ModelInfoResponse,
+    PriceForecastResponse,
+    PricingMode,
+)
+from app.schemas.responses import SuccessResponse, success_response
 from app.services.price_service import price_service
+from app.utils.clock import now_cached
 
 router = APIRouter(prefix="/api/forecast", tags=["forecast"])
 
+# ── Forecast cache ((region, mode, scenario, zone, hour) → (timestamp, prices)) ──
+# A forecast is a pure function of its key within the hour, and dashboards
+# poll the same handful of keys, so recent results are served from memory.
+
+ForecastKey = Tuple[str, str, str, Optional[str], int]
+
+_forecast_cache: Dict[ForecastKey, Tuple[float, List[HourlyPrice]]] = {}
+_forecast_locks: Dict[ForecastKey, asyncio.Lock] = {}
+_FORECAST_CACHE_TTL = 60  # seconds
+_FORECAST_CACHE_MAX = 256
+
+
+async def _cached_forecast(
+    key: ForecastKey, fn: Callable[[], List[HourlyPrice]]
+) -> List[HourlyPrice]:
+    """Return the cached forecast for ``key`` or compute it with ``fn``.
+
+    Concurrent misses on the same key wait on one lock so only the first
+    caller computes.  ``fn`` runs in a worker thread so independent
+    forecasts (e.g. region + zone) can overlap.
+    """
+    entry = _forecast_cache.get(key)
+    if entry is not None and time.time() - entry[0] < _FORECAST_CACHE_TTL:
+        return entry[1]
+
+    lock = _forecast_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        now = time.time()
+        entry = _forecast_cache.get(key)
+        if entry is not None and now - entry[0] < _FORECAST_CACHE_TTL:
+            return entry[1]
+        try:
+            prices = await asyncio.to_thread(fn)
+        except Exception:
+            # Nothing gets cached, so don't keep a lock for the key either
+            if key not in _forecast_cache:
+                _forecast_locks.pop(key, None)
+            raise
+        _forecast_cache.pop(key, None)
+        if len(_forecast_cache) >= _FORECAST_CACHE_MAX:
+            for k in [k for k, (ts, _) in _forecast_cache.items() if now - ts >= _FORECAST_CACHE_TTL]:
+                _forecast_cache.pop(k, None)
+                _forecast_locks.pop(k, None)
+            if len(_forecast_cache) >= _FORECAST_CACHE_MAX:
+                oldest = next(iter(_forecast_cache))
+                _forecast_cache.pop(oldest)
+                _forecast_locks.pop(oldest, None)
+        _forecast_cache[key] = (now, prices)
+        return prices
+
+
+def _forecast_key(region: str, mode: PricingMode, scenario: str, zone: Optional[str]) -> ForecastKey:
+    return (region, mode.value, scenario, zone, int(time.time() // 3600))
+
+
+# Model metadata only changes when the model object is (re)loaded.
+_model_info_cache: Tuple[int, ModelInfoResponse] | None = None
+
 
 @router.get("/prices/model-info", response_model=SuccessResponse[ModelInfoResponse])
-async def price_model_info() -> SuccessResponse[ModelInfoResponse]:
+async def price_model_info() -> Response:
     """XGBoost model status — training date, R² score, feature list."""
-    data = price_service.get_model_info()
-    return SuccessResponse(data=ModelInfoResponse(**data))
+    global _model_info_cache
+    key = id(price_service.model)
+    if _model_info_cache is None or _model_info_cache[0] != key:
+        data = price_service.get_model_info()
+        _model_info_cache = (key, ModelInfoResponse.model_construct(**data))
+    return success_response(_model_info_cache[1])
 
 
 @router.get("/prices/{region}", response_model=SuccessResponse[PriceForecastResponse])
 async def price_forecast_by_region(
     region: str,
-    mode: PricingMode = Query(default=PricingMode.HYBRID, examples=["hybrid"]),
-    scenario: str = Query(default="normal", examples=["uri_2021"]),
-    zone: Optional[str] = Query(default=None, description="ERCOT weather zone for zone-adjusted pricing"),
-) -> SuccessResponse[PriceForecastResponse]:
+    mode: Annotated[PricingMode, Query(examples=["hybrid"])] = PricingMode.HYBRID,
+    scenario: Annotated[str, Query(examples=["uri_2021"])] = "normal",
+    zone: Annotated[
+        Optional[str],
+        Query(description="ERCOT weather zone for zone-adjusted pricing"),
+    ] = None,
+) -> Response:
     """48-hour price forecast for a specific ISO region, optionally zone-adjusted."""
-    from datetime import datetime, timezone
-
+    key = _forecast_key(region.upper(), mode, scenario, zone)
     if zone:
-        prices = price_service.get_zone_price_forecast(
+        prices = await _cached_forecast(key, lambda: price_service.get_zone_price_forecast(
             region=region.upper(), zone=zone, mode=mode, scenario=scenario,
-        )
+        ))
     else:
-        prices = price_service.get_price_forecast(
+        prices = await _cached_forecast(key, lambda: price_service.get_price_forecast(
             region=region.upper(), mode=mode, scenario=scenario,
-        )
-    return SuccessResponse(data=PriceForecastResponse(
+        ))
+    return success_response(PriceForecastResponse.model_construct(
         region=region.upper(),
-        start_time=datetime.now(timezone.utc),
+        start_time=now_cached(),
         mode=mode if price_service.model is not None or mode == PricingMode.RULES else PricingMode.RULES,
         prices=prices,
     ))
 
 
+@router.get(
+    "/prices/{region}/combined",
+    response_model=SuccessResponse[CombinedPriceForecastResponse],
+)
+async def price_forecast_combined(
+    region: str,
+    zone: Annotated[str, Query(description="ERCOT weather zone for zone-adjusted pricing")],
+    mode: Annotated[PricingMode, Query(examples=["hybrid"])] = PricingMode.HYBRID,
+    scenario: Annotated[str, Query(examples=["uri_2021"])] = "normal",
+) -> Response:
+    """Regional and zone-adjusted 48-hour forecasts in one call, computed concurrently."""
+    region = region.upper()
+    region_prices, zone_prices = await asyncio.gather(
+        _cached_forecast(
+            _forecast_key(region, mode, scenario, None),
+            lambda: price_service.get_price_forecast(
+                region=region, mode=mode, scenario=scenario,
+            ),
+        ),
+        _cached_forecast(
+            _forecast_key(region, mode, scenario, zone),
+            lambda: price_service.get_zone_price_forecast(
+                region=region, zone=zone, mode=mode, scenario=scenario,
+            ),
+        ),
+    )
+    return success_response(CombinedPriceForecastResponse.model_construct(
+        region=region,
+        zone=zone,
+        start_time=now_cached(),
+        mode=mode if price_service.model is not None or mode == PricingMode.RULES else PricingMode.RULES,
+        region_prices=region_prices,
+        zone_prices=zone_prices,
+    ))
+
+
 @router.get("/prices", response_model=SuccessResponse[PriceForecastResponse])
 async def price_forecast(
-    region: str = Query(default="ERCOT", examples=["ERCOT"]),
-    mode: PricingMode = Query(default=PricingMode.HYBRID, examples=["hybrid"]),
-    scenario: str = Query(default="normal", examples=["uri_2021"]),
-    zone: Optional[str] = Query(default=None, description="ERCOT weather zone for zone-adjusted pricing"),
-) -> SuccessResponse[PriceForecastResponse]:
+    region: Annotated[str, Query(examples=["ERCOT"])] = "ERCOT",
+    mode: Annotated[PricingMode, Query(examples=["hybrid"])] = PricingMode.HYBRID,
+    scenario: Annotated[str, Query(examples=["uri_2021"])] = "normal",
+    zone: Annotated[
+        Optional[str],
+        Query(description="ERCOT weather zone for zone-adjusted pricing"),
+    ] = None,
+) -> Response:
     """48-hour wholesale + retail electricity price forecast by ISO region."""
-    from datetime import datetime, timezone
-
+    key = _forecast_key(region.upper(), mode, scenario, zone)
     if zone:
-        prices = price_service.get_zone_price_forecast(
+        prices = await _cached_forecast(key, lambda: price_service.get_zone_price_forecast(
             region=region.upper(), zone=zone, mode=mode, scenario=scenario,
-        )
+        ))
     else:
-        prices = price_service.get_price_forecast(
+        prices = await _cached_forecast(key, lambda: price_service.get_price_forecast(
             region=region.upper(), mode=mode, scenario=scenario,
-        )
-    return SuccessResponse(data=PriceForecastResponse(
+        ))
+    return success_response(PriceForecastResponse.model_construct(
         region=region.upper(),
-        start_time=datetime.now(timezone.utc),
+        start_time=now_cached(),
         mode=mode if price_service.model is not None or mode == PricingMode.RULES else PricingMode.RULES,
         prices=prices,
     ))
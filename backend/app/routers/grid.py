@@ -1,16 +1,25 @@
 """Grid endpoints — topology, status with demand, cascade probability, node detail."""
 
-from fastapi import APIRouter, HTTPException, Query
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from app.models.grid import (
     ArcsResponse,
     CascadeProbabilityResponse,
+    GridEdge,
+    GridStatusNode,
     GridStatusResponse,
+    GridStatusSummary,
     GridTopologyResponse,
     HotspotsResponse,
     NodeDetailResponse,
 )
-from app.schemas.responses import SuccessResponse
+from app.schemas.responses import (
+    SuccessResponse,
+    prerendered_success_response,
+    success_response,
+)
 from app.services import grid_service, hotspot_service
 
 router = APIRouter(prefix="/api/grid", tags=["grid"])
@@ -18,22 +27,29 @@ router = APIRouter(prefix="/api/grid", tags=["grid"])
 
 @router.get("/status", response_model=SuccessResponse[GridStatusResponse])
 async def grid_status(
-    scenario: str = Query(default="uri_2021", examples=["uri_2021"]),
-    forecast_hour: int = Query(default=36, ge=0, le=48, examples=[36]),
-) -> SuccessResponse[GridStatusResponse]:
+    scenario: Annotated[str, Query(examples=["uri_2021"])] = "uri_2021",
+    forecast_hour: Annotated[int, Query(ge=0, le=48, examples=[36])] = 36,
+) -> Response:
     """Grid state for all nodes with demand from a weather scenario applied."""
     data = await grid_service.get_grid_status(scenario=scenario, forecast_hour=forecast_hour)
-    return SuccessResponse(data=GridStatusResponse(**data))
+    # Service output is trusted; build without re-validating ~2k nodes / ~3k edges.
+    return success_response(GridStatusResponse.model_construct(
+        scenario=data["scenario"],
+        forecast_hour=data["forecast_hour"],
+        generated_at=data["generated_at"],
+        nodes=[GridStatusNode.model_construct(**n) for n in data["nodes"]],
+        edges=[GridEdge.model_construct(**e) for e in data["edges"]],
+        summary=GridStatusSummary.model_construct(**data["summary"]),
+    ))
 
 
 @router.get("/topology", response_model=SuccessResponse[GridTopologyResponse])
-async def grid_topology() -> SuccessResponse[GridTopologyResponse]:
+async def grid_topology() -> Response:
     """Raw grid graph — nodes with lat/lon/capacity, edges with connections.
 
     Used by the frontend globe to plot substation locations.
     """
-    data = grid_service.get_topology()
-    return SuccessResponse(data=GridTopologyResponse(**data))
+    return prerendered_success_response(grid_service.get_topology_json())
 
 
 @router.get(
@@ -41,38 +57,38 @@ async def grid_topology() -> SuccessResponse[GridTopologyResponse]:
     response_model=SuccessResponse[CascadeProbabilityResponse],
 )
 async def cascade_probability(
-    scenario: str = Query(default="uri_2021", examples=["uri_2021"]),
-    forecast_hour: int = Query(default=36, ge=0, le=48, examples=[36]),
-) -> SuccessResponse[CascadeProbabilityResponse]:
+    scenario: Annotated[str, Query(examples=["uri_2021"])] = "uri_2021",
+    forecast_hour: Annotated[int, Query(ge=0, le=48, examples=[36])] = 36,
+) -> Response:
     """Cascade probability per ISO region (fraction of nodes above 80 % load)."""
     data = await grid_service.get_cascade_probability(
         scenario=scenario, forecast_hour=forecast_hour
     )
-    return SuccessResponse(data=CascadeProbabilityResponse(**data))
+    return success_response(CascadeProbabilityResponse.model_construct(**data))
 
 
 @router.get("/nodes/{node_id}", response_model=SuccessResponse[NodeDetailResponse])
-async def node_detail(node_id: str) -> SuccessResponse[NodeDetailResponse]:
+async def node_detail(node_id: str) -> Response:
     """Detailed info for a single grid node."""
     data = grid_service.get_node_detail(node_id)
     if data is None:
         raise HTTPException(status_code=404, detail=f"Node not found: {node_id}")
-    return SuccessResponse(data=NodeDetailResponse(**data))
+    return success_response(NodeDetailResponse.model_construct(**data))
 
 
 @router.get("/hotspots", response_model=SuccessResponse[HotspotsResponse])
 async def hotspots(
-    scenario: str = Query(default="uri", examples=["uri", "normal"]),
-) -> SuccessResponse[HotspotsResponse]:
+    scenario: Annotated[str, Query(examples=["uri", "normal"])] = "uri",
+) -> Response:
     """City-level severity markers for the operator globe."""
     data = hotspot_service.get_hotspots(scenario=scenario)
-    return SuccessResponse(data=data)
+    return success_response(data)
 
 
 @router.get("/arcs", response_model=SuccessResponse[ArcsResponse])
 async def arcs(
-    scenario: str = Query(default="uri", examples=["uri", "normal"]),
-) -> SuccessResponse[ArcsResponse]:
+    scenario: Annotated[str, Query(examples=["uri", "normal"])] = "uri",
+) -> Response:
     """Transmission lines between hotspot cities."""
     data = hotspot_service.get_arcs(scenario=scenario)
-    return SuccessResponse(data=data)
+    return success_response(data)
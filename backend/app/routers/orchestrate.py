@@ -1,8 +1,11 @@
 """Orchestrate endpoint — kicks off the full simulation pipeline."""
 
-from fastapi import APIRouter, Query
+import asyncio
+from typing import Annotated
 
-from app.schemas.responses import SuccessResponse
+from fastapi import APIRouter, Query, Response
+
+from app.schemas.responses import SuccessResponse, success_response
 from app.services.orchestrator_service import run_orchestrated_simulation
 
 router = APIRouter(prefix="/api/orchestrate", tags=["orchestrate"])
@@ -10,18 +13,23 @@ router = APIRouter(prefix="/api/orchestrate", tags=["orchestrate"])
 
 @router.post("/run", response_model=SuccessResponse[dict])
 async def run_simulation(
-    scenario: str = Query("uri", description="Scenario: uri or normal"),
-    forecast_hour: int = Query(36, ge=0, le=47, description="Forecast hour offset"),
-    grid_region: str = Query("ERCOT", description="Grid region"),
-) -> SuccessResponse[dict]:
+    scenario: Annotated[str, Query(description="Scenario: uri or normal")] = "uri",
+    forecast_hour: Annotated[int, Query(ge=0, le=47, description="Forecast hour offset")] = 36,
+    grid_region: Annotated[str, Query(description="Grid region")] = "ERCOT",
+) -> Response:
     """Run the full orchestrated simulation pipeline.
 
     Chains demand → cascade → price → alerts → crew dispatch, writing
     progress to Supabase for real-time frontend updates.
     """
-    result = run_orchestrated_simulation(
+    # The pipeline is blocking (Supabase, cascade), so it runs on a worker
+    # thread; its async steps (Claude, ntfy, crew dispatch) are handed back
+    # to this loop.
+    result = await asyncio.to_thread(
+        run_orchestrated_simulation,
         scenario=scenario,
         forecast_hour=forecast_hour,
         grid_region=grid_region,
+        loop=asyncio.get_running_loop(),
     )
-    return SuccessResponse(data=result)
+    return success_response(result)
@@ -1,18 +1,60 @@
 """Cascade simulation endpoint — weather → demand → cascade pipeline."""
 
-from fastapi import APIRouter
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict
 
-from app.models.simulate import CascadeRequest, CascadeResult
-from app.schemas.responses import SuccessResponse
+import orjson
+from fastapi import APIRouter, Response
+from fastapi.responses import StreamingResponse
+
+from app.models.simulate import (
+    CascadeRequest,
+    CascadeResult,
+    CascadeStep,
+    FailedNodeInfo,
+    RerouteArc,
+)
+from app.schemas.responses import SuccessResponse, success_response
 from app.services import simulate_service
 
 router = APIRouter(prefix="/api/simulate", tags=["simulate"])
 
 
+def _build_result(data: Dict[str, Any]) -> CascadeResult:
+    """Wrap the cascade engine's result dict without re-validating it.
+
+    The engine builds every field itself, and per-step failure/reroute lists
+    run to thousands of rows, so validation is skipped.
+    """
+    steps = [
+        CascadeStep.model_construct(
+            step=s["step"],
+            new_failures=[FailedNodeInfo.model_construct(**f) for f in s["new_failures"]],
+            reroutes=[RerouteArc.model_construct(**r) for r in s["reroutes"]],
+            total_failed=s["total_failed"],
+            total_load_shed_mw=s["total_load_shed_mw"],
+        )
+        for s in data["steps"]
+    ]
+    return CascadeResult.model_construct(
+        scenario=data["scenario"],
+        forecast_hour=data["forecast_hour"],
+        started_at=datetime.fromisoformat(data["started_at"]),
+        completed_at=datetime.fromisoformat(data["completed_at"]),
+        steps=steps,
+        total_failed_nodes=data["total_failed_nodes"],
+        total_nodes=data["total_nodes"],
+        cascade_depth=data["cascade_depth"],
+        total_load_shed_mw=data["total_load_shed_mw"],
+        failed_node_ids=data["failed_node_ids"],
+        final_node_states=data["final_node_states"],
+    )
+
+
 @router.post("/cascade", response_model=SuccessResponse[CascadeResult])
 async def cascade_simulation(
     body: CascadeRequest,
-) -> SuccessResponse[CascadeResult]:
+) -> Response:
     """Run a full cascade simulation.
 
     Fetches weather forecast for the given start_time, computes demand
@@ -25,4 +67,38 @@ async def cascade_simulation(
         region=body.region,
         scenario=body.scenario,
     )
-    return SuccessResponse(data=CascadeResult(**data))
+    return success_response(_build_result(data))
+
+
+async def _sse_cascade(items: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    async for item in items:
+        if "step" in item:
+            yield b"event: step\ndata: " + orjson.dumps(item) + b"\n\n"
+        else:
+            item["final_node_states"] = item["final_node_states"].to_mapping()
+            yield b"event: summary\ndata: " + orjson.dumps(item) + b"\n\n"
+
+
+@router.post("/cascade/stream")
+async def cascade_simulation_stream(
+    body: CascadeRequest,
+) -> StreamingResponse:
+    """SSE variant of ``/cascade``: one ``step`` event per cascade step as it
+    is built, then a ``summary`` event with the remaining result fields.
+    """
+    return StreamingResponse(
+        _sse_cascade(
+            simulate_service.stream_cascade_simulation(
+                start_time_str=body.start_time,
+                forecast_hour=body.forecast_hour,
+                region=body.region,
+                scenario=body.scenario,
+            )
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
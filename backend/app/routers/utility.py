@@ -1,6 +1,12 @@
 """Utility operator endpoints — overview, crews, events, outcomes, dispatch."""
 
-from fastapi import APIRouter, HTTPException, Query
+import asyncio
+from functools import lru_cache
+from typing import Annotated, AsyncIterator, Tuple
+
+import numpy as np
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 
 from app.models.utility import (
@@ -14,38 +20,41 @@ from app.models.utility import (
     RegionOverview,
     TimelineEvent,
 )
-from app.schemas.responses import SuccessResponse
+from app.schemas.responses import SuccessResponse, success_response
 from app.services import (
+    cascade_service,
+    demand_service,
     events_service,
+    grid_graph_service,
     outcome_service,
-    overview_service,
     utility_service,
     crew_dispatch_service,
 )
-from app.services.claude_service import generate_weather_events
+from app.services import _overview_cache
+from app.services.claude_service import generate_weather_events, stream_weather_events
 
 router = APIRouter(prefix="/api/utility", tags=["utility"])
 
 
 @router.get("/overview", response_model=SuccessResponse[NationalOverview])
 async def overview(
-    scenario: str = Query(default="uri", examples=["uri", "normal"]),
-) -> SuccessResponse[NationalOverview]:
+    scenario: Annotated[str, Query(examples=["uri", "normal"])] = "uri",
+) -> Response:
     """National grid overview with per-region status."""
-    data = overview_service.get_overview(scenario=scenario)
-    return SuccessResponse(data=data)
+    data = _overview_cache.get_overview(scenario=scenario)
+    return success_response(data)
 
 
 @router.get("/overview/{region}", response_model=SuccessResponse[RegionOverview])
 async def region_detail(
     region: str,
-    scenario: str = Query(default="uri", examples=["uri", "normal"]),
-) -> SuccessResponse[RegionOverview]:
+    scenario: Annotated[str, Query(examples=["uri", "normal"])] = "uri",
+) -> Response:
     """Single region detail."""
-    data = overview_service.get_region(region_id=region, scenario=scenario)
+    data = _overview_cache.get_region(region_id=region, scenario=scenario)
     if data is None:
         raise HTTPException(status_code=404, detail=f"Region not found: {region}")
-    return SuccessResponse(data=data)
+    return success_response(data)
 
 
 _ZONE_CITIES = {
@@ -60,185 +69,267 @@ _ZONE_CITIES = {
 }
 
 
-@router.get("/weather-events")
+@lru_cache(maxsize=8)
+def _zone_cities(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """City label per region slot, aligned with ``OverviewSoA.names``.
+
+    The overview always lists the same zones in the same order, so this is
+    resolved once and ``weather_events`` indexes by position.
+    """
+    return tuple(_ZONE_CITIES.get(name, name) for name in names)
+
+
+# Severity ladder (same as the frontend): temps at or past the severe
+# bounds score 4, past the warm/cold bounds 3.
+_SEVERE_COLD_F = 10.0
+_SEVERE_HOT_F = 105.0
+_COLD_F = 20.0
+_HOT_F = 95.0
+
+
+def _zone_severities(temps: np.ndarray, extreme: np.ndarray, statuses: np.ndarray) -> np.ndarray:
+    """Classify each zone 1–4 from its temperature, weather flag and grid status."""
+    return np.select(
+        [
+            np.isin(statuses, ("blackout", "critical")),
+            (temps <= _SEVERE_COLD_F) | (temps >= _SEVERE_HOT_F),
+            (temps <= _COLD_F) | (temps >= _HOT_F),
+            extreme,
+            statuses == "stressed",
+        ],
+        [4, 4, 3, 3, 2],
+        default=1,
+    )
+
+
+def _event_zones(scenario: str) -> list[dict]:
+    """Zones that would appear as weather events (extreme weather or non-normal grid)."""
+    soa = _overview_cache.get_overview_soa(scenario=scenario)
+
+    idx = np.flatnonzero(soa.is_extreme | (soa.status != "normal"))
+    temps = soa.temp_f[idx]
+    extreme = soa.is_extreme[idx]
+    statuses = soa.status[idx]
+    severities = _zone_severities(temps, extreme, statuses)
+    cities = _zone_cities(soa.names)
+
+    return [
+        {
+            "zone": soa.region_ids[i],
+            "city": cities[i],
+            "temp_f": temp_f,
+            "wind_mph": wind_mph,
+            "condition": soa.conditions[i],
+            "is_extreme": is_extreme,
+            "grid_status": status,
+            "severity": sev,
+        }
+        for i, temp_f, wind_mph, is_extreme, status, sev in zip(
+            idx.tolist(),
+            temps.tolist(),
+            soa.wind_mph[idx].tolist(),
+            extreme.tolist(),
+            statuses.tolist(),
+            severities.tolist(),
+        )
+    ]
+
+
+@router.get("/weather-events", response_model=SuccessResponse[list[dict]])
 async def weather_events(
-    scenario: str = Query(default="uri", examples=["uri", "normal", "live"]),
-) -> SuccessResponse[list[dict]]:
+    scenario: Annotated[str, Query(examples=["uri", "normal", "live"])] = "uri",
+) -> Response:
     """LLM-generated weather event descriptions from real Open-Meteo data."""
-    ov = overview_service.get_overview(scenario=scenario)
-
-    zones = []
-    for r in ov.regions:
-        w = r.weather
-        # Compute severity same as frontend
-        if r.status.value in ("blackout", "critical"):
-            sev = 4
-        elif w.temp_f <= 10 or w.temp_f >= 105:
-            sev = 4
-        elif w.temp_f <= 20 or w.temp_f >= 95:
-            sev = 3
-        elif w.is_extreme:
-            sev = 3
-        elif r.status.value == "stressed":
-            sev = 2
-        else:
-            sev = 1
-
-        zones.append({
-            "zone": r.region_id,
-            "city": _ZONE_CITIES.get(r.name, r.name),
-            "temp_f": w.temp_f,
-            "wind_mph": w.wind_mph,
-            "condition": w.condition,
-            "is_extreme": w.is_extreme,
-            "grid_status": r.status.value,
-            "severity": sev,
-        })
+    events = await generate_weather_events(_event_zones(scenario), scenario=scenario)
+    return success_response(events)
 
-    # Only send zones that would appear as events (extreme weather or non-normal grid)
-    event_zones = [z for z in zones if z["is_extreme"] or z["grid_status"] != "normal"]
 
-    events = generate_weather_events(event_zones, scenario=scenario)
-    return SuccessResponse(data=events)
+async def _sse_wrap(events: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    async for event in events:
+        yield b"data: " + orjson.dumps(event) + b"\n\n"
+    yield b'data: {"done": true}\n\n'
+
+
+@router.get("/weather-events/stream")
+async def weather_events_stream(
+    scenario: Annotated[str, Query(examples=["uri", "normal", "live"])] = "uri",
+) -> StreamingResponse:
+    """SSE stream of weather events, one message per zone as Claude writes it."""
+    return StreamingResponse(
+        _sse_wrap(stream_weather_events(_event_zones(scenario), scenario=scenario)),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 @router.get("/crews", response_model=SuccessResponse[CrewOptimizationResponse])
 async def crews(
-    scenario: str = Query(default="uri", examples=["uri", "normal"]),
-) -> SuccessResponse[CrewOptimizationResponse]:
+    scenario: Annotated[str, Query(examples=["uri", "normal"])] = "uri",
+) -> Response:
     """Optimized crew assignments."""
     data = utility_service.get_crews(scenario=scenario)
-    return SuccessResponse(data=data)
+    return success_response(data)
 
 
 @router.get("/events", response_model=SuccessResponse[list[TimelineEvent]])
 async def events(
-    scenario: str = Query(default="uri", examples=["uri", "normal"]),
-) -> SuccessResponse[list[TimelineEvent]]:
+    scenario: Annotated[str, Query(examples=["uri", "normal"])] = "uri",
+) -> Response:
     """Pre-generated timeline events."""
     data = events_service.get_events(scenario=scenario)
-    return SuccessResponse(data=data)
+    return success_response(data)
 
 
 @router.get("/events/stream")
 async def events_stream(
-    scenario: str = Query(default="uri", examples=["uri", "normal"]),
+    request: Request,
+    scenario: Annotated[str, Query(examples=["uri", "normal"])] = "uri",
 ) -> StreamingResponse:
-    """SSE live event stream (2-3s intervals)."""
+    """SSE live event stream (2-3s intervals).  Stops when the client disconnects."""
     return StreamingResponse(
-        events_service.stream_events(scenario=scenario),
+        events_service.stream_events(scenario=scenario, is_disconnected=request.is_disconnected),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
         },
     )
 
 
 @router.get("/outcomes", response_model=SuccessResponse[OutcomeComparison])
 async def outcomes(
-    scenario: str = Query(default="uri", examples=["uri", "normal"]),
-) -> SuccessResponse[OutcomeComparison]:
+    scenario: Annotated[str, Query(examples=["uri", "normal"])] = "uri",
+) -> Response:
     """Without/With Blackout comparison."""
     data = outcome_service.get_outcomes(scenario=scenario)
-    return SuccessResponse(data=data)
+    return success_response(data)
 
 
 # ── Crew Dispatch ─────────────────────────────────────────────────────
 
 
-@router.post("/crews/dispatch/init", response_model=SuccessResponse[dict])
-async def dispatch_init(
-    scenario: str = Query(default="uri", examples=["uri", "normal"]),
-) -> SuccessResponse[dict]:
-    """Initialize the dispatch system: load crews, run cascade, classify failed nodes.
+async def _dispatch_init_job(scenario: str) -> dict:
+    """Fetch crews, demand and the cascade off the loop, then rebuild dispatch state.
 
-    Must be called before recommend or dispatch.  Re-calling resets state.
+    Only the inputs are computed on worker threads.  Dispatch state is reset
+    and reloaded here on the event loop, so status polls never see it half
+    rebuilt, and a failure anywhere earlier leaves the previous state intact.
     """
-    from app.services import grid_graph_service, cascade_service, demand_service
+    crew_data, multipliers = await asyncio.gather(
+        asyncio.to_thread(utility_service.get_crews, scenario=scenario),
+        asyncio.to_thread(
+            demand_service.compute_demand_multipliers,
+            scenario=("uri" if scenario == "uri" else "normal"),
+            forecast_hour=36,
+        ),
+    )
+    grid = grid_graph_service.grid_graph
+    cascade_result = await asyncio.to_thread(
+        cascade_service.run_cascade, grid.graph, multipliers, scenario_label=scenario
+    )
+    return _rebuild_dispatch_state(scenario, crew_data, cascade_result)
 
-    # Reset dispatch state
-    crew_dispatch_service.reset(storm=(scenario == "uri"))
 
-    # Load crews
-    crew_data = utility_service.get_crews(scenario=scenario)
+def _rebuild_dispatch_state(
+    scenario: str,
+    crew_data: CrewOptimizationResponse,
+    cascade_result: dict,
+) -> dict:
+    """Reset dispatch state, load crews and classify failed nodes."""
+    grid = grid_graph_service.grid_graph
+    crew_dispatch_service.reset(storm=(scenario == "uri"))
     crew_dispatch_service.load_crews(crew_data.crews)
+    failed = crew_dispatch_service.load_failed_nodes(cascade_result, grid.node_attrs, grid.node_index)
 
-    # Run cascade to get failed nodes
-    graph = grid_graph_service.grid_graph.graph
-    multipliers = demand_service.compute_demand_multipliers(
-        scenario=("uri" if scenario == "uri" else "normal"), forecast_hour=36
-    )
-    cascade_result = cascade_service.run_cascade(graph, multipliers, scenario_label=scenario)
-
-    # Get node attributes for classification
-    graph_nodes = {}
-    for nid in graph.nodes:
-        nd = graph.nodes[nid]
-        graph_nodes[nid] = {
-            "voltage_kv": nd.get("voltage_kv", nd.get("base_kv", 0.0)),
-            "capacity_mw": nd.get("capacity_mw", 0),
-            "base_load_mw": nd.get("base_load_mw", 0),
-            "weather_zone": nd.get("weather_zone", ""),
-        }
-
-    failed = crew_dispatch_service.load_failed_nodes(cascade_result, graph_nodes)
-
-    return SuccessResponse(data={
-        "status": "initialized",
+    return {
         "crews_loaded": len(crew_data.crews),
         "failed_nodes": len(failed),
         "cascade_depth": cascade_result["cascade_depth"],
         "total_load_shed_mw": cascade_result["total_load_shed_mw"],
-    })
+    }
+
+
+@router.post("/crews/dispatch/init", response_model=SuccessResponse[dict], status_code=202)
+async def dispatch_init(
+    scenario: Annotated[str, Query(examples=["uri", "normal"])] = "uri",
+) -> Response:
+    """Start initializing the dispatch system in the background.
+
+    Loads crews, runs the cascade and classifies failed nodes off the event
+    loop.  Returns ``{"status": "initializing", "job_id": ...}`` at once;
+    poll GET /crews/dispatch/init/status for the result.  Recommend and
+    dispatch calls wait for an in-flight init.  Re-calling after it
+    finishes resets state; re-calling while it runs returns the same job for
+    the same scenario and 409 for a different one.
+    """
+    try:
+        job = await crew_dispatch_service.start_init(scenario, lambda: _dispatch_init_job(scenario))
+    except crew_dispatch_service.InitInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return success_response(job, status_code=202)
+
+
+@router.get("/crews/dispatch/init/status", response_model=SuccessResponse[dict])
+async def dispatch_init_status() -> Response:
+    """State of the latest dispatch init: idle, initializing, initialized or failed."""
+    return success_response(crew_dispatch_service.get_init_status())
 
 
 @router.get("/crews/dispatch/recommend", response_model=SuccessResponse[DispatchRecommendation])
-async def dispatch_recommend() -> SuccessResponse[DispatchRecommendation]:
+async def dispatch_recommend() -> Response:
     """Get recommended crew assignments based on the dispatch algorithm.
 
     Returns assignments sorted by priority (highest severity first).
     Does not actually dispatch — call POST /crews/dispatch to confirm.
     """
+    await crew_dispatch_service.wait_for_init()
     rec = crew_dispatch_service.recommend_dispatch()
-    return SuccessResponse(data=rec)
+    return success_response(rec)
 
 
 @router.post("/crews/dispatch", response_model=SuccessResponse[DispatchAssignment])
-async def dispatch_single(body: DispatchRequest) -> SuccessResponse[DispatchAssignment]:
+async def dispatch_single(body: DispatchRequest) -> Response:
     """Dispatch a single crew to a specific failed node."""
+    await crew_dispatch_service.wait_for_init()
     try:
         assignment = crew_dispatch_service.dispatch_crew(body.crew_id, body.target_node_id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    return SuccessResponse(data=assignment)
+    return success_response(assignment)
 
 
 @router.post("/crews/dispatch/all", response_model=SuccessResponse[list[DispatchAssignment]])
-async def dispatch_all() -> SuccessResponse[list[DispatchAssignment]]:
+async def dispatch_all() -> Response:
     """Accept all recommended assignments at once.
 
-    Runs recommend_dispatch() then dispatches every recommended crew.
+    Runs the recommendation algorithm and dispatches each crew as it is
+    matched.
     """
-    rec = crew_dispatch_service.recommend_dispatch()
-    confirmed = crew_dispatch_service.dispatch_all(rec)
-    return SuccessResponse(data=confirmed)
+    await crew_dispatch_service.wait_for_init()
+    confirmed = crew_dispatch_service.recommend_and_dispatch_all()
+    return success_response(confirmed)
 
 
 @router.get("/crews/dispatch/status", response_model=SuccessResponse[DispatchStatusResponse])
-async def dispatch_status() -> SuccessResponse[DispatchStatusResponse]:
+async def dispatch_status() -> Response:
     """Get current dispatch status (assignments, crew positions, repaired nodes)."""
     data = crew_dispatch_service.get_status()
-    return SuccessResponse(data=data)
+    return success_response(data)
 
 
 @router.post("/crews/dispatch/tick", response_model=SuccessResponse[DispatchStatusResponse])
-async def dispatch_tick() -> SuccessResponse[DispatchStatusResponse]:
+async def dispatch_tick() -> Response:
     """Advance the dispatch state machine.
 
     Call periodically (e.g., every 5-10 seconds) to progress crews
     through DISPATCHED → EN_ROUTE → ON_SITE → REPAIRING → COMPLETE.
     Returns updated status.
     """
+    await crew_dispatch_service.wait_for_init()
     data = crew_dispatch_service.tick()
-    return SuccessResponse(data=data)
+    return success_response(data)
@@ -1,15 +1,20 @@
-from datetime import datetime, timezone
-from typing import Generic, List, TypeVar
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
 
+import orjson
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
+from app.utils.clock import now_cached
+
 T = TypeVar("T")
 
 
 class Meta(BaseModel):
     """Metadata included in every API response."""
 
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Display-only, so the coarse 1 s clock is precise enough
+    timestamp: datetime = Field(default_factory=now_cached)
     version: str = "0.1.0"
 
 
@@ -36,3 +41,59 @@ class PaginatedResponse(BaseModel, Generic[T]):
     page: int
     page_size: int
     meta: Meta = Field(default_factory=Meta)
+
+
+# ── Pre-serialized envelopes ────────────────────────────────────────
+
+
+# (clock reading, rendered meta) — re-rendered once per clock tick
+_meta_cache: Optional[Tuple[datetime, bytes]] = None
+
+
+def _meta_json() -> bytes:
+    global _meta_cache
+    now = now_cached()
+    if _meta_cache is None or _meta_cache[0] != now:
+        _meta_cache = (now, Meta(timestamp=now).model_dump_json().encode())
+    return _meta_cache[1]
+
+
+def success_response(data: Any, status_code: int = 200) -> Response:
+    """Render a ``SuccessResponse`` envelope straight to JSON bytes.
+
+    ``data`` is already a model (or plain JSON-able value) built by the
+    service, so there is nothing left to validate.  Returning a ``Response``
+    makes FastAPI skip re-validating it against the route's
+    ``response_model``, which is kept on the decorator for the OpenAPI docs.
+    """
+    envelope = SuccessResponse.model_construct(data=data, meta=Meta.model_construct(timestamp=now_cached()))
+    return Response(
+        content=envelope.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def prerendered_success_response(data_json: bytes, status_code: int = 200) -> Response:
+    """Wrap already-serialized ``data`` JSON in the success envelope.
+
+    For payloads that never change between requests: the ``data`` bytes are
+    rendered once and only the small ``meta`` block is serialized per call.
+    """
+    body = b'{"data":' + data_json + b',"meta":' + _meta_json() + b"}"
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def error_head(detail: str, error_code: str) -> bytes:
+    """Serialized ``ErrorResponse`` fields minus ``meta`` (object left open).
+
+    Constant errors can build this once at import and pass it to
+    ``error_response`` on every call.
+    """
+    return orjson.dumps({"detail": detail, "error_code": error_code})[:-1]
+
+
+def error_response(head: bytes, status_code: int) -> Response:
+    """Close an ``error_head`` with a fresh ``meta`` block and wrap it."""
+    body = head + b',"meta":' + _meta_json() + b"}"
+    return Response(content=body, status_code=status_code, media_type="application/json")
@@ -0,0 +1,58 @@
+"""Short-lived memo of ``overview_service.get_overview`` per scenario.
+
+The overview, region detail and weather-events handlers all start from the
+same ``NationalOverview``; sharing one build per TTL window keeps the region
+aggregation and weather lookups off every request.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Optional, Tuple
+
+from app.models.utility import NationalOverview, RegionOverview
+from app.services import overview_service
+from app.services.overview_service import OverviewSoA
+
+_OVERVIEW_CACHE_TTL = 30  # seconds
+_OVERVIEW_CACHE_MAX = 8  # scenario domain is tiny
+
+_overview_cache: Dict[str, Tuple[float, NationalOverview]] = {}
+# scenario → (overview it was built from, column view)
+_soa_cache: Dict[str, Tuple[NationalOverview, OverviewSoA]] = {}
+
+
+def get_overview(scenario: str = "uri") -> NationalOverview:
+    """Cached ``overview_service.get_overview``."""
+    now = time.monotonic()
+    hit = _overview_cache.get(scenario)
+    if hit is not None and now - hit[0] < _OVERVIEW_CACHE_TTL:
+        return hit[1]
+
+    data = overview_service.get_overview(scenario=scenario)
+    if scenario not in _overview_cache and len(_overview_cache) >= _OVERVIEW_CACHE_MAX:
+        stale = next(iter(_overview_cache))
+        _overview_cache.pop(stale)
+        _soa_cache.pop(stale, None)
+    _overview_cache[scenario] = (now, data)
+    return data
+
+
+def get_region(region_id: str, scenario: str = "uri") -> Optional[RegionOverview]:
+    """Single region from the cached overview, or None if not found."""
+    for r in get_overview(scenario).regions:
+        if r.region_id == region_id:
+            return r
+    return None
+
+
+def get_overview_soa(scenario: str = "uri") -> OverviewSoA:
+    """Column view of the cached overview, rebuilt only when the overview is."""
+    overview = get_overview(scenario)
+    hit = _soa_cache.get(scenario)
+    if hit is not None and hit[0] is overview:
+        return hit[1]
+
+    soa = overview_service.overview_soa(overview)
+    _soa_cache[scenario] = (overview, soa)
+    return soa
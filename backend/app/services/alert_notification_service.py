@@ -6,11 +6,14 @@ with accept/decline action buttons.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import time
+import weakref
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
-import requests
 
 from app.config import settings
 
@@ -19,34 +22,206 @@ logger = logging.getLogger("blackout.alert_notifications")
 # ntfy.sh public server (can be configured to use self-hosted)
 NTFY_SERVER = "https://ntfy.sh"
 
+# Max ntfy posts in flight during a broadcast
+BROADCAST_CONCURRENCY = 20
+
+# profile_id → (expires_at, ntfy_topic).  Topics are set once at signup and
+# almost never change, so lookups are cached instead of hitting Supabase on
+# every notification.
+NTFY_TOPIC_TTL = 600  # seconds
+NTFY_TOPIC_CACHE_MAX = 10_000
+# Profile ids per ``id=in.(...)`` lookup, keeping the query string well
+# under common URL length limits
+NTFY_TOPIC_BATCH = 150
+_ntfy_topic_cache: Dict[str, Tuple[float, str]] = {}
+
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=32)
+
+# With h2 installed (httpx[http2]) ntfy posts multiplex as HTTP/2 streams over
+# a few connections instead of opening one connection per in-flight post
+try:
+    import h2  # noqa: F401
+
+    NTFY_HTTP2 = True
+except ImportError:
+    NTFY_HTTP2 = False
+NTFY_H2_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+
+# Pooled clients (ntfy, Supabase) keyed by base URL, one pool per event loop.
+# The server loop and the orchestrator's own ``asyncio.run`` loops (on worker
+# threads) each keep their own pool; a pool goes away with its loop.
+_client_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# ── Notification formatting (matches simulation) ─────────────────────
+
+# Alert severity → ntfy priority
+_PRIORITY_MAP: Dict[str, int] = {
+    "critical": 5,
+    "warning": 4,
+    "optimization": 3,
+    "info": 2,
+}
+
+# Alert type → ntfy tags
+_TAG_MAP: Dict[str, List[str]] = {
+    "weather_hvac": ["thermometer", "fire"],
+    "weather_battery": ["battery", "zap"],
+    "weather_ev": ["car", "zap"],
+}
+_DEFAULT_TAGS = ["warning"]
+
+_DEVICE_NAME_MAP: Dict[str, str] = {
+    "hvac": "thermostat",
+    "battery": "battery",
+    "ev_charger": "EV charger",
+}
+_ADJUSTED_TAGS_HVAC = ["white_check_mark", "thermometer"]
+_ADJUSTED_TAGS = ["white_check_mark", "zap"]
+
+
+@lru_cache(maxsize=64)
+def _preview_kind(alert_type: str) -> Optional[str]:
+    """Which device preview line an alert type gets: "setpoint", "action" or None."""
+    if "hvac" in alert_type:
+        return "setpoint"
+    if "ev" in alert_type or "battery" in alert_type:
+        return "action"
+    return None
+
 
 # ── Helper Functions ─────────────────────────────────────────────────
 
 
-def _get_consumer_ntfy_topic(profile_id: str) -> Optional[str]:
-    """Fetch consumer's ntfy topic from Supabase."""
+def _client(
+    base_url: str,
+    timeout: float,
+    http2: bool = False,
+    limits: httpx.Limits = HTTP_LIMITS,
+) -> httpx.AsyncClient:
+    """Shared client for ``base_url`` on the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _client_pools.get(loop)
+    if pool is None:
+        pool = _client_pools[loop] = {}
+    client = pool.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(base_url=base_url, timeout=timeout, http2=http2, limits=limits)
+        pool[base_url] = client
+    return client
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Shared ntfy client."""
+    if NTFY_HTTP2:
+        return _client(NTFY_SERVER, timeout=10.0, http2=True, limits=NTFY_H2_LIMITS)
+    return _client(NTFY_SERVER, timeout=10.0)
+
+
+async def close_client() -> None:
+    """Close the running loop's pooled clients, if it has any."""
+    pool = _client_pools.pop(asyncio.get_running_loop(), None)
+    if pool is None:
+        return
+    for client in pool.values():
+        await client.aclose()
+
+
+def invalidate_ntfy_topic(profile_id: str) -> None:
+    """Forget the cached ntfy topic for a profile after it is edited."""
+    _ntfy_topic_cache.pop(profile_id, None)
+
+
+def _cache_ntfy_topic(profile_id: str, topic: str) -> None:
+    if profile_id not in _ntfy_topic_cache and len(_ntfy_topic_cache) >= NTFY_TOPIC_CACHE_MAX:
+        _ntfy_topic_cache.pop(next(iter(_ntfy_topic_cache)))
+    _ntfy_topic_cache[profile_id] = (time.monotonic() + NTFY_TOPIC_TTL, topic)
+
+
+async def _get_consumer_ntfy_topic(profile_id: str) -> Optional[str]:
+    """Fetch consumer's ntfy topic from Supabase (cached for ``NTFY_TOPIC_TTL``)."""
+    hit = _ntfy_topic_cache.get(profile_id)
+    if hit is not None and hit[0] > time.monotonic():
+        return hit[1]
+
     url = settings.supabase_url
     key = settings.supabase_anon_key
     if not url or not key:
         return None
 
     try:
-        resp = requests.get(
-            f"{url}/rest/v1/consumer_profiles",
+        resp = await _client(url, timeout=5.0).get(
+            "/rest/v1/consumer_profiles",
             params={"id": f"eq.{profile_id}", "select": "ntfy_topic"},
             headers={"apikey": key, "Authorization": f"Bearer {key}"},
-            timeout=5,
         )
         resp.raise_for_status()
         rows = resp.json()
         if not rows:
             return None
-        return rows[0].get("ntfy_topic")
+        topic = rows[0].get("ntfy_topic")
+        if topic:
+            _cache_ntfy_topic(profile_id, topic)
+        return topic
     except Exception as exc:
         logger.warning("Failed to fetch ntfy topic for profile %s: %s", profile_id, exc)
         return None
 
 
+async def _get_ntfy_topics(profile_ids: List[str]) -> Optional[Dict[str, str]]:
+    """Fetch ntfy topics for many profiles with one PostgREST ``in.()`` query per batch.
+
+    Cached topics are reused and fetched ones seed the cache.  Returns None
+    if Supabase is not configured or a lookup fails, so callers can fall
+    back to per-profile lookups.
+    """
+    url = settings.supabase_url
+    key = settings.supabase_anon_key
+    if not url or not key:
+        return None
+
+    now = time.monotonic()
+    topics: Dict[str, str] = {}
+    missing: List[str] = []
+    for pid in profile_ids:
+        hit = _ntfy_topic_cache.get(pid)
+        if hit is not None and hit[0] > now:
+            topics[pid] = hit[1]
+        else:
+            missing.append(pid)
+
+    client = _client(url, timeout=5.0)
+    headers = {"apikey": key, "Authorization": f"Bearer {key}"}
+
+    async def _fetch(batch: List[str]) -> List[Dict[str, Any]]:
+        resp = await client.get(
+            "/rest/v1/consumer_profiles",
+            params={"id": f"in.({','.join(batch)})", "select": "id,ntfy_topic"},
+            headers=headers,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    try:
+        batches = await asyncio.gather(*(
+            _fetch(missing[i:i + NTFY_TOPIC_BATCH])
+            for i in range(0, len(missing), NTFY_TOPIC_BATCH)
+        ))
+    except Exception as exc:
+        logger.warning("Failed to batch-fetch ntfy topics for %d profiles: %s", len(missing), exc)
+        return None
+
+    for rows in batches:
+        for row in rows:
+            topic = row.get("ntfy_topic")
+            if topic:
+                topics[row["id"]] = topic
+                _cache_ntfy_topic(row["id"], topic)
+    return topics
+
+
 def _format_alert_notification(alert: Dict[str, Any]) -> Dict[str, Any]:
     """Format alert data into ntfy notification payload (matches simulation style)."""
     # Extract alert details
@@ -59,20 +234,14 @@ def _format_alert_notification(alert: Dict[str, Any]) -> Dict[str, Any]:
     estimated_savings = metadata.get("estimated_savings_usd", 0)
     recommended_action = metadata.get("recommended_action", {})
 
-    # Map severity to ntfy priority (matches simulation)
-    priority_map = {
-        "critical": 5,
-        "warning": 4,
-        "optimization": 3,
-        "info": 2,
-    }
-    priority = priority_map.get(severity, 3)
+    priority = _PRIORITY_MAP.get(severity, 3)
 
     # Build message in simulation style
     message = f"{description}\n\n"
 
     # Add device-specific adjustment preview (like simulation)
-    if "hvac" in alert_type:
+    preview = _preview_kind(alert_type)
+    if preview == "setpoint":
         typical_setpoint = metadata.get("typical_setpoint", "??")
         recommended_setpoint = (
             recommended_action.get("coolSetpoint")
@@ -80,7 +249,7 @@ def _format_alert_notification(alert: Dict[str, Any]) -> Dict[str, Any]:
             or "??"
         )
         message += f"🌡️ Current: {typical_setpoint}°F → Recommended: {recommended_setpoint}°F\n"
-    elif "ev" in alert_type or "battery" in alert_type:
+    elif preview == "action":
         # For EV/battery, show action description
         action_desc = metadata.get("action_description", "Adjust device timing")
         message += f"⚡ Action: {action_desc}\n"
@@ -109,13 +278,7 @@ def _format_alert_notification(alert: Dict[str, Any]) -> Dict[str, Any]:
             },
         ]
 
-    # Select appropriate tags based on alert type (matches simulation)
-    tag_map = {
-        "weather_hvac": ["thermometer", "fire"],
-        "weather_battery": ["battery", "zap"],
-        "weather_ev": ["car", "zap"],
-    }
-    tags = tag_map.get(alert_type, ["warning"])
+    tags = _TAG_MAP.get(alert_type, _DEFAULT_TAGS)
 
     return {
         "title": title,
@@ -144,7 +307,7 @@ async def send_weather_alert_notification(
     """
     # Get ntfy topic if not provided
     if not ntfy_topic:
-        ntfy_topic = _get_consumer_ntfy_topic(profile_id)
+        ntfy_topic = await _get_consumer_ntfy_topic(profile_id)
 
     if not ntfy_topic:
         logger.warning("No ntfy topic configured for profile %s", profile_id)
@@ -155,14 +318,10 @@ async def send_weather_alert_notification(
 
     # Send to ntfy
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                f"{NTFY_SERVER}/{ntfy_topic}",
-                json=notification,
-            )
-            resp.raise_for_status()
-            logger.info("Sent notification to topic %s for profile %s", ntfy_topic, profile_id)
-            return True
+        resp = await _get_client().post(f"/{ntfy_topic}", json=notification)
+        resp.raise_for_status()
+        logger.info("Sent notification to topic %s for profile %s", ntfy_topic, profile_id)
+        return True
     except Exception as exc:
         logger.error(
             "Failed to send notification to topic %s: %s",
@@ -175,31 +334,51 @@ async def send_weather_alert_notification(
 async def broadcast_weather_alerts(alerts: List[Dict[str, Any]]) -> Dict[str, int]:
     """Broadcast weather alerts to all affected consumers.
 
+    Recipient topics are fetched up front in batches, then sends run
+    concurrently, at most ``BROADCAST_CONCURRENCY`` in flight.
+
     Args:
         alerts: List of alert dictionaries with profile_id and alert data
 
     Returns:
         Dictionary with success and failure counts
     """
-    success_count = 0
-    failure_count = 0
-
-    for alert in alerts:
-        profile_id = alert.get("profile_id")
-        if not profile_id:
-            # Skip non-personalized alerts
-            continue
-
-        # Only send weather alerts (personalized)
-        alert_type = alert.get("alert_type", "")
-        if not alert_type.startswith("weather_"):
-            continue
+    # Only personalized weather alerts are sent
+    targets = [
+        (alert["profile_id"], alert)
+        for alert in alerts
+        if alert.get("profile_id") and alert.get("alert_type", "").startswith("weather_")
+    ]
+    if not targets:
+        logger.info("Broadcast complete: nothing to send")
+        return {"success": 0, "failed": 0}
+
+    # One Supabase lookup for every recipient instead of one per send
+    topics = await _get_ntfy_topics(list({pid for pid, _ in targets}))
+    if topics is not None:
+        logger.info(
+            "Broadcasting %d alerts to %d ntfy topics (http2=%s)",
+            len(targets),
+            len(set(topics.values())),
+            NTFY_HTTP2,
+        )
+    semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+    async def _send_one(profile_id: str, alert: Dict[str, Any]) -> bool:
+        if topics is not None and profile_id not in topics:
+            logger.warning("No ntfy topic configured for profile %s", profile_id)
+            return False
+        async with semaphore:
+            return await send_weather_alert_notification(
+                profile_id,
+                alert,
+                ntfy_topic=topics[profile_id] if topics is not None else None,
+            )
 
-        success = await send_weather_alert_notification(profile_id, alert)
-        if success:
-            success_count += 1
-        else:
-            failure_count += 1
+    sends = [_send_one(pid, alert) for pid, alert in targets]
+    results = await asyncio.gather(*sends, return_exceptions=True)
+    success_count = sum(1 for r in results if r is True)
+    failure_count = len(results) - success_count
 
     logger.info(
         "Broadcast complete: %d sent, %d failed",
@@ -240,7 +419,7 @@ async def send_confirmation_notification(
     Returns:
         True if notification sent successfully
     """
-    ntfy_topic = _get_consumer_ntfy_topic(profile_id)
+    ntfy_topic = await _get_consumer_ntfy_topic(profile_id)
     if not ntfy_topic:
         return False
 
@@ -249,11 +428,7 @@ async def send_confirmation_notification(
             # Match simulation success format
             title = "✅ Device Adjusted"
 
-            device_name = {
-                "hvac": "thermostat",
-                "battery": "battery",
-                "ev_charger": "EV charger",
-            }.get(device_type, "device")
+            device_name = _DEVICE_NAME_MAP.get(device_type, "device")
 
             default_message = (
                 f"Your {device_name} has been adjusted.\n"
@@ -269,7 +444,7 @@ async def send_confirmation_notification(
                 default_message += f"\n📊 ${remaining:.2f} more until RLUSD payout"
 
             priority = 3
-            tags = ["white_check_mark", "thermometer" if device_type == "hvac" else "zap"]
+            tags = _ADJUSTED_TAGS_HVAC if device_type == "hvac" else _ADJUSTED_TAGS
         else:
             title = "✗ Device Control Failed"
             default_message = f"Failed to adjust your device for: {alert_title}\nPlease try again or contact support."
@@ -290,14 +465,10 @@ async def send_confirmation_notification(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                f"{NTFY_SERVER}/{ntfy_topic}",
-                json=notification,
-            )
-            resp.raise_for_status()
-            logger.info("Sent confirmation notification to profile %s", profile_id)
-            return True
+        resp = await _get_client().post(f"/{ntfy_topic}", json=notification)
+        resp.raise_for_status()
+        logger.info("Sent confirmation notification to profile %s", profile_id)
+        return True
     except Exception as exc:
         logger.error("Failed to send confirmation notification: %s", exc)
         return False
@@ -320,7 +491,7 @@ async def send_payout_notification(
     Returns:
         True if notification sent successfully
     """
-    ntfy_topic = _get_consumer_ntfy_topic(profile_id)
+    ntfy_topic = await _get_consumer_ntfy_topic(profile_id)
     if not ntfy_topic:
         return False
 
@@ -342,14 +513,10 @@ async def send_payout_notification(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                f"{NTFY_SERVER}/{ntfy_topic}",
-                json=notification,
-            )
-            resp.raise_for_status()
-            logger.info("Sent payout notification to profile %s: $%s", profile_id, amount_usd)
-            return True
+        resp = await _get_client().post(f"/{ntfy_topic}", json=notification)
+        resp.raise_for_status()
+        logger.info("Sent payout notification to profile %s: $%s", profile_id, amount_usd)
+        return True
     except Exception as exc:
         logger.error("Failed to send payout notification: %s", exc)
         return False
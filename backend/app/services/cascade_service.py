@@ -9,17 +9,31 @@ models failure propagation:
    equally to its non-failed neighbours.
 4. Repeat until no new failures or 20 iterations.
 
+Propagation runs on flat NumPy arrays: every hop finds the whole overloaded
+frontier at once, gathers its edges from a CSR adjacency and redistributes
+its load with a single weighted ``bincount``, instead of walking neighbours
+node by node.
+
 Returns step-by-step failure progression for frontend animation.
 """
 
 from __future__ import annotations
 
-import copy
+import asyncio
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Set
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 import networkx as nx
+import numpy as np
+
+from app.models.simulate import NODE_STATUS_CODES, NodeStates
 
 logger = logging.getLogger("blackout.cascade")
 
@@ -29,6 +43,10 @@ REDISTRIBUTION_FACTOR = 0.70
 # Grid equipment typically has 5-10% safety margin before tripping
 FAILURE_THRESHOLD = 1.05  # Node fails at 105% of capacity, not 100%
 
+_FAILED = NODE_STATUS_CODES["failed"]
+_STRESSED = NODE_STATUS_CODES["stressed"]
+_NOMINAL = NODE_STATUS_CODES["nominal"]
+
 # Cold weather infrastructure failure simulation (for Uri scenario)
 # Temperatures and failure rates calibrated to match actual Uri (70% generation offline)
 EXTREME_COLD_THRESHOLD = 20.0  # °F - Severe equipment failures
@@ -36,20 +54,187 @@ COLD_THRESHOLD = 32.0  # °F - Moderate equipment stress
 EXTREME_COLD_FAILURE_RATE = 0.40  # 40% of nodes fail at <20°F (gas plants, frozen lines)
 COLD_FAILURE_RATE = 0.15  # 15% of nodes fail at 20-32°F (equipment stress, icing)
 
+# Memoized run_cascade results: identical inputs give identical output
+# (fixed-seed cold failures), and scenario replays repeat the same runs
+_RESULT_CACHE_TTL = 300  # seconds
+_RESULT_CACHE_MAX = 16  # results carry every step, keep the count small
+_result_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+# Cascades run concurrently on the executor and on ``to_thread`` workers;
+# every read, eviction and write of the memo holds this lock
+_result_cache_lock = threading.Lock()
+
+# Independent cascade runs (scenario prewarm, with/without comparisons,
+# API calls) share this pool so they overlap and stay off the event loop.
+# The hop kernels are NumPy ops that release the GIL.
+_executor = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1),
+    thread_name_prefix="cascade",
+)
+
+
+# ── Array view of the grid ──────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class CascadeAdjacency:
+    """Node attributes and directed edge list of a grid graph as arrays.
+
+    Node ``i`` is ``node_ids[i]`` (graph iteration order).  Each undirected
+    edge appears once per direction; edges are grouped by source in the same
+    order ``graph.neighbors`` yields them, so node ``i``'s edges are
+    ``indptr[i]:indptr[i + 1]`` (CSR layout).  The arrays are read-only: runs
+    share one instance instead of copying the graph, and keep their own
+    mutable ``load`` / ``failed`` state.
+    """
 
-def run_cascade(
+    node_ids: List[str]
+    id_order: np.ndarray  # intp, node indices in sorted-id order
+    indptr: np.ndarray  # intp, len(node_ids) + 1
+    src: np.ndarray  # intp
+    dst: np.ndarray  # intp
+    base_load_mw: np.ndarray
+    capacity_mw: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+    zones: List[str]  # distinct weather zones
+    zone_index: np.ndarray  # intp, node → position in ``zones``
+
+
+@dataclass(frozen=True)
+class CascadeHop:
+    """One propagation hop: newly failed nodes and the load they pushed out."""
+
+    new_failures: np.ndarray  # node indices
+    reroute_src: np.ndarray  # node indices
+    reroute_dst: np.ndarray  # node indices
+    reroute_mw: np.ndarray
+
+
+def _frozen(arr: np.ndarray) -> np.ndarray:
+    """Mark ``arr`` read-only; adjacency arrays are shared by every run."""
+    arr.flags.writeable = False
+    return arr
+
+
+def build_adjacency(graph: nx.Graph) -> CascadeAdjacency:
+    """Flatten ``graph`` into a ``CascadeAdjacency``."""
+    node_ids = list(graph.nodes)
+    index = {nid: i for i, nid in enumerate(node_ids)}
+    src: List[int] = []
+    dst: List[int] = []
+    for i, nid in enumerate(node_ids):
+        for nb in graph.adj[nid]:
+            src.append(i)
+            dst.append(index[nb])
+
+    indptr = np.zeros(len(node_ids) + 1, dtype=np.intp)
+    np.cumsum(np.bincount(src, minlength=len(node_ids)), out=indptr[1:])
+
+    nodes = graph.nodes
+    weather_zone = [nodes[n].get("weather_zone", "") for n in node_ids]
+    zones = list(dict.fromkeys(weather_zone))
+    zone_pos = {z: i for i, z in enumerate(zones)}
+    return CascadeAdjacency(
+        node_ids=node_ids,
+        id_order=_frozen(np.array(sorted(range(len(node_ids)), key=node_ids.__getitem__), dtype=np.intp)),
+        indptr=_frozen(indptr),
+        src=_frozen(np.array(src, dtype=np.intp)),
+        dst=_frozen(np.array(dst, dtype=np.intp)),
+        base_load_mw=_frozen(np.array([nodes[n]["base_load_mw"] for n in node_ids], dtype=np.float64)),
+        capacity_mw=_frozen(np.array([nodes[n]["capacity_mw"] for n in node_ids], dtype=np.float64)),
+        lat=_frozen(np.array([nodes[n]["lat"] for n in node_ids], dtype=np.float64)),
+        lon=_frozen(np.array([nodes[n]["lon"] for n in node_ids], dtype=np.float64)),
+        zones=zones,
+        zone_index=_frozen(np.array([zone_pos[z] for z in weather_zone], dtype=np.intp)),
+    )
+
+
+# The grid graph is loaded once and never mutated, so its array view is
+# built on first use and reused for every later run.
+_adjacency: Optional[Tuple[nx.Graph, CascadeAdjacency]] = None
+
+
+def get_adjacency(graph: nx.Graph) -> CascadeAdjacency:
+    """Cached ``build_adjacency`` for the most recently used graph."""
+    global _adjacency
+    if _adjacency is None or _adjacency[0] is not graph:
+        _adjacency = (graph, build_adjacency(graph))
+        with _result_cache_lock:
+            _result_cache.clear()
+    return _adjacency[1]
+
+
+def _multiplier_array(adj: CascadeAdjacency, demand_multipliers: Dict[str, float]) -> np.ndarray:
+    """Per-node demand multipliers in adjacency order (1.0 where missing)."""
+    ids = adj.node_ids
+    return np.fromiter((demand_multipliers.get(nid, 1.0) for nid in ids), dtype=np.float64, count=len(ids))
+
+
+def run_cascade_batched(
+    adj: CascadeAdjacency,
+    load: np.ndarray,
+    capacity: np.ndarray,
+    failed: np.ndarray,
+    max_iterations: int = MAX_CASCADE_ITERATIONS,
+) -> List[CascadeHop]:
+    """Propagate failures hop by hop over the whole frontier at once.
+
+    ``load`` and ``failed`` are updated in place.  Each hop fails every live
+    node above ``FAILURE_THRESHOLD`` and splits ``REDISTRIBUTION_FACTOR`` of
+    its load evenly across its live neighbours.
+    """
+    n = len(adj.node_ids)
+    # Trip limits are fixed for the run, so scale capacity once up front
+    trip_mw = capacity * FAILURE_THRESHOLD
+    hops: List[CascadeHop] = []
+    for _ in range(max_iterations):
+        frontier = ~failed & (load > trip_mw)
+        new_failures = np.flatnonzero(frontier)
+        if new_failures.size == 0:
+            break
+
+        failed |= frontier
+
+        # Gather only the frontier's CSR edge ranges, then keep edges to
+        # nodes that are still live
+        starts = adj.indptr[new_failures]
+        counts = adj.indptr[new_failures + 1] - starts
+        edges = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        dst = adj.dst[edges]
+        live = ~failed[dst]
+        src = adj.src[edges][live]
+        dst = dst[live]
+        if dst.size == 0:
+            # Nothing to reroute (the grid is fully failed or the frontier is
+            # cut off), so no load moves and the next scan would find no
+            # overloads: the cascade has plateaued
+            hops.append(CascadeHop(new_failures, src, dst, np.zeros(0)))
+            break
+
+        live_degree = np.bincount(src, minlength=n)
+        share = load[src] * REDISTRIBUTION_FACTOR / live_degree[src]
+        load += np.bincount(dst, weights=share, minlength=n)
+
+        hops.append(CascadeHop(new_failures, src, dst, share))
+    return hops
+
+
+def iter_cascade(
     graph: nx.Graph,
     demand_multipliers: Dict[str, float],
     scenario_label: str = "uri_2021",
     forecast_hour: int = 36,
     weather_by_zone: Dict[str, Dict[str, float]] | None = None,
-) -> Dict[str, Any]:
-    """Execute the cascade simulation and return a full result dict.
+) -> Iterator[Dict[str, Any]]:
+    """Execute the cascade simulation, yielding each step dict as it is built.
+
+    The last item yielded is the summary: every ``run_cascade`` result key
+    except ``steps``.
 
     Parameters
     ----------
     graph : nx.Graph
-        The base grid graph (will be deep-copied — never mutated).
+        The base grid graph (never mutated).
     demand_multipliers : dict
         Node ID → demand multiplier (e.g. 2.5 means 250 % of base load).
     scenario_label : str
@@ -61,175 +246,160 @@ def run_cascade(
         Used to simulate cold-weather infrastructure failures (Uri scenario).
     """
     started = datetime.now(timezone.utc)
-    g = copy.deepcopy(graph)
+    adj = get_adjacency(graph)
+    ids = adj.node_ids
+    n = len(ids)
+    capacity = adj.capacity_mw
+    # Step records read these per node; Python lists avoid a NumPy scalar
+    # box + .item() for every field, and rounding is done in bulk up front
+    lat = adj.lat.tolist()
+    lon = adj.lon.tolist()
+    capacity_r = np.round(capacity, 1)
+    capacity_rl = capacity_r.tolist()
 
     logger.info(
         f"Starting cascade simulation: scenario={scenario_label}, "
-        f"forecast_hour={forecast_hour}, nodes={g.number_of_nodes()}, "
+        f"forecast_hour={forecast_hour}, nodes={n}, "
         f"weather_zones={len(weather_by_zone) if weather_by_zone else 0}"
     )
 
     # ── Step 0: Apply demand multipliers ────────────────────────────
-    for nid in g.nodes:
-        mult = demand_multipliers.get(nid, 1.0)
-        g.nodes[nid]["current_load"] = g.nodes[nid]["base_load_mw"] * mult
+    load = adj.base_load_mw * _multiplier_array(adj, demand_multipliers)
 
-    failed: Set[str] = set()
-    steps: List[Dict[str, Any]] = []
+    failed = np.zeros(n, dtype=bool)
+    depth = 0  # steps yielded so far
 
     # ── Step 0.5: Simulate cold-weather infrastructure failures ─────
     # During extreme cold (Uri scenario), equipment freezes, gas plants trip,
     # transmission lines ice over, etc. This pre-fails nodes BEFORE cascade.
-    cold_weather_failures: List[str] = []
+    cold_weather_failures: List[int] = []
     if weather_by_zone:
-        import random
-        random.seed(42)  # Deterministic failures for same scenario
-
-        for nid in list(g.nodes):
-            zone = g.nodes[nid].get("weather_zone", "")
-            weather = weather_by_zone.get(zone)
-            if not weather:
-                continue
-
-            temp_f = weather.get("temp_f", 70.0)
-
-            # Determine failure probability based on temperature
-            failure_prob = 0.0
-            if temp_f < EXTREME_COLD_THRESHOLD:
-                # <20°F: Catastrophic failures (frozen gas plants, equipment)
-                failure_prob = EXTREME_COLD_FAILURE_RATE
-            elif temp_f < COLD_THRESHOLD:
-                # 20-32°F: Moderate failures (some equipment stress)
-                failure_prob = COLD_FAILURE_RATE
-
-            # Randomly fail nodes based on probability
-            # Higher capacity nodes more likely to be generation (more vulnerable)
-            if failure_prob > 0:
-                capacity = g.nodes[nid]["capacity_mw"]
-                # Generation nodes (high capacity) 2x more likely to fail
-                if capacity > 500:  # Likely a generation node
-                    failure_prob *= 2.0
-
-                if random.random() < failure_prob:
-                    cold_weather_failures.append(nid)
-                    failed.add(nid)
-                    # Set load to 0 for failed nodes
-                    g.nodes[nid]["current_load"] = 0
+        # Zone temperatures broadcast to nodes; nodes in zones without
+        # weather get 70 °F, i.e. no failure risk
+        zone_temp = np.array(
+            [(weather_by_zone.get(z) or {}).get("temp_f", 70.0) for z in adj.zones],
+            dtype=np.float64,
+        )
+        temp_f = zone_temp[adj.zone_index]
+
+        # <20°F: catastrophic failures (frozen gas plants, equipment);
+        # 20-32°F: moderate failures (some equipment stress)
+        failure_prob = np.select(
+            [temp_f < EXTREME_COLD_THRESHOLD, temp_f < COLD_THRESHOLD],
+            [EXTREME_COLD_FAILURE_RATE, COLD_FAILURE_RATE],
+            default=0.0,
+        )
+        # Generation nodes (high capacity) 2x more likely to fail
+        failure_prob = np.where(capacity > 500, failure_prob * 2.0, failure_prob)
+
+        # Deterministic failures for same scenario; a private generator so
+        # concurrent runs on the cascade pool cannot interleave draws
+        rng = np.random.default_rng(42)
+        cold_weather_failures = np.flatnonzero(rng.random(n) < failure_prob).tolist()
 
         if cold_weather_failures:
+            failed[cold_weather_failures] = True
+            # Set load to 0 for failed nodes
+            load[cold_weather_failures] = 0.0
+
             # Record initial weather-driven failures as step -1 (pre-cascade)
-            steps.append({
+            depth += 1
+            yield {
                 "step": -1,  # Pre-cascade step
                 "new_failures": [
                     {
-                        "id": nid,
-                        "lat": g.nodes[nid]["lat"],
-                        "lon": g.nodes[nid]["lon"],
+                        "id": ids[i],
+                        "lat": lat[i],
+                        "lon": lon[i],
                         "load_mw": 0.0,  # Cold-weather failures have load set to 0
-                        "capacity_mw": round(g.nodes[nid]["capacity_mw"], 1),
+                        "capacity_mw": capacity_rl[i],
                     }
-                    for nid in cold_weather_failures
+                    for i in cold_weather_failures
                 ],
                 "reroutes": [],
-                "total_failed": len(failed),
+                "total_failed": len(cold_weather_failures),
                 "total_load_shed_mw": 0.0,  # No load shed yet, just failures
-            })
+            }
             logger.info(
                 f"Cold-weather pre-failures: {len(cold_weather_failures)} nodes failed "
-                f"({len(cold_weather_failures)/g.number_of_nodes()*100:.1f}% of grid)"
+                f"({len(cold_weather_failures)/n*100:.1f}% of grid)"
             )
         else:
             logger.info("No cold-weather failures (weather_by_zone not provided or no extreme cold)")
 
     # ── Iterative cascade ───────────────────────────────────────────
-    for iteration in range(MAX_CASCADE_ITERATIONS):
-        new_failures: List[str] = []
-
-        for nid in g.nodes:
-            if nid in failed:
-                continue
-            # Apply failure threshold: nodes must exceed 105% capacity to fail
-            # This accounts for safety margins in real grid equipment
-            if g.nodes[nid]["current_load"] > g.nodes[nid]["capacity_mw"] * FAILURE_THRESHOLD:
-                new_failures.append(nid)
-
-        if not new_failures:
-            break
-
-        failed.update(new_failures)
+    hops = run_cascade_batched(adj, load, capacity, failed)
+    # A node's load is frozen once it fails, so the final loads are the
+    # loads each failure was recorded at
+    load_r = np.round(load, 1)
+    load_rl = load_r.tolist()
+
+    # Running shed after each hop, from one segmented reduction over every
+    # hop's failures (cold-weather failures were zeroed and add nothing)
+    shed_after_hop: List[float] = []
+    if hops:
+        sizes = [hop.new_failures.size for hop in hops]
+        offsets = np.cumsum([0] + sizes[:-1])
+        order = np.concatenate([hop.new_failures for hop in hops])
+        shed_after_hop = np.cumsum(np.add.reduceat(load[order], offsets)).tolist()
+
+    total_failed = len(cold_weather_failures)
+    for iteration, hop in enumerate(hops):
+        total_failed += hop.new_failures.size
 
         # Log iteration progress
         logger.info(
-            f"Cascade iteration {iteration}: {len(new_failures)} new failures, "
-            f"{len(failed)} total failed ({len(failed)/g.number_of_nodes()*100:.1f}% of grid)"
+            f"Cascade iteration {iteration}: {hop.new_failures.size} new failures, "
+            f"{total_failed} total failed ({total_failed/n*100:.1f}% of grid)"
         )
 
-        # Redistribute load from newly failed nodes and track reroutes.
-        reroutes: List[Dict[str, Any]] = []
-        for nid in new_failures:
-            load_to_shed = g.nodes[nid]["current_load"] * REDISTRIBUTION_FACTOR
-            alive_neighbours = [
-                nb for nb in g.neighbors(nid) if nb not in failed
-            ]
-            if alive_neighbours:
-                per_neighbour = load_to_shed / len(alive_neighbours)
-                for nb in alive_neighbours:
-                    g.nodes[nb]["current_load"] += per_neighbour
-                    reroutes.append({
-                        "from_id": nid,
-                        "to_id": nb,
-                        "from_lat": g.nodes[nid]["lat"],
-                        "from_lon": g.nodes[nid]["lon"],
-                        "to_lat": g.nodes[nb]["lat"],
-                        "to_lon": g.nodes[nb]["lon"],
-                        "load_mw": round(per_neighbour, 1),
-                    })
-
-        total_shed = sum(g.nodes[nid]["current_load"] for nid in failed)
-
-        steps.append(
+        reroutes = [
             {
-                "step": iteration,
-                "new_failures": [
-                    {
-                        "id": nid,
-                        "lat": g.nodes[nid]["lat"],
-                        "lon": g.nodes[nid]["lon"],
-                        "load_mw": round(g.nodes[nid]["current_load"], 1),
-                        "capacity_mw": round(g.nodes[nid]["capacity_mw"], 1),
-                    }
-                    for nid in new_failures
-                ],
-                "reroutes": reroutes,
-                "total_failed": len(failed),
-                "total_load_shed_mw": round(total_shed, 1),
+                "from_id": ids[s],
+                "to_id": ids[d],
+                "from_lat": lat[s],
+                "from_lon": lon[s],
+                "to_lat": lat[d],
+                "to_lon": lon[d],
+                "load_mw": mw,
             }
-        )
-
-    # ── Build final node states ─────────────────────────────────────
-    final_states: Dict[str, Dict[str, Any]] = {}
-    for nid in g.nodes:
-        nd = g.nodes[nid]
-        load = nd["current_load"]
-        cap = nd["capacity_mw"]
-        pct = (load / cap * 100.0) if cap > 0 else 0.0
-
-        if nid in failed:
-            status = "failed"
-        elif pct > 80:
-            status = "stressed"
-        else:
-            status = "nominal"
-
-        final_states[nid] = {
-            "status": status,
-            "current_load_mw": round(load, 1),
-            "capacity_mw": round(cap, 1),
-            "load_pct": round(pct, 1),
+            for s, d, mw in zip(
+                hop.reroute_src.tolist(), hop.reroute_dst.tolist(), np.round(hop.reroute_mw, 1).tolist()
+            )
+        ]
+
+        depth += 1
+        yield {
+            "step": iteration,
+            "new_failures": [
+                {
+                    "id": ids[i],
+                    "lat": lat[i],
+                    "lon": lon[i],
+                    "load_mw": load_rl[i],
+                    "capacity_mw": capacity_rl[i],
+                }
+                for i in hop.new_failures.tolist()
+            ],
+            "reroutes": reroutes,
+            "total_failed": total_failed,
+            "total_load_shed_mw": round(shed_after_hop[iteration], 1),
         }
 
-    total_shed = sum(
-        g.nodes[nid]["current_load"] for nid in failed
+    # ── Build final node states ─────────────────────────────────────
+    # Zero-capacity nodes report 0 % and are never stressed
+    pct_arr = np.divide(load, capacity, out=np.zeros_like(load), where=capacity > 0) * 100.0
+    codes = np.where(failed, _FAILED, np.where(pct_arr > 80, _STRESSED, _NOMINAL)).astype(np.uint8)
+    # Every failed node's load is counted in the last hop's running total
+    total_shed = shed_after_hop[-1] if shed_after_hop else 0.0
+    failed_count = int(np.count_nonzero(failed))
+
+    final_states = NodeStates(
+        ids=ids,  # shared with the cached adjacency, never mutated
+        status=codes,
+        current_load_mw=load_r,
+        capacity_mw=capacity_r,
+        load_pct=np.round(pct_arr, 1),
     )
 
     completed = datetime.now(timezone.utc)
@@ -237,22 +407,101 @@ def run_cascade(
 
     logger.info(
         f"Cascade simulation complete: "
-        f"{len(failed)}/{g.number_of_nodes()} nodes failed ({len(failed)/g.number_of_nodes()*100:.1f}%), "
-        f"{len(steps)} cascade steps, "
+        f"{failed_count}/{n} nodes failed ({failed_count/n*100:.1f}%), "
+        f"{depth} cascade steps, "
         f"{total_shed:.0f} MW shed, "
         f"duration={duration_ms:.0f}ms"
     )
 
-    return {
+    yield {
         "scenario": scenario_label,
         "forecast_hour": forecast_hour,
         "started_at": started.isoformat(),
         "completed_at": completed.isoformat(),
-        "steps": steps,
-        "total_failed_nodes": len(failed),
-        "total_nodes": g.number_of_nodes(),
-        "cascade_depth": len(steps),
+        "total_failed_nodes": failed_count,
+        "total_nodes": n,
+        "cascade_depth": depth,
         "total_load_shed_mw": round(total_shed, 1),
-        "failed_node_ids": sorted(failed),
+        # Walking the precomputed id order keeps the list sorted without a sort
+        "failed_node_ids": [ids[i] for i in adj.id_order[failed[adj.id_order]].tolist()],
         "final_node_states": final_states,
     }
+
+
+def run_cascade(
+    graph: nx.Graph,
+    demand_multipliers: Dict[str, float],
+    scenario_label: str = "uri_2021",
+    forecast_hour: int = 36,
+    weather_by_zone: Dict[str, Dict[str, float]] | None = None,
+) -> Dict[str, Any]:
+    """Execute the cascade simulation and return a full result dict.
+
+    Collects ``iter_cascade``; see it for the parameters.  Results are
+    memoized for ``_RESULT_CACHE_TTL`` per distinct input and shared between
+    callers, who must treat them as read-only.
+    """
+    adj = get_adjacency(graph)
+    mult = _multiplier_array(adj, demand_multipliers)
+    # The cascade only reads each zone's temperature from weather_by_zone.
+    # The graph is not part of the key: the cache is cleared whenever
+    # get_adjacency switches to a different graph.
+    temps = None
+    if weather_by_zone:
+        temps = tuple(sorted((zone, w.get("temp_f", 70.0)) for zone, w in weather_by_zone.items() if w))
+    key = (mult.tobytes(), scenario_label, forecast_hour, temps)
+
+    now = time.monotonic()
+    with _result_cache_lock:
+        hit = _result_cache.get(key)
+    if hit is not None and now - hit[0] < _RESULT_CACHE_TTL:
+        return hit[1]
+
+    *steps, summary = iter_cascade(
+        graph,
+        demand_multipliers,
+        scenario_label=scenario_label,
+        forecast_hour=forecast_hour,
+        weather_by_zone=weather_by_zone,
+    )
+    summary["steps"] = steps
+
+    with _result_cache_lock:
+        if key not in _result_cache and len(_result_cache) >= _RESULT_CACHE_MAX:
+            _result_cache.pop(next(iter(_result_cache)))
+        _result_cache[key] = (now, summary)
+    return summary
+
+
+# ── Concurrent runs ─────────────────────────────────────────────────
+
+
+async def run_cascade_async(graph: nx.Graph, demand_multipliers: Dict[str, float], **kwargs: Any) -> Dict[str, Any]:
+    """``run_cascade`` on the cascade thread pool, awaitable from handlers."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(run_cascade, graph, demand_multipliers, **kwargs))
+
+
+def run_cascades(runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run several independent cascades concurrently; results keep input order.
+
+    Each entry holds ``run_cascade`` keyword arguments.
+    """
+    futures = [_executor.submit(partial(run_cascade, **kw)) for kw in runs]
+    return [f.result() for f in futures]
+
+
+async def stream_cascade(
+    graph: nx.Graph, demand_multipliers: Dict[str, float], **kwargs: Any
+) -> AsyncIterator[Dict[str, Any]]:
+    """``iter_cascade`` driven on the cascade thread pool, one item at a time.
+
+    Lets a handler send each step while later ones are still being built.
+    """
+    loop = asyncio.get_running_loop()
+    steps = iter_cascade(graph, demand_multipliers, **kwargs)
+    while True:
+        item = await loop.run_in_executor(_executor, next, steps, None)
+        if item is None:
+            return
+        yield item
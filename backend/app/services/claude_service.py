@@ -9,14 +9,35 @@ Falls back to original/default text on any error or timeout.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import logging
 import os
+import re
+import time
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
+import httpx
+import orjson
 from dotenv import load_dotenv
 
+# The SDK is optional: without it every call falls back to template text
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
+# Request signing for Bedrock, installed with anthropic[bedrock]
+try:
+    import botocore  # noqa: F401
+
+    HAS_BEDROCK = True
+except ImportError:
+    HAS_BEDROCK = False
+
 # Load .env from project root (backend/../.env)
 _env_path = Path(__file__).resolve().parent.parent.parent.parent / ".env"
 load_dotenv(_env_path)
@@ -25,20 +46,38 @@ logger = logging.getLogger("blackout.claude")
 
 # ── ERCOT pricing context ─────────────────────────────────────────────
 
-ERCOT_PRICING_CONTEXT = """
-ERCOT Residential Electricity Pricing Reference (Texas):
+# Retail figures, for alerts that talk about a household's bill or savings
+_RETAIL_CONTEXT = """
 - Average residential rate: $0.12/kWh (~$60/MWh wholesale equivalent)
+- Average monthly residential bill: ~$150-175
+- Average monthly consumption: ~1,200 kWh
+""".strip()
+
+# Wholesale figures, for alerts quoting $/MWh prices
+_WHOLESALE_CONTEXT = """
 - Typical off-peak wholesale: $20-35/MWh
 - Typical on-peak wholesale: $50-80/MWh
 - Summer peak wholesale: $100-300/MWh
 - Extreme events (URI 2021): wholesale cap $9,000/MWh
 - Normal wholesale average: $35-45/MWh
-- Average monthly residential bill: ~$150-175
-- Average monthly consumption: ~1,200 kWh
 - Critical grid threshold: >$1,000/MWh wholesale indicates severe stress
 """.strip()
 
-SYSTEM_PROMPT = f"""You are a grid operations alert writer for Blackout, a Texas power grid monitoring system.
+# alert_type → pricing reference it needs.  Cascade and load-shed alerts
+# quote node counts and MW, so they get none.  ``weather_*`` alerts are
+# looked up under "weather".
+_CONTEXT_BY_TYPE: Dict[str, Tuple[str, ...]] = {
+    "price_spike": (_WHOLESALE_CONTEXT,),
+    "device_savings": (_RETAIL_CONTEXT,),
+    "weather": (_RETAIL_CONTEXT,),
+}
+
+ERCOT_PRICING_CONTEXT = (
+    "ERCOT Residential Electricity Pricing Reference (Texas):\n"
+    + _RETAIL_CONTEXT + "\n" + _WHOLESALE_CONTEXT
+)
+
+_SYSTEM_RULES = """You are a grid operations alert writer for Blackout, a Texas power grid monitoring system.
 You write SHORT, clear, actionable alert text for utility operators and consumers.
 
 Rules:
@@ -48,108 +87,436 @@ Rules:
 - For cascade alerts, convey urgency proportional to the scale of failure.
 - For price alerts, translate wholesale $/MWh to consumer impact where possible.
 - Be direct and professional. No exclamation marks. No filler words.
-- Return valid JSON array: [{{"title": "...", "description": "..."}}]
+- Return valid JSON array: [{"title": "...", "description": "..."}]
 - Return ONLY the JSON array, no markdown fences, no explanation.
-- Array order must match the input alert order.
+- Array order must match the input alert order."""
+
+SYSTEM_PROMPT = f"{_SYSTEM_RULES}\n\n{ERCOT_PRICING_CONTEXT}"
 
-{ERCOT_PRICING_CONTEXT}"""
+
+def _cached_system(text: str) -> List[Dict[str, Any]]:
+    """System prompt as a content block marked for Anthropic prompt caching.
+
+    The API only caches prefixes above a per-model minimum length; shorter
+    prompts are processed normally and the marker is ignored.
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+@lru_cache(maxsize=None)
+def _alert_system_blocks(alert_types: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """System prompt carrying only the pricing reference ``alert_types`` need.
+
+    ``alert_types`` must be sorted so each combination is built once.
+    """
+    snippets: Dict[str, None] = {}
+    for t in alert_types:
+        key = "weather" if t.startswith("weather_") else t
+        snippets.update(dict.fromkeys(_CONTEXT_BY_TYPE.get(key, ())))
+    if not snippets:
+        return _cached_system(_SYSTEM_RULES)
+    context = "\n".join(snippets)
+    return _cached_system(
+        f"{_SYSTEM_RULES}\n\nERCOT Residential Electricity Pricing Reference (Texas):\n{context}"
+    )
 
 
 # ── Client setup ──────────────────────────────────────────────────────
 
-_client = None
+HAIKU_MODEL = "claude-haiku-4-5-20251001"
 
+# Pooled connections to the Anthropic API, reused across calls
+CLAUDE_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
 
-def _get_client():
-    global _client
-    if _client is not None:
-        return _client
+# Optional AWS Bedrock routing (BLACKOUT_USE_BEDROCK=1), requesting the
+# latency-optimized inference tier.  AWS credentials and region come from the
+# standard AWS environment; if the Bedrock extras are missing, calls go to the
+# Anthropic API as usual.
+USE_BEDROCK = os.getenv("BLACKOUT_USE_BEDROCK") == "1"
+_BEDROCK_MODEL_IDS: Dict[str, str] = {
+    HAIKU_MODEL: os.getenv("BLACKOUT_BEDROCK_HAIKU_MODEL", "us.anthropic.claude-haiku-4-5-20251001-v1:0"),
+}
+_BEDROCK_LATENCY_HEADERS = {"X-Amzn-Bedrock-PerformanceConfig-Latency": "optimized"}
 
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        logger.warning("ANTHROPIC_API_KEY not set — Claude enhancement disabled")
-        return None
+# One async client per event loop.  The server loop and the orchestrator's
+# own ``asyncio.run`` loops (on worker threads) each get their own client, so
+# neither replaces or closes the other's; an entry goes away with its loop.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
 
+
+def _build_bedrock_client():
+    """``AsyncAnthropicBedrock`` client, or None if Bedrock support is missing."""
+    if not HAS_BEDROCK:
+        logger.warning("botocore not installed — using the Anthropic API instead of Bedrock")
+        return None
     try:
-        import anthropic
-        _client = anthropic.Anthropic(api_key=api_key)
-        return _client
-    except ImportError:
+        return anthropic.AsyncAnthropicBedrock(
+            http_client=httpx.AsyncClient(limits=CLAUDE_HTTP_LIMITS, timeout=10.0),
+            default_headers=_BEDROCK_LATENCY_HEADERS,
+        )
+    except Exception as exc:
+        logger.warning("Bedrock client unavailable (%s) — using the Anthropic API", exc)
+        return None
+
+
+def _get_async_client():
+    """Shared Claude client for the running event loop, or None."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is not None:
+        return client
+
+    if anthropic is None:
         logger.warning("anthropic package not installed — Claude enhancement disabled")
         return None
 
+    client = _build_bedrock_client() if USE_BEDROCK else None
+    if client is None:
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            logger.warning("ANTHROPIC_API_KEY not set — Claude enhancement disabled")
+            return None
+        client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(limits=CLAUDE_HTTP_LIMITS, timeout=10.0),
+        )
+
+    _async_clients[loop] = client
+    return client
+
+
+def _is_bedrock(client: Any) -> bool:
+    return anthropic is not None and isinstance(client, anthropic.AsyncAnthropicBedrock)
+
+
+async def close_client() -> None:
+    """Close the running loop's client, if it has one."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+# ── Response cache ────────────────────────────────────────────────────
+
+# sha256 of (system, user message, model, max_tokens) → JSON of the parsed objects.
+# Calls use the default temperature, but replayed scenarios send identical
+# prompts and a stored answer is as good as a fresh one.
+_RESPONSE_CACHE_MAX = 4096
+_response_cache: Dict[str, bytes] = {}
+
+# Characters that can change the scanner's state; everything else is skipped
+_SCAN_RE = re.compile(r'[\\"{}]')
+
+
+class _ArrayObjectScanner:
+    """Pull complete top-level objects out of a JSON array as it streams in.
+
+    Anything outside an object (brackets, commas, stray markdown fences) is
+    ignored, so responses need no cleanup first.  Only the text of the object
+    currently being written is kept between chunks.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._depth = 0
+        self._in_str = False
+        self._skip = -1  # index of a backslash-escaped character
+        self._obj_start = 0
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        done: List[Dict[str, Any]] = []
+        text = self._text + chunk
+        for m in _SCAN_RE.finditer(text, len(self._text)):
+            i = m.start()
+            ch = text[i]
+            if self._in_str:
+                if i == self._skip:
+                    continue
+                if ch == "\\":
+                    self._skip = i + 1
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                self._in_str = True
+            elif ch == "{":
+                if self._depth == 0:
+                    self._obj_start = i
+                self._depth += 1
+            elif ch == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        done.append(orjson.loads(text[self._obj_start:i + 1]))
+                    except ValueError:
+                        pass
+
+        cut = len(text) if self._depth == 0 else self._obj_start
+        self._text = text[cut:]
+        self._obj_start -= cut
+        self._skip -= cut
+        return done
+
+
+def _log_usage(response: Any) -> None:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+    cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+    logger.debug(
+        "Claude usage: input=%s cache_read=%d cache_write=%d",
+        getattr(usage, "input_tokens", None), cache_read, cache_write,
+    )
+
+
+async def _stream_json_array(
+    client: Any,
+    *,
+    model: str,
+    max_tokens: int,
+    system: Any,
+    user_message: str,
+    timeout: float,
+    expected: int,
+) -> AsyncGenerator[Dict[str, str], None]:
+    """Yield the objects of a JSON array from Claude as each one completes.
+
+    At most ``expected`` objects are yielded.  A repeated prompt is replayed
+    from cache; only responses that produced all ``expected`` objects are
+    cached.
+    """
+    key = hashlib.sha256(
+        orjson.dumps([system, user_message, model, max_tokens], option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+    cached = _response_cache.get(key)
+    if cached is not None:
+        logger.debug("Claude response served from cache")
+        for item in orjson.loads(cached):
+            yield item
+        return
+
+    items: List[Dict[str, str]] = []
+    scanner = _ArrayObjectScanner()
+    async with client.messages.stream(
+        model=_BEDROCK_MODEL_IDS.get(model, model) if _is_bedrock(client) else model,
+        max_tokens=max_tokens,
+        system=system,
+        messages=[{"role": "user", "content": user_message}],
+        timeout=timeout,
+    ) as stream:
+        async for text in stream.text_stream:
+            for item in scanner.feed(text):
+                if len(items) < expected:
+                    items.append(item)
+                    yield item
+        _log_usage(await stream.get_final_message())
+
+    if len(items) == expected:
+        if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+            _response_cache.pop(next(iter(_response_cache)))
+        _response_cache[key] = orjson.dumps(items)
+
+
+async def _request_json_array(
+    client: Any,
+    *,
+    model: str,
+    max_tokens: int,
+    system: Any,
+    user_message: str,
+    timeout: float,
+    expected: int,
+) -> List[Dict[str, str]]:
+    """Collect ``_stream_json_array``; raises ``ValueError`` if it comes up short."""
+    items = [
+        item
+        async for item in _stream_json_array(
+            client,
+            model=model,
+            max_tokens=max_tokens,
+            system=system,
+            user_message=user_message,
+            timeout=timeout,
+            expected=expected,
+        )
+    ]
+    if len(items) != expected:
+        raise ValueError(f"Claude returned {len(items)} items but expected {expected}")
+    return items
+
 
 # ── Public API ────────────────────────────────────────────────────────
 
 
-def enhance_alerts(alerts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# Per-alert rewrites: the same alert (type, severity, text, metadata) recurs
+# across orchestrator runs, so its rewrite is reused instead of re-sent.  The
+# key is exact: the rewritten text quotes the alert's own figures.
+_ALERT_TEXT_CACHE_MAX = 2048
+_alert_text_cache: Dict[Tuple[str, ...], Tuple[str, str]] = {}
+
+
+def _alert_key(alert: Dict[str, Any]) -> Tuple[str, ...]:
+    return (
+        alert.get("alert_type", "unknown"),
+        alert.get("severity", "warning"),
+        alert.get("title", ""),
+        alert.get("description", ""),
+        orjson.dumps(
+            alert.get("metadata") or {},
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        ).decode(),
+    )
+
+
+def _format_alert_line(n: int, key: Tuple[str, ...], metadata: Optional[Dict[str, Any]]) -> str:
+    """Prompt line for one alert, built from its already-extracted ``_alert_key``."""
+    alert_type, severity, title, description, _ = key
+    meta_str = ", ".join(f"{k}={v}" for k, v in metadata.items()) if metadata else "none"
+    return "".join((
+        str(n), ". type=", alert_type, " severity=", severity,
+        '\n   title="', title,
+        '"\n   description="', description,
+        '"\n   metadata: ', meta_str,
+    ))
+
+
+# Descriptions shorter than this read as stubs worth expanding
+_MIN_DESCRIPTION_CHARS = 40
+
+
+def _needs_enhancement(alert: Dict[str, Any]) -> bool:
+    """True if a rewrite would visibly improve the alert.
+
+    Templated alerts already read cleanly; only critical alerts, stub
+    descriptions and text with unfilled ``{placeholders}`` go to Claude.
+    """
+    title = alert.get("title", "")
+    description = alert.get("description", "")
+    return (
+        alert.get("severity") == "critical"
+        or len(description) < _MIN_DESCRIPTION_CHARS
+        or "{" in title
+        or "{" in description
+    )
+
+
+def _remember_alert_text(key: Tuple[str, ...], alert: Dict[str, Any]) -> None:
+    if key not in _alert_text_cache and len(_alert_text_cache) >= _ALERT_TEXT_CACHE_MAX:
+        _alert_text_cache.pop(next(iter(_alert_text_cache)))
+    _alert_text_cache[key] = (alert["title"], alert["description"])
+
+
+async def enhance_alerts(alerts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Enhance orchestrator alert text using Claude Haiku.
 
     Takes the list of alert dicts (as prepared for Supabase insertion)
     and returns the same list with title/description potentially rewritten.
+    Only alerts flagged by ``_needs_enhancement`` are considered; of those,
+    alerts rewritten before are served from cache and only the rest are sent.
 
     Falls back to original text on any error.
     """
     if not alerts:
         return alerts
 
-    client = _get_client()
+    keys: Dict[int, Tuple[str, ...]] = {}
+    pending: List[int] = []
+    for i, a in enumerate(alerts):
+        if not _needs_enhancement(a):
+            continue
+        key = keys[i] = _alert_key(a)
+        hit = _alert_text_cache.get(key)
+        if hit is None:
+            pending.append(i)
+        else:
+            a["title"], a["description"] = hit
+    if not pending:
+        logger.info(
+            "Claude enhancement skipped: %d alert(s) from cache, %d need no rewrite",
+            len(keys), len(alerts) - len(keys),
+        )
+        return alerts
+
+    client = _get_async_client()
     if client is None:
         return alerts
 
     # Build prompt with alert data
-    alert_descriptions = []
-    for i, a in enumerate(alerts):
-        meta = a.get("metadata", {})
-        meta_str = ", ".join(f"{k}={v}" for k, v in meta.items()) if meta else "none"
-        alert_descriptions.append(
-            f'{i+1}. type={a.get("alert_type", "unknown")} severity={a.get("severity", "warning")}\n'
-            f'   title="{a.get("title", "")}"\n'
-            f'   description="{a.get("description", "")}"\n'
-            f'   metadata: {meta_str}'
-        )
+    alert_descriptions = [
+        _format_alert_line(n + 1, keys[i], alerts[i].get("metadata"))
+        for n, i in enumerate(pending)
+    ]
 
     user_message = (
-        f"Rewrite these {len(alerts)} alerts with better prose. "
+        f"Rewrite these {len(pending)} alerts with better prose. "
         f"Keep the same meaning and all numeric values.\n\n"
         + "\n".join(alert_descriptions)
     )
 
+    # Objects are applied as they stream in, so a stream that fails or is
+    # cut short still keeps the rewrites that completed.
+    done = 0
     try:
-        import anthropic
-
-        response = client.messages.create(
-            model="claude-haiku-4-5-20251001",
+        async for e in _stream_json_array(
+            client,
+            model=HAIKU_MODEL,
             max_tokens=1024,
-            system=SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_message}],
+            system=_alert_system_blocks(
+                tuple(sorted({alerts[i].get("alert_type", "unknown") for i in pending}))
+            ),
+            user_message=user_message,
             timeout=5.0,
-        )
-
-        text = response.content[0].text if response.content else ""
-        cleaned = text.replace("```json", "").replace("```", "").strip()
-        enhanced: List[Dict[str, str]] = json.loads(cleaned)
-
-        if len(enhanced) != len(alerts):
-            logger.warning(
-                "Claude returned %d alerts but expected %d — falling back",
-                len(enhanced), len(alerts),
-            )
-            return alerts
-
-        for i, e in enumerate(enhanced):
+            expected=len(pending),
+        ):
+            i = pending[done]
             if e.get("title"):
                 alerts[i]["title"] = e["title"]
             if e.get("description"):
                 alerts[i]["description"] = e["description"]
-
-        logger.info("Claude enhanced %d alert(s)", len(alerts))
-        return alerts
-
+            _remember_alert_text(keys[i], alerts[i])
+            done += 1
     except Exception as exc:
-        logger.warning("Claude enhancement failed: %s — using original text", exc)
+        logger.warning(
+            "Claude enhancement failed after %d/%d alert(s): %s — using original text for the rest",
+            done, len(pending), exc,
+        )
         return alerts
 
+    if done < len(pending):
+        logger.warning(
+            "Claude returned %d rewrites but expected %d — using original text for the rest",
+            done, len(pending),
+        )
+    else:
+        logger.info(
+            "Claude enhanced %d alert(s), %d from cache, %d need no rewrite",
+            len(pending), len(keys) - len(pending), len(alerts) - len(keys),
+        )
+    return alerts
+
+
+def enhance_alerts_sync(
+    alerts: List[Dict[str, Any]],
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> List[Dict[str, Any]]:
+    """``enhance_alerts`` for synchronous callers running off the event loop.
+
+    With ``loop`` (the server's), the call runs there and reuses that loop's
+    pooled client across calls.  Without it, the call runs on a throwaway
+    loop whose client is closed afterwards.
+    """
+    if loop is not None:
+        return asyncio.run_coroutine_threadsafe(enhance_alerts(alerts), loop).result()
+
+    async def _run() -> List[Dict[str, Any]]:
+        try:
+            return await enhance_alerts(alerts)
+        finally:
+            await close_client()
+
+    return asyncio.run(_run())
+
 
 # ── Weather event generation ─────────────────────────────────────────
 
@@ -166,11 +533,58 @@ Rules:
 - Return ONLY the JSON array, no markdown fences.
 - Array order must match input order."""
 
-# Cache per scenario so we don't call Claude on every page load
-_weather_event_cache: Dict[str, List[Dict[str, str]]] = {}
+WEATHER_SYSTEM_BLOCKS = _cached_system(WEATHER_SYSTEM_PROMPT)
+
+# Cache per scenario so we don't call Claude on every page load.  Entries
+# expire so "live" headlines follow the weather, and the scenario string comes
+# from a query parameter, so the dict is bounded too.
+_WEATHER_EVENT_CACHE_TTL = 300  # seconds
+_WEATHER_EVENT_CACHE_MAX = 64
+_weather_event_cache: Dict[str, Tuple[float, List[Dict[str, str]]]] = {}
+# Zones per Claude call in ``generate_weather_events``
+_WEATHER_BATCH = 4
+# scenario → generation currently waiting on Claude
+_weather_inflight: Dict[str, "asyncio.Task[List[Dict[str, str]]]"] = {}
+
+
+def _cached_weather_events(scenario: str) -> Optional[List[Dict[str, str]]]:
+    hit = _weather_event_cache.get(scenario)
+    if hit is not None and time.monotonic() - hit[0] < _WEATHER_EVENT_CACHE_TTL:
+        return hit[1]
+    return None
 
 
-def generate_weather_events(
+def _cache_weather_events(scenario: str, events: List[Dict[str, str]]) -> None:
+    if scenario not in _weather_event_cache and len(_weather_event_cache) >= _WEATHER_EVENT_CACHE_MAX:
+        _weather_event_cache.pop(next(iter(_weather_event_cache)))
+    _weather_event_cache[scenario] = (time.monotonic(), events)
+
+
+def _weather_fallback(zones: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Plain ``{zone, name}`` descriptions used when Claude is unavailable."""
+    return [
+        {"zone": z["zone"], "name": f'{z["condition"]} {round(z["temp_f"])}°F — {z["city"]}'}
+        for z in zones
+    ]
+
+
+def _weather_user_message(zones: List[Dict[str, Any]], scenario: str) -> str:
+    zone_descriptions = []
+    for i, z in enumerate(zones):
+        zone_descriptions.append(
+            f'{i+1}. zone="{z["zone"]}" city="{z["city"]}" '
+            f'temp={z["temp_f"]}°F wind={z["wind_mph"]}mph '
+            f'condition="{z["condition"]}" grid_status="{z["grid_status"]}" severity={z["severity"]}'
+        )
+
+    return (
+        f"Generate weather event headlines for these {len(zones)} ERCOT zones. "
+        f"Scenario: {scenario}.\n\n"
+        + "\n".join(zone_descriptions)
+    )
+
+
+async def generate_weather_events(
     zones: List[Dict[str, Any]],
     scenario: str = "uri",
 ) -> List[Dict[str, str]]:
@@ -185,62 +599,120 @@ def generate_weather_events(
 
     Returns list of {zone, name} dicts.  Falls back to simple descriptions on error.
     """
-    if scenario in _weather_event_cache:
-        return _weather_event_cache[scenario]
-
+    cached = _cached_weather_events(scenario)
+    if cached is not None:
+        return cached
+
+    # Requests that arrive while a generation for the scenario is in flight
+    # share its result instead of each calling Claude.  Shielded so one
+    # client disconnecting does not cancel the call for the others.
+    task = _weather_inflight.get(scenario)
+    if task is None:
+        task = asyncio.ensure_future(_generate_weather_events(zones, scenario))
+        _weather_inflight[scenario] = task
+        task.add_done_callback(lambda _: _weather_inflight.pop(scenario, None))
+    return await asyncio.shield(task)
+
+
+async def _generate_weather_events(
+    zones: List[Dict[str, Any]],
+    scenario: str,
+) -> List[Dict[str, str]]:
     # Build fallback descriptions in case Claude is unavailable
-    fallback = [
-        {"zone": z["zone"], "name": f'{z["condition"]} {round(z["temp_f"])}°F — {z["city"]}'}
-        for z in zones
-    ]
+    fallback = _weather_fallback(zones)
 
     if not zones:
         return fallback
 
-    client = _get_client()
+    client = _get_async_client()
     if client is None:
         return fallback
 
-    zone_descriptions = []
-    for i, z in enumerate(zones):
-        zone_descriptions.append(
-            f'{i+1}. zone="{z["zone"]}" city="{z["city"]}" '
-            f'temp={z["temp_f"]}°F wind={z["wind_mph"]}mph '
-            f'condition="{z["condition"]}" grid_status="{z["grid_status"]}" severity={z["severity"]}'
-        )
+    # Sub-batches run concurrently: the slowest small call bounds latency, and
+    # a failed or short batch only falls back for its own zones.
+    batches = [zones[i:i + _WEATHER_BATCH] for i in range(0, len(zones), _WEATHER_BATCH)]
+    results = await asyncio.gather(
+        *[
+            _request_json_array(
+                client,
+                model=HAIKU_MODEL,
+                max_tokens=512,
+                system=WEATHER_SYSTEM_BLOCKS,
+                user_message=_weather_user_message(batch, scenario),
+                timeout=8.0,
+                expected=len(batch),
+            )
+            for batch in batches
+        ],
+        return_exceptions=True,
+    )
 
-    user_message = (
-        f"Generate weather event headlines for these {len(zones)} ERCOT zones. "
-        f"Scenario: {scenario}.\n\n"
-        + "\n".join(zone_descriptions)
+    events: List[Dict[str, str]] = []
+    failed = 0
+    for start, result in zip(range(0, len(zones), _WEATHER_BATCH), results):
+        if isinstance(result, BaseException):
+            logger.warning("Weather event batch failed: %s — using fallback", result)
+            failed += 1
+            events.extend(fallback[start:start + _WEATHER_BATCH])
+        else:
+            events.extend(result)
+
+    logger.info(
+        "Claude generated weather events for scenario=%s (%d/%d batch(es) fell back)",
+        scenario, failed, len(batches),
     )
+    if not failed:
+        _cache_weather_events(scenario, events)
+    return events
 
-    try:
-        import anthropic
 
-        response = client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=512,
-            system=WEATHER_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": user_message}],
-            timeout=8.0,
-        )
+async def stream_weather_events(
+    zones: List[Dict[str, Any]],
+    scenario: str = "uri",
+) -> AsyncGenerator[Dict[str, str], None]:
+    """Streaming variant of ``generate_weather_events``.
 
-        text = response.content[0].text if response.content else ""
-        cleaned = text.replace("```json", "").replace("```", "").strip()
-        events: List[Dict[str, str]] = json.loads(cleaned)
+    Yields each ``{zone, name}`` event as soon as Claude finishes writing it.
+    Every input zone gets exactly one event: if the stream fails or comes up
+    short, the remaining zones are filled from the fallback descriptions.
+    """
+    cached = _cached_weather_events(scenario)
+    if cached is not None:
+        for event in cached:
+            yield event
+        return
+
+    fallback = _weather_fallback(zones)
+    client = _get_async_client() if zones else None
+    if client is None:
+        for event in fallback:
+            yield event
+        return
 
-        if len(events) != len(zones):
-            logger.warning(
-                "Claude returned %d events but expected %d — falling back",
-                len(events), len(zones),
-            )
-            return fallback
+    events: List[Dict[str, str]] = []
+    try:
+        async for event in _stream_json_array(
+            client,
+            model=HAIKU_MODEL,
+            max_tokens=512,
+            system=WEATHER_SYSTEM_BLOCKS,
+            user_message=_weather_user_message(zones, scenario),
+            timeout=8.0,
+            expected=len(zones),
+        ):
+            events.append(event)
+            yield event
+    except Exception as exc:
+        logger.warning("Weather event stream failed: %s — filling with fallback", exc)
 
-        logger.info("Claude generated %d weather event(s) for scenario=%s", len(events), scenario)
-        _weather_event_cache[scenario] = events
-        return events
+    if len(events) == len(zones):
+        logger.info("Claude streamed %d weather event(s) for scenario=%s", len(events), scenario)
+        _cache_weather_events(scenario, events)
+        return
 
-    except Exception as exc:
-        logger.warning("Weather event generation failed: %s — using fallback", exc)
-        return fallback
+    logger.warning(
+        "Claude streamed %d events but expected %d — filling with fallback",
+        len(events), len(zones),
+    )
+    for event in fallback[len(events):]:
+        yield event
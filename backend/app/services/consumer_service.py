@@ -7,10 +7,10 @@ charge/discharge cycles for home batteries, and solar export timing.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
-import uuid
-from datetime import datetime, timezone
+import secrets
 from typing import Dict, List, Optional, Tuple
 
 import requests
@@ -32,6 +32,7 @@ from app.models.consumer import (
 )
 from app.models.price import HourlyPrice, PricingMode
 from app.services.price_service import price_service
+from app.utils.clock import now_cached
 
 logger = logging.getLogger("blackout.consumer")
 
@@ -143,7 +144,7 @@ async def create_custom_profile(
 ) -> ConsumerProfile:
     """Create and store a custom consumer profile."""
     profile = ConsumerProfile(
-        profile_id=f"custom-{uuid.uuid4().hex[:8]}",
+        profile_id=f"custom-{secrets.token_hex(4)}",
         name=request.name,
         profile_type=ProfileType.CUSTOM,
         household_size=request.household_size,
@@ -224,7 +225,7 @@ def _optimize_appliances(
         else:
             reason = "Already at optimal time"
 
-        schedule.append(OptimizedSchedule(
+        schedule.append(OptimizedSchedule.model_construct(
             appliance=app.name,
             original_start=app.preferred_start,
             optimized_start=best_start % 24,
@@ -354,7 +355,7 @@ def _generate_alerts(
     readiness: int,
 ) -> List[Alert]:
     """Generate contextual alerts based on price forecast and profile."""
-    now = datetime.now(timezone.utc)
+    now = now_cached()
     alerts: List[Alert] = []
 
     # Find peak price hours
@@ -364,7 +365,7 @@ def _generate_alerts(
     # High grid utilization alert
     high_util = [p for p in prices if p.grid_utilization_pct > 85]
     if high_util:
-        alerts.append(Alert(
+        alerts.append(Alert.model_construct(
             severity=AlertSeverity.WARNING,
             title="Grid Stress Detected",
             description=(
@@ -378,7 +379,7 @@ def _generate_alerts(
     # Extreme price alert
     extreme = [p for p in prices if p.price_mwh > 200]
     if extreme:
-        alerts.append(Alert(
+        alerts.append(Alert.model_construct(
             severity=AlertSeverity.CRITICAL,
             title="Extreme Price Spike Expected",
             description=(
@@ -391,7 +392,7 @@ def _generate_alerts(
 
     # Battery recommendation
     if not profile.has_battery and readiness < 80:
-        alerts.append(Alert(
+        alerts.append(Alert.model_construct(
             severity=AlertSeverity.INFO,
             title="Battery Storage Recommended",
             description=(
@@ -404,7 +405,7 @@ def _generate_alerts(
 
     # Solar recommendation
     if not profile.has_solar:
-        alerts.append(Alert(
+        alerts.append(Alert.model_construct(
             severity=AlertSeverity.INFO,
             title="Solar Panels Recommended",
             description=(
@@ -444,8 +445,9 @@ async def get_recommendations(
     if profile is None:
         raise ValueError(f"Unknown profile: {profile_id}")
 
-    # Get 48-hour price forecast
-    prices = price_service.get_price_forecast(
+    # Get 48-hour price forecast (XGBoost / numpy work — keep it off the loop)
+    prices = await asyncio.to_thread(
+        price_service.get_price_forecast,
         region=region,
         mode=PricingMode.HYBRID,
         scenario=scenario,
@@ -457,7 +459,7 @@ async def get_recommendations(
     # Battery arbitrage
     battery_savings, battery_kwh = _optimize_battery(profile_id, prices)
     if battery_savings > 0:
-        schedule.append(OptimizedSchedule(
+        schedule.append(OptimizedSchedule.model_construct(
             appliance="Battery (charge/discharge)",
             original_start=0,
             optimized_start=0,
@@ -470,7 +472,7 @@ async def get_recommendations(
     # Solar savings
     solar_savings, solar_kwh = _calculate_solar_savings(profile_id, prices)
     if solar_savings > 0:
-        schedule.append(OptimizedSchedule(
+        schedule.append(OptimizedSchedule.model_construct(
             appliance="Solar Generation",
             original_start=0,
             optimized_start=0,
@@ -486,7 +488,7 @@ async def get_recommendations(
     alerts = _generate_alerts(profile, prices, readiness)
     next_risk = _find_next_risk_window(prices)
 
-    return ConsumerRecommendation(
+    return ConsumerRecommendation.model_construct(
         profile=profile,
         optimized_schedule=schedule,
         total_savings=total_savings,
@@ -509,7 +511,7 @@ async def get_savings(
         for s in rec.optimized_schedule
         if s.original_cost > 0
     )
-    return SavingsSummary(
+    return SavingsSummary.model_construct(
         profile_id=profile_id,
         total_savings_dollars=rec.total_savings,
         total_savings_kwh=round(total_kwh, 2),
@@ -12,10 +12,14 @@ single backend process.  A reset is triggered when a new scenario is loaded.
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import math
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
 
 from app.models.utility import (
     Crew,
@@ -26,6 +30,8 @@ from app.models.utility import (
     FailedNode,
 )
 
+logger = logging.getLogger("blackout.crew_dispatch")
+
 # ── Constants ─────────────────────────────────────────────────────────
 
 EARTH_RADIUS_KM = 6_371.0
@@ -59,6 +65,14 @@ REPAIR_TIME: Dict[str, int] = {
     "unknown":       90,
 }
 
+# Crew / assignment status groups used in the dispatch state machine
+AVAILABLE_STATUSES = frozenset({CrewStatus.STANDBY, CrewStatus.COMPLETE})
+DISPATCHABLE_STATUSES = AVAILABLE_STATUSES | {CrewStatus.DEPLOYED}
+ASSIGNED_STATUSES = frozenset({
+    CrewStatus.DISPATCHED, CrewStatus.EN_ROUTE, CrewStatus.ON_SITE, CrewStatus.REPAIRING,
+})
+TRAVELLING_STATUSES = frozenset({CrewStatus.DISPATCHED, CrewStatus.EN_ROUTE})
+
 
 # ── Haversine ─────────────────────────────────────────────────────────
 
@@ -104,6 +118,9 @@ def specialty_match_score(crew_specialty: str, ideal_specialty: str) -> Tuple[fl
 # ── Module-level state ────────────────────────────────────────────────
 
 _assignments: Dict[str, DispatchAssignment] = {}
+# Assignment ids not yet COMPLETE, in dispatch order (dict as ordered set) —
+# the only ones ``tick`` has to look at
+_in_progress: Dict[str, None] = {}
 _crews: Dict[str, Crew] = {}
 _failed_nodes: Dict[str, FailedNode] = {}
 _repaired_nodes: Set[str] = set()
@@ -111,6 +128,17 @@ _id_counter = 0
 _storm_mode = True
 
 
+class InitInProgressError(RuntimeError):
+    """An init for a different scenario is already running."""
+
+
+# Background initialisation job (see ``start_init``)
+_init_lock = asyncio.Lock()
+_init_task: Optional[asyncio.Task] = None
+_init_state: Dict[str, Any] = {"status": "idle"}
+_init_counter = 0
+
+
 def _next_id() -> str:
     global _id_counter
     _id_counter += 1
@@ -124,6 +152,7 @@ def reset(storm: bool = True) -> None:
     """Clear all dispatch state (called when a new scenario starts)."""
     global _storm_mode, _id_counter
     _assignments.clear()
+    _in_progress.clear()
     _crews.clear()
     _failed_nodes.clear()
     _repaired_nodes.clear()
@@ -146,9 +175,17 @@ def load_crews(crews: List[Crew]) -> None:
         _crews[c.crew_id] = copy
 
 
+def _classify_failures(voltage_kv: np.ndarray, has_generator: np.ndarray) -> List[str]:
+    """Vectorized ``classify_failure``: failure type per node."""
+    conditions = [has_generator] + [voltage_kv >= t for t, _, _ in VOLTAGE_SPECIALTY]
+    choices = ["generation"] + [ftype for _, ftype, _ in VOLTAGE_SPECIALTY]
+    return np.select(conditions, choices, default="distribution").tolist()
+
+
 def load_failed_nodes(
     cascade_result: Dict[str, Any],
-    graph_nodes: Optional[Dict[str, Dict[str, Any]]] = None,
+    node_attrs: Optional[np.recarray] = None,
+    node_index: Optional[Dict[str, int]] = None,
 ) -> List[FailedNode]:
     """Extract failed nodes from cascade result and classify them.
 
@@ -156,81 +193,89 @@ def load_failed_nodes(
     ----------
     cascade_result : dict
         Output of ``cascade_service.run_cascade()``.
-    graph_nodes : dict, optional
-        If provided, used to look up voltage_kv for failure type classification.
-        Keys are node IDs, values have ``voltage_kv`` and optionally ``capacity_mw``.
+    node_attrs, node_index : optional
+        ``grid_graph.node_attrs`` / ``grid_graph.node_index``.  If provided,
+        used to look up voltage_kv, capacity and weather zone for failure
+        type classification.
     """
     _failed_nodes.clear()
-    nodes: List[FailedNode] = []
 
+    # First occurrence of each failed node, in cascade order
+    first_seen: Dict[str, Dict[str, Any]] = {}
     for step in cascade_result.get("steps", []):
         for nf in step.get("new_failures", []):
-            nid = nf["id"]
-            if nid in _failed_nodes:
-                continue  # already tracked from an earlier step
-
-            voltage_kv = 0.0
-            has_gen = False
-            if graph_nodes and nid in graph_nodes:
-                voltage_kv = graph_nodes[nid].get("voltage_kv", 0.0)
-                # A node with capacity >> base_load likely has a generator
-                cap = graph_nodes[nid].get("capacity_mw", 0)
-                base = graph_nodes[nid].get("base_load_mw", 0)
-                has_gen = cap > base * 2 and cap > 200
-
-            ftype, _ = classify_failure(voltage_kv, has_gen)
-
-            fn = FailedNode(
-                id=nid,
-                lat=nf["lat"],
-                lon=nf["lon"],
-                load_mw=nf["load_mw"],
-                capacity_mw=nf["capacity_mw"],
-                voltage_kv=voltage_kv,
-                weather_zone=graph_nodes.get(nid, {}).get("weather_zone", "") if graph_nodes else "",
-                failure_type=ftype,
-            )
-            _failed_nodes[nid] = fn
-            nodes.append(fn)
+            first_seen.setdefault(nf["id"], nf)
+    if not first_seen:
+        return []
+
+    ids = list(first_seen)
+    n = len(ids)
+    voltage = np.zeros(n, dtype=np.float64)
+    has_gen = np.zeros(n, dtype=bool)
+    zones = [""] * n
+
+    if node_attrs is not None and node_index is not None:
+        rows = np.fromiter((node_index.get(nid, -1) for nid in ids), dtype=np.intp, count=n)
+        known = rows >= 0
+        attrs = node_attrs[rows[known]]
+        voltage[known] = attrs.voltage_kv
+        # A node with capacity >> base_load likely has a generator
+        has_gen[known] = (attrs.capacity_mw > attrs.base_load_mw * 2) & (attrs.capacity_mw > 200)
+        zone_col = np.full(n, "", dtype=node_attrs.dtype["weather_zone"])
+        zone_col[known] = attrs.weather_zone
+        zones = zone_col.tolist()
+
+    nodes: List[FailedNode] = []
+    for nid, v, zone, ftype in zip(ids, voltage.tolist(), zones, _classify_failures(voltage, has_gen)):
+        nf = first_seen[nid]
+        fn = FailedNode(
+            id=nid,
+            lat=nf["lat"],
+            lon=nf["lon"],
+            load_mw=nf["load_mw"],
+            capacity_mw=nf["capacity_mw"],
+            voltage_kv=v,
+            weather_zone=zone,
+            failure_type=ftype,
+        )
+        _failed_nodes[nid] = fn
+        nodes.append(fn)
 
     return nodes
 
 
 def get_available_crews() -> List[Crew]:
     """Return crews that are available for dispatch (standby or complete)."""
-    available_statuses = {CrewStatus.STANDBY, CrewStatus.COMPLETE}
-    return [c for c in _crews.values() if c.status in available_statuses]
+    return [c for c in _crews.values() if c.status in AVAILABLE_STATUSES]
 
 
 def get_assigned_crew_ids() -> Set[str]:
     """Return IDs of crews that are currently assigned (not available)."""
-    active = {CrewStatus.DISPATCHED, CrewStatus.EN_ROUTE, CrewStatus.ON_SITE, CrewStatus.REPAIRING}
-    return {c.crew_id for c in _crews.values() if c.status in active}
+    return {c.crew_id for c in _crews.values() if c.status in ASSIGNED_STATUSES}
 
 
 def get_unassigned_failed_nodes() -> List[FailedNode]:
     """Return failed nodes that don't yet have a crew assigned."""
     assigned_targets = {a.target_node_id for a in _assignments.values()
-                        if a.status not in (CrewStatus.COMPLETE,)}
+                        if a.status != CrewStatus.COMPLETE}
     return [fn for fn in _failed_nodes.values()
             if fn.id not in assigned_targets and fn.id not in _repaired_nodes]
 
 
-def recommend_dispatch() -> DispatchRecommendation:
-    """Run the greedy dispatch algorithm and return recommended assignments.
+def _greedy_matches(
+    available: Dict[str, Crew],
+    unassigned: List[FailedNode],
+) -> Iterator[Tuple[FailedNode, Optional[Crew], float, int, float, float, str]]:
+    """Walk failed nodes (worst first) and pick the best free crew for each.
 
-    Does NOT actually dispatch — returns recommendations for the operator
-    to confirm.  Call ``dispatch_crew()`` to execute individual assignments.
+    Yields ``(node, crew, distance_km, eta, score, match_mult, match_label)``;
+    ``crew`` is None when no crew is left for the node.  ``unassigned`` is
+    sorted in place.
     """
-    available = {c.crew_id: c for c in get_available_crews()}
-    unassigned = get_unassigned_failed_nodes()
-
     # Sort failed nodes by severity (highest load shed first)
     unassigned.sort(key=lambda n: n.load_mw, reverse=True)
 
-    assignments: List[DispatchAssignment] = []
     used_crews: Set[str] = set()
-    leftover_nodes: List[FailedNode] = []
 
     for node in unassigned:
         _, ideal_specialty = classify_failure(node.voltage_kv, node.failure_type == "generation")
@@ -265,19 +310,36 @@ def recommend_dispatch() -> DispatchRecommendation:
 
         if best_crew is not None:
             used_crews.add(best_crew.crew_id)
+        yield node, best_crew, best_dist, best_eta, best_score, best_match_score, best_match_label
+
+
+def recommend_dispatch() -> DispatchRecommendation:
+    """Run the greedy dispatch algorithm and return recommended assignments.
+
+    Does NOT actually dispatch — returns recommendations for the operator
+    to confirm.  Call ``dispatch_crew()`` to execute individual assignments.
+    """
+    available = {c.crew_id: c for c in get_available_crews()}
+    unassigned = get_unassigned_failed_nodes()
+
+    assignments: List[DispatchAssignment] = []
+    leftover_nodes: List[FailedNode] = []
+
+    for node, crew, dist, minutes, score, _, match_label in _greedy_matches(available, unassigned):
+        if crew is not None:
             repair_mins = REPAIR_TIME.get(node.failure_type, 90)
 
             assignments.append(DispatchAssignment(
                 assignment_id=_next_id(),
-                crew_id=best_crew.crew_id,
-                crew_name=best_crew.name,
+                crew_id=crew.crew_id,
+                crew_name=crew.name,
                 target_node_id=node.id,
                 target_lat=node.lat,
                 target_lon=node.lon,
-                distance_km=round(best_dist, 1),
-                eta_minutes=best_eta,
-                specialty_match=best_match_label,
-                match_score=round(best_score, 2),
+                distance_km=round(dist, 1),
+                eta_minutes=minutes,
+                specialty_match=match_label,
+                match_score=round(score, 2),
                 failure_type=node.failure_type,
                 status=CrewStatus.DISPATCHED,
                 repair_minutes=repair_mins,
@@ -298,34 +360,20 @@ def recommend_dispatch() -> DispatchRecommendation:
     )
 
 
-def dispatch_crew(crew_id: str, target_node_id: str) -> DispatchAssignment:
-    """Confirm dispatch of a specific crew to a specific failed node.
-
-    Updates crew status to DISPATCHED and records the assignment.
-    """
-    crew = _crews.get(crew_id)
-    if crew is None:
-        raise ValueError(f"Unknown crew: {crew_id}")
-    if crew.status not in (CrewStatus.STANDBY, CrewStatus.COMPLETE, CrewStatus.DEPLOYED):
-        raise ValueError(f"Crew {crew_id} is not available (status={crew.status})")
-
-    node = _failed_nodes.get(target_node_id)
-    if node is None:
-        raise ValueError(f"Unknown or non-failed node: {target_node_id}")
-
-    dist = haversine_km(crew.lat, crew.lon, node.lat, node.lon)
-    minutes = eta_minutes(dist, storm=_storm_mode)
-    _, ideal = classify_failure(node.voltage_kv, node.failure_type == "generation")
-    match_mult, match_label = specialty_match_score(crew.specialty, ideal)
-    repair_mins = REPAIR_TIME.get(node.failure_type, 90)
-
-    now = datetime.now(timezone.utc)
-
+def _commit_dispatch(
+    crew: Crew,
+    node: FailedNode,
+    dist: float,
+    minutes: int,
+    match_mult: float,
+    match_label: str,
+) -> DispatchAssignment:
+    """Record an EN_ROUTE assignment and move the crew onto it."""
     assignment = DispatchAssignment(
         assignment_id=_next_id(),
-        crew_id=crew_id,
+        crew_id=crew.crew_id,
         crew_name=crew.name,
-        target_node_id=target_node_id,
+        target_node_id=node.id,
         target_lat=node.lat,
         target_lon=node.lon,
         distance_km=round(dist, 1),
@@ -334,19 +382,43 @@ def dispatch_crew(crew_id: str, target_node_id: str) -> DispatchAssignment:
         match_score=round(match_mult, 2),
         failure_type=node.failure_type,
         status=CrewStatus.EN_ROUTE,
-        repair_minutes=repair_mins,
-        dispatched_at=now,
+        repair_minutes=REPAIR_TIME.get(node.failure_type, 90),
+        dispatched_at=datetime.now(timezone.utc),
     )
 
     # Update crew state
     crew.status = CrewStatus.EN_ROUTE
-    crew.assigned_region = target_node_id
+    crew.assigned_region = node.id
     crew.eta_minutes = minutes
 
     _assignments[assignment.assignment_id] = assignment
+    _in_progress[assignment.assignment_id] = None
     return assignment
 
 
+def dispatch_crew(crew_id: str, target_node_id: str) -> DispatchAssignment:
+    """Confirm dispatch of a specific crew to a specific failed node.
+
+    Updates crew status to DISPATCHED and records the assignment.
+    """
+    crew = _crews.get(crew_id)
+    if crew is None:
+        raise ValueError(f"Unknown crew: {crew_id}")
+    if crew.status not in DISPATCHABLE_STATUSES:
+        raise ValueError(f"Crew {crew_id} is not available (status={crew.status})")
+
+    node = _failed_nodes.get(target_node_id)
+    if node is None:
+        raise ValueError(f"Unknown or non-failed node: {target_node_id}")
+
+    dist = haversine_km(crew.lat, crew.lon, node.lat, node.lon)
+    minutes = eta_minutes(dist, storm=_storm_mode)
+    _, ideal = classify_failure(node.voltage_kv, node.failure_type == "generation")
+    match_mult, match_label = specialty_match_score(crew.specialty, ideal)
+
+    return _commit_dispatch(crew, node, dist, minutes, match_mult, match_label)
+
+
 def dispatch_all(recommendation: DispatchRecommendation) -> List[DispatchAssignment]:
     """Confirm all recommended assignments at once."""
     confirmed: List[DispatchAssignment] = []
@@ -359,6 +431,23 @@ def dispatch_all(recommendation: DispatchRecommendation) -> List[DispatchAssignm
     return confirmed
 
 
+def recommend_and_dispatch_all() -> List[DispatchAssignment]:
+    """``dispatch_all(recommend_dispatch())`` in a single pass.
+
+    Each greedy match is committed as soon as it is chosen, so no
+    intermediate recommendation models are built and distances are not
+    recomputed.  Keep ``recommend_dispatch`` for dry runs.
+    """
+    available = {c.crew_id: c for c in get_available_crews()}
+    unassigned = get_unassigned_failed_nodes()
+
+    return [
+        _commit_dispatch(crew, node, dist, minutes, match_mult, match_label)
+        for node, crew, dist, minutes, _, match_mult, match_label in _greedy_matches(available, unassigned)
+        if crew is not None
+    ]
+
+
 def tick() -> DispatchStatusResponse:
     """Advance the state machine — call periodically (e.g., every poll or SSE tick).
 
@@ -371,12 +460,15 @@ def tick() -> DispatchStatusResponse:
     """
     now = datetime.now(timezone.utc)
 
-    for a in _assignments.values():
+    # Completed assignments never change again, so only in-progress ones
+    # are walked; per-tick cost tracks active crews, not dispatch history.
+    for aid in list(_in_progress):
+        a = _assignments[aid]
         crew = _crews.get(a.crew_id)
         if crew is None:
             continue
 
-        if a.status in (CrewStatus.DISPATCHED, CrewStatus.EN_ROUTE):
+        if a.status in TRAVELLING_STATUSES:
             # Check if ETA has elapsed
             if a.dispatched_at:
                 elapsed = (now - a.dispatched_at).total_seconds() / 60.0
@@ -413,31 +505,81 @@ def tick() -> DispatchStatusResponse:
                     a.completed_at = now
                     crew.status = CrewStatus.COMPLETE
                     _repaired_nodes.add(a.target_node_id)
+                    del _in_progress[aid]
 
-    # Build response
-    active_assignments = list(_assignments.values())
-    all_crews = list(_crews.values())
-
-    return DispatchStatusResponse(
-        assignments=active_assignments,
-        crews=all_crews,
-        repaired_nodes=sorted(_repaired_nodes),
-        total_dispatched=sum(1 for a in active_assignments if a.status in (CrewStatus.DISPATCHED, CrewStatus.EN_ROUTE)),
-        total_repairing=sum(1 for a in active_assignments if a.status == CrewStatus.REPAIRING),
-        total_complete=sum(1 for a in active_assignments if a.status == CrewStatus.COMPLETE),
-    )
+    return _status_response()
 
 
 def get_status() -> DispatchStatusResponse:
     """Get current dispatch status without advancing the state machine."""
-    active_assignments = list(_assignments.values())
-    all_crews = list(_crews.values())
+    return _status_response()
+
+
+def _status_response() -> DispatchStatusResponse:
+    dispatched = repairing = 0
+    for aid in _in_progress:
+        status = _assignments[aid].status
+        if status in TRAVELLING_STATUSES:
+            dispatched += 1
+        elif status == CrewStatus.REPAIRING:
+            repairing += 1
 
     return DispatchStatusResponse(
-        assignments=active_assignments,
-        crews=all_crews,
+        assignments=list(_assignments.values()),
+        crews=list(_crews.values()),
         repaired_nodes=sorted(_repaired_nodes),
-        total_dispatched=sum(1 for a in active_assignments if a.status in (CrewStatus.DISPATCHED, CrewStatus.EN_ROUTE)),
-        total_repairing=sum(1 for a in active_assignments if a.status == CrewStatus.REPAIRING),
-        total_complete=sum(1 for a in active_assignments if a.status == CrewStatus.COMPLETE),
+        total_dispatched=dispatched,
+        total_repairing=repairing,
+        total_complete=len(_assignments) - len(_in_progress),
     )
+
+
+# ── Background initialisation ─────────────────────────────────────────
+
+
+async def _run_init(job_id: str, scenario: str, job: Callable[[], Awaitable[Dict[str, Any]]]) -> None:
+    global _init_state
+    try:
+        result = await job()
+    except Exception as exc:
+        logger.exception("Dispatch init %s failed", job_id)
+        _init_state = {"job_id": job_id, "scenario": scenario, "status": "failed", "error": str(exc)}
+        return
+    _init_state = {"job_id": job_id, "scenario": scenario, **result, "status": "initialized"}
+
+
+async def start_init(scenario: str, job: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Run ``job`` (load crews + cascade + reset) for ``scenario`` as a background task.
+
+    ``job`` is expected to push its blocking work onto worker threads.
+
+    Returns immediately with the job id.  If an init for the same scenario
+    is already in flight its state is returned instead of starting a second
+    one; an in-flight init for another scenario raises ``InitInProgressError``.
+    """
+    global _init_task, _init_state, _init_counter
+    async with _init_lock:
+        if _init_task is not None and not _init_task.done():
+            if _init_state.get("scenario") != scenario:
+                raise InitInProgressError(
+                    f"Dispatch init {_init_state['job_id']} for scenario "
+                    f"{_init_state.get('scenario')!r} is still running"
+                )
+            return dict(_init_state)
+        _init_counter += 1
+        job_id = f"INIT-{_init_counter:04d}"
+        _init_state = {"job_id": job_id, "scenario": scenario, "status": "initializing"}
+        _init_task = asyncio.create_task(_run_init(job_id, scenario, job))
+        return dict(_init_state)
+
+
+async def wait_for_init() -> None:
+    """Block until any in-flight init has finished (no-op otherwise)."""
+    task = _init_task
+    if task is not None and not task.done():
+        await asyncio.shield(task)
+
+
+def get_init_status() -> Dict[str, Any]:
+    """State of the most recent init job: idle, initializing, initialized or failed."""
+    return dict(_init_state)
@@ -5,8 +5,10 @@ falls back to hardcoded Winter Storm Uri timeline for the ``uri`` scenario.
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import Any, AsyncGenerator, Dict, List
+from datetime import datetime, timezone
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional
 
 import requests
 
@@ -54,6 +56,18 @@ def _fetch_alerts() -> List[Dict[str, Any]]:
     return all_rows
 
 
+_VALID_SEVERITIES = frozenset(("info", "warning", "critical", "emergency"))
+
+
+def _parse_ts(ts_str: str) -> datetime:
+    # Handle Supabase ISO timestamps (may or may not have timezone)
+    ts_str = ts_str.replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(ts_str)
+    except ValueError:
+        return datetime.now(timezone.utc)
+
+
 def _rows_to_events(rows: List[Dict[str, Any]]) -> List[TimelineEvent]:
     """Convert Supabase ``live_alerts`` rows to ``TimelineEvent`` objects.
 
@@ -65,24 +79,14 @@ def _rows_to_events(rows: List[Dict[str, Any]]) -> List[TimelineEvent]:
       severity     → severity
       grid_region  → region
       metadata.affected_nodes → affected_nodes (default 0)
+
+    Rows must already be in ``created_at`` order — ``_fetch_alerts`` asks
+    Supabase for ``order=created_at``, so no re-sort is needed here.
     """
     if not rows:
         return []
 
-    # Sort by created_at so offsets are chronological
-    rows.sort(key=lambda r: r.get("created_at", ""))
-
     # Compute offset relative to the first alert
-    from datetime import datetime, timezone
-
-    def _parse_ts(ts_str: str) -> datetime:
-        # Handle Supabase ISO timestamps (may or may not have timezone)
-        ts_str = ts_str.replace("Z", "+00:00")
-        try:
-            return datetime.fromisoformat(ts_str)
-        except ValueError:
-            return datetime.now(timezone.utc)
-
     base_ts = _parse_ts(rows[0]["created_at"])
 
     events: List[TimelineEvent] = []
@@ -93,7 +97,6 @@ def _rows_to_events(rows: List[Dict[str, Any]]) -> List[TimelineEvent]:
         # Extract affected_nodes from metadata JSON if present
         metadata = r.get("metadata") or {}
         if isinstance(metadata, str):
-            import json
             try:
                 metadata = json.loads(metadata)
             except (json.JSONDecodeError, TypeError):
@@ -102,7 +105,7 @@ def _rows_to_events(rows: List[Dict[str, Any]]) -> List[TimelineEvent]:
 
         # Map severity — live_alerts may use different casing
         raw_severity = (r.get("severity") or "info").lower()
-        if raw_severity not in ("info", "warning", "critical", "emergency"):
+        if raw_severity not in _VALID_SEVERITIES:
             raw_severity = "info"
 
         events.append(TimelineEvent(
@@ -110,7 +113,7 @@ def _rows_to_events(rows: List[Dict[str, Any]]) -> List[TimelineEvent]:
             timestamp_offset_minutes=offset_minutes,
             title=r.get("title", "Alert"),
             description=r.get("description", ""),
-            severity=EventSeverity(raw_severity),
+            severity=EventSeverity.fv(raw_severity),
             region=r.get("grid_region"),
             affected_nodes=affected,
         ))
@@ -367,6 +370,11 @@ _NORMAL_EVENTS: List[dict] = [
 ]
 
 
+# Fallback timelines are static — build the models once at import.
+_URI_TIMELINE: List[TimelineEvent] = [TimelineEvent(**e) for e in _URI_EVENTS]
+_NORMAL_TIMELINE: List[TimelineEvent] = [TimelineEvent(**e) for e in _NORMAL_EVENTS]
+
+
 # ── Public API (same interface as before) ───────────────────────────
 
 
@@ -378,9 +386,9 @@ def get_events(scenario: str = "uri") -> List[TimelineEvent]:
     - ``live``   → real alerts from Supabase ``live_alerts`` table
     """
     if scenario == "uri":
-        return [TimelineEvent(**e) for e in _URI_EVENTS]
+        return list(_URI_TIMELINE)
     if scenario == "normal":
-        return [TimelineEvent(**e) for e in _NORMAL_EVENTS]
+        return list(_NORMAL_TIMELINE)
 
     # "live" or any other scenario → try Supabase
     global _cached_events
@@ -392,13 +400,24 @@ def get_events(scenario: str = "uri") -> List[TimelineEvent]:
         return events
 
     # Ultimate fallback: normal events
-    return [TimelineEvent(**e) for e in _NORMAL_EVENTS]
+    return list(_NORMAL_TIMELINE)
+
 
+async def stream_events(
+    scenario: str = "uri",
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+) -> AsyncGenerator[str, None]:
+    """Yield SSE-formatted events with ~2s delays between them.
 
-async def stream_events(scenario: str = "uri") -> AsyncGenerator[str, None]:
-    """Yield SSE-formatted events with ~2s delays between them."""
+    ``is_disconnected`` (usually ``request.is_disconnected``) is polled before
+    each event so the stream stops as soon as the client goes away instead
+    of sleeping through the rest of the timeline.
+    """
     events = get_events(scenario)
     for event in events:
+        if is_disconnected is not None and await is_disconnected():
+            logger.debug("Event stream client disconnected (scenario=%s)", scenario)
+            return
         data = event.model_dump_json()
         yield f"data: {data}\n\n"
         await asyncio.sleep(2.0)
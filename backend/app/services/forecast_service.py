@@ -2,13 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
-from app.models.forecast import (
-    HourlyPrice,
-    HourlyWeather,
-    ISORegion,
-    PriceForecastResponse,
-    WeatherForecastResponse,
-)
+from app.models.forecast import HourlyWeather, WeatherForecastResponse
 
 
 async def get_weather_forecast(
@@ -32,7 +26,7 @@ async def get_weather_forecast(
     # TODO: Implement actual Earth-2 API integration here
     now = datetime.now(timezone.utc)
     hourly = [
-        HourlyWeather(
+        HourlyWeather.model_construct(
             timestamp=now + timedelta(hours=i),
             temperature_f=85.0 + (i % 12) - 6,
             humidity_pct=45.0 + (i % 10),
@@ -49,40 +43,3 @@ async def get_weather_forecast(
         generated_at=now,
         hourly=hourly,
     )
-
-
-async def get_price_forecast(
-    iso: ISORegion,
-    hours_ahead: int,
-    node_id: str | None,
-) -> PriceForecastResponse:
-    """Fetch wholesale electricity price forecast for an ISO region.
-
-    This should pull real-time LMP data and run a price forecasting model
-    based on historical patterns, weather, and demand signals.
-
-    Args:
-        iso: ISO/RTO region identifier.
-        hours_ahead: Number of hours to forecast (1-168).
-        node_id: Optional specific pricing node within the ISO.
-
-    Returns:
-        PriceForecastResponse with hourly price data.
-    """
-    # TODO: Implement actual price forecasting logic here
-    now = datetime.now(timezone.utc)
-    hourly = [
-        HourlyPrice(
-            timestamp=now + timedelta(hours=i),
-            lmp_dollar_per_mwh=35.0 + (i % 24) * 2.5,
-            congestion_dollar_per_mwh=2.0 + (i % 8),
-            loss_dollar_per_mwh=1.0 + (i % 3) * 0.5,
-        )
-        for i in range(hours_ahead)
-    ]
-    return PriceForecastResponse(
-        iso=iso,
-        node_id=node_id,
-        generated_at=now,
-        hourly=hourly,
-    )
@@ -7,15 +7,26 @@ from __future__ import annotations
 
 import logging
 import math
+import sys
 from typing import Any, Dict, List, Tuple
 
 import networkx as nx
+import numpy as np
 import requests
 
 from app.config import settings
 
 logger = logging.getLogger("blackout.grid_graph")
 
+# Per-node attributes used to classify failed nodes for crew dispatch; one
+# record per bus, row ``node_index[node_id]``.
+NODE_ATTR_DTYPE = np.dtype([
+    ("voltage_kv", "f8"),
+    ("capacity_mw", "f8"),
+    ("base_load_mw", "f8"),
+    ("weather_zone", "U16"),
+])
+
 # ── ERCOT Weather Zone bounding boxes ────────────────────────────────
 # Ordered from most specific to least; first match wins.
 
@@ -100,22 +111,27 @@ def _fetch_all_rows(table: str, select: str = "*") -> List[Dict[str, Any]]:
 
 
 def _rows_to_nodes(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Convert Supabase node rows to the internal node dict format."""
+    """Convert Supabase node rows to the internal node dict format.
+
+    The JSON decoder hands back a fresh string per row, so the low-cardinality
+    labels (region / weather zone / source) are interned: ~2k nodes then share
+    a handful of objects and zone lookups hit the identity fast path.
+    """
     nodes: List[Dict[str, Any]] = []
     for r in rows:
         nodes.append({
-            "id": r["id"],
+            "id": sys.intern(r["id"]),
             "bus_num": r.get("bus_num", 0),
             "lat": float(r["lat"]),
             "lon": float(r["lon"]),
             "base_load_mw": float(r.get("base_load_mw", 0)),
             "capacity_mw": float(r.get("capacity_mw", 1)),
             "voltage_kv": float(r.get("voltage_kv", 0)),
-            "region": r.get("region", "ERCOT"),
-            "weather_zone": r.get("weather_zone", "South Central"),
+            "region": sys.intern(r.get("region") or "ERCOT"),
+            "weather_zone": sys.intern(r.get("weather_zone") or "South Central"),
             "area": int(r.get("area", 1)),
             "grid_zone": int(r.get("grid_zone", 0)),
-            "source": r.get("source", "activsg2000"),
+            "source": sys.intern(r.get("source") or "activsg2000"),
         })
     return nodes
 
@@ -125,8 +141,8 @@ def _rows_to_edges(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     edges: List[Dict[str, Any]] = []
     for r in rows:
         edges.append({
-            "from_bus": r["from_bus"],
-            "to_bus": r["to_bus"],
+            "from_bus": sys.intern(r["from_bus"]),
+            "to_bus": sys.intern(r["to_bus"]),
             "capacity_mva": float(r.get("capacity_mva", 100)),
             "impedance": float(r.get("impedance", 0.001)),
         })
@@ -204,6 +220,8 @@ class GridGraphService:
         self._raw: Dict[str, Any] = {"nodes": [], "edges": []}
         self.loaded = False
         self._zone_index: Dict[str, List[str]] = {}  # weather_zone → [node_ids]
+        self.node_index: Dict[str, int] = {}  # node_id → row in node_attrs
+        self.node_attrs: np.recarray = np.zeros(0, dtype=NODE_ATTR_DTYPE).view(np.recarray)
 
     # ── Lifecycle ────────────────────────────────────────────────────
 
@@ -219,6 +237,7 @@ class GridGraphService:
         self._raw = data
         self._build_networkx(data)
         self._build_zone_index()
+        self._build_node_table()
         self.loaded = True
         logger.info(
             "Grid loaded: %d nodes, %d edges",
@@ -298,6 +317,18 @@ class GridGraphService:
             wz = self.graph.nodes[nid].get("weather_zone", "South Central")
             self._zone_index.setdefault(wz, []).append(nid)
 
+    def _build_node_table(self) -> None:
+        """Build the ``node_attrs`` record array and its ``node_index``."""
+        nodes = self.graph.nodes
+        ids = list(nodes)
+        table = np.zeros(len(ids), dtype=NODE_ATTR_DTYPE).view(np.recarray)
+        table.voltage_kv = [nodes[n].get("voltage_kv", nodes[n].get("base_kv", 0.0)) for n in ids]
+        table.capacity_mw = [nodes[n].get("capacity_mw", 0) for n in ids]
+        table.base_load_mw = [nodes[n].get("base_load_mw", 0) for n in ids]
+        table.weather_zone = [nodes[n].get("weather_zone", "") for n in ids]
+        self.node_attrs = table
+        self.node_index = {nid: i for i, nid in enumerate(ids)}
+
     # ── Accessors ────────────────────────────────────────────────────
 
     def get_topology(self) -> Dict[str, Any]:
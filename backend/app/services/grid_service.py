@@ -4,13 +4,15 @@ grid-status, topology, and cascade-probability responses.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timezone
 from typing import Any, Dict, List, Tuple
 
+from app.models.grid import GridTopologyResponse
 from app.services import demand_service, overview_service
-from app.services.cascade_service import run_cascade
+from app.services.cascade_service import run_cascade_async
 from app.services.grid_graph_service import grid_graph
+from app.utils.clock import now_cached
 
 logger = logging.getLogger("blackout.grid_service")
 
@@ -26,8 +28,6 @@ def prewarm_cascade_cache() -> None:
     This makes the first API calls instant instead of waiting 1-2s for simulation.
     Runs in background, doesn't block startup.
     """
-    import asyncio
-
     async def _prewarm():
         logger.info("Pre-warming cascade probability cache...")
         scenarios_to_cache = [
@@ -35,11 +35,13 @@ def prewarm_cascade_cache() -> None:
             ("normal", 12),   # Normal midday
             ("live", 36),     # Live forecast
         ]
-        for scenario, hour in scenarios_to_cache:
-            try:
-                await get_cascade_probability(scenario, hour)
-            except Exception as e:
-                logger.warning(f"Failed to prewarm {scenario} h={hour}: {e}")
+        results = await asyncio.gather(
+            *(get_cascade_probability(scenario, hour) for scenario, hour in scenarios_to_cache),
+            return_exceptions=True,
+        )
+        for (scenario, hour), result in zip(scenarios_to_cache, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to prewarm {scenario} h={hour}: {result}")
         logger.info(f"Cascade cache pre-warmed with {len(_cascade_cache)} entries")
 
     # Run async in background (don't await)
@@ -104,7 +106,7 @@ async def get_grid_status(
     return {
         "scenario": scenario,
         "forecast_hour": forecast_hour,
-        "generated_at": datetime.now(timezone.utc),
+        "generated_at": now_cached(),
         "nodes": nodes,
         "edges": grid_graph.get_edges_raw(),
         "summary": {
@@ -119,6 +121,21 @@ async def get_grid_status(
     }
 
 
+# Serialized topology payload — the graph is static once loaded, so the
+# ~2k-node / ~3k-edge JSON is rendered once per loaded graph.
+_topology_json: Tuple[int, bytes] | None = None
+
+
+def get_topology_json() -> bytes:
+    """JSON bytes of ``GridTopologyResponse`` for the currently loaded graph."""
+    global _topology_json
+    key = id(grid_graph.graph)
+    if _topology_json is None or _topology_json[0] != key:
+        payload = GridTopologyResponse(**get_topology()).model_dump_json().encode()
+        _topology_json = (key, payload)
+    return _topology_json[1]
+
+
 def get_topology() -> Dict[str, Any]:
     """Raw grid graph for frontend globe rendering."""
     raw = grid_graph.get_topology()
@@ -210,7 +227,7 @@ async def get_cascade_probability(
                 for r in overview.regions
             }
 
-        cascade_result = run_cascade(
+        cascade_result = await run_cascade_async(
             graph=grid_graph.graph,
             demand_multipliers=multipliers,
             scenario_label=f"{scenario}_cascade_prob",
@@ -40,6 +40,13 @@ _ARC_DEFS: List[Dict[str, Any]] = [
 ]
 
 
+# Static per-city lookups, built once instead of scanned per arc
+_CITY_COORDS: Dict[str, Tuple[float, float]] = {
+    c["id"]: (c["lat"], c["lon"]) for c in _HOTSPOT_CITIES
+}
+_CITY_ZONE: Dict[str, str] = {c["id"]: c["weather_zone"] for c in _HOTSPOT_CITIES}
+
+
 def _get_node_loads(scenario: str) -> Dict[str, Tuple[float, float]]:
     """Return {node_id: (load_mw, capacity_mw)} for all nodes."""
     forecast_hour = 36 if scenario == "uri" else 12
@@ -86,9 +93,13 @@ def get_hotspots(scenario: str = "uri") -> HotspotsResponse:
     """Return city-level hotspots with severity derived from weather zone data."""
     node_loads = _get_node_loads(scenario)
     hotspots: List[GridHotspot] = []
+    zone_status: Dict[str, Tuple[str, float, float, float]] = {}
 
     for city in _HOTSPOT_CITIES:
-        status, load, cap, risk = _status_for_zone(city["weather_zone"], node_loads)
+        zone = city["weather_zone"]
+        if zone not in zone_status:
+            zone_status[zone] = _status_for_zone(zone, node_loads)
+        status, load, cap, risk = zone_status[zone]
         hotspots.append(GridHotspot(
             id=city["id"],
             name=city["name"],
@@ -105,10 +116,6 @@ def get_hotspots(scenario: str = "uri") -> HotspotsResponse:
 
 def get_arcs(scenario: str = "uri") -> ArcsResponse:
     """Return transmission arcs between hotspot cities."""
-    coords: Dict[str, Tuple[float, float]] = {}
-    for city in _HOTSPOT_CITIES:
-        coords[city["id"]] = (city["lat"], city["lon"])
-
     node_loads = _get_node_loads(scenario)
 
     # Compute average utilization across the grid for arc scaling
@@ -116,18 +123,20 @@ def get_arcs(scenario: str = "uri") -> ArcsResponse:
     total_cap = sum(cap for load, cap in node_loads.values())
     grid_util = (total_load / total_cap * 100) if total_cap > 0 else 50.0
 
+    # Aggregate each zone once — several arcs share endpoints/zones
+    zone_status = {
+        zone: _status_for_zone(zone, node_loads) for zone in set(_CITY_ZONE.values())
+    }
+
     arcs: List[GridArc] = []
     for arc_def in _ARC_DEFS:
         src = arc_def["source"]
         tgt = arc_def["target"]
-        src_coords = coords[src]
-        tgt_coords = coords[tgt]
-
-        src_zone = next(c["weather_zone"] for c in _HOTSPOT_CITIES if c["id"] == src)
-        tgt_zone = next(c["weather_zone"] for c in _HOTSPOT_CITIES if c["id"] == tgt)
+        src_coords = _CITY_COORDS[src]
+        tgt_coords = _CITY_COORDS[tgt]
 
-        src_status = _status_for_zone(src_zone, node_loads)
-        tgt_status = _status_for_zone(tgt_zone, node_loads)
+        src_status = zone_status[_CITY_ZONE[src]]
+        tgt_status = zone_status[_CITY_ZONE[tgt]]
 
         # Arc capacity proportional to smaller zone's capacity
         arc_cap = min(src_status[2], tgt_status[2]) * 0.3
@@ -144,7 +153,7 @@ def get_arcs(scenario: str = "uri") -> ArcsResponse:
         else:
             status = "normal"
 
-        arcs.append(GridArc(
+        arcs.append(GridArc.model_construct(
             source=src,
             target=tgt,
             source_coords=list(src_coords),
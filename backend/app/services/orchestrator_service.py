@@ -9,7 +9,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, TypeVar
 
 import requests
 
@@ -22,17 +22,43 @@ from app.services.crew_dispatch_service import (
     load_failed_nodes,
     recommend_dispatch,
     reset as dispatch_reset,
+    wait_for_init,
 )
 from app.services.demand_service import compute_demand_multipliers
 from app.services.grid_graph_service import grid_graph
 from app.services.price_service import price_service
-from app.services.claude_service import enhance_alerts
+from app.services.claude_service import enhance_alerts_sync
 from app.services.utility_service import get_crews
 from app.services.weather_alert_service import generate_weather_alerts
-from app.services.alert_notification_service import broadcast_weather_alerts
+from app.services.alert_notification_service import broadcast_weather_alerts, close_client
 
 logger = logging.getLogger("blackout.orchestrator")
 
+T = TypeVar("T")
+
+
+def _run_on_loop(loop: Optional[asyncio.AbstractEventLoop], coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on ``loop`` and wait for it, or on a fresh loop if ``loop`` is None."""
+    if loop is None:
+        return asyncio.run(coro)
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+async def _dispatch_crews(scenario: str, cascade_result: Dict[str, Any], crews: List[Any]) -> Tuple[int, float]:
+    """Reset dispatch state for the run and dispatch every crew; returns (count, avg ETA).
+
+    Waits out any in-flight ``/crews/dispatch/init`` job first, since its
+    rebuild would otherwise reset the dispatches confirmed here.
+    """
+    await wait_for_init()
+    dispatch_reset(storm=(scenario in ("uri", "uri_2021")))
+    load_crews(crews)
+    load_failed_nodes(cascade_result, grid_graph.node_attrs, grid_graph.node_index)
+
+    recommendation = recommend_dispatch()
+    confirmed = dispatch_all(recommendation)
+    return len(confirmed), recommendation.avg_eta_minutes
+
 
 # ── Supabase helpers ──────────────────────────────────────────────────
 
@@ -104,6 +130,14 @@ def _fetch_all_consumer_profiles() -> List[Dict[str, Any]]:
         return []
 
 
+async def _broadcast(alerts: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Broadcast on a throwaway loop, closing the ntfy client it opened."""
+    try:
+        return await broadcast_weather_alerts(alerts)
+    finally:
+        await close_client()
+
+
 # ── Main pipeline ─────────────────────────────────────────────────────
 
 
@@ -111,12 +145,19 @@ def run_orchestrated_simulation(
     scenario: str = "uri",
     forecast_hour: int = 36,
     grid_region: str = "ERCOT",
+    loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> Dict[str, Any]:
     """Run the full simulation pipeline, writing progress to Supabase.
 
     Each UPDATE to ``simulation_sessions`` fires a Realtime event that the
     operator dashboard subscribes to.  Each INSERT into ``live_alerts``
     fires a Realtime event that the consumer dashboard subscribes to.
+
+    When called from a worker thread, pass the server's ``loop``.  The async
+    steps (weather alerts, Claude, ntfy, crew dispatch) then run on it: they
+    reuse its pooled HTTP clients instead of rebuilding them per run, and
+    dispatch state is only touched from the loop that serves the dispatch
+    endpoints.
     """
 
     # ── 1. Create session ────────────────────────────────────────
@@ -162,8 +203,22 @@ def run_orchestrated_simulation(
         hours=48,
     )
 
-    peak_price = max(p.price_mwh for p in prices) if prices else 0
-    avg_price = (sum(p.price_mwh for p in prices) / len(prices)) if prices else 0
+    # Single pass over the forecast for wholesale peak/avg and retail peak/valley
+    peak_price = avg_price = 0.0
+    consumer_peak = consumer_low = 0.0
+    if prices:
+        total_price = 0.0
+        peak_price = prices[0].price_mwh
+        consumer_peak = consumer_low = prices[0].consumer_price_kwh
+        for p in prices:
+            total_price += p.price_mwh
+            if p.price_mwh > peak_price:
+                peak_price = p.price_mwh
+            if p.consumer_price_kwh > consumer_peak:
+                consumer_peak = p.consumer_price_kwh
+            elif p.consumer_price_kwh < consumer_low:
+                consumer_low = p.consumer_price_kwh
+        avg_price = total_price / len(prices)
 
     _update_session(session_id, {
         "status": "prices_done",
@@ -186,7 +241,7 @@ def run_orchestrated_simulation(
 
         try:
             # Generate weather-based alerts for this consumer
-            weather_alerts = asyncio.run(generate_weather_alerts(
+            weather_alerts = _run_on_loop(loop, generate_weather_alerts(
                 profile_id=profile_id,
                 region=grid_region,
                 scenario="uri_2021" if scenario == "uri" else "normal",
@@ -256,8 +311,6 @@ def run_orchestrated_simulation(
 
     # 5d. Device savings alert (for consumers with smart devices)
     if peak_price > 50:
-        consumer_peak = max(p.consumer_price_kwh for p in prices) if prices else 0
-        consumer_low = min(p.consumer_price_kwh for p in prices) if prices else 0
         savings_per_kwh = consumer_peak - consumer_low
         alerts.append({
             "session_id": session_id,
@@ -294,7 +347,7 @@ def run_orchestrated_simulation(
         })
 
     # Enhance alert text with Claude (falls back to originals on error)
-    alerts = enhance_alerts(alerts)
+    alerts = enhance_alerts_sync(alerts, loop)
 
     _insert_alerts(alerts)
 
@@ -302,7 +355,10 @@ def run_orchestrated_simulation(
     weather_alerts = [a for a in alerts if a.get("alert_type", "").startswith("weather_")]
     if weather_alerts:
         try:
-            notification_result = asyncio.run(broadcast_weather_alerts(weather_alerts))
+            if loop is not None:
+                notification_result = _run_on_loop(loop, broadcast_weather_alerts(weather_alerts))
+            else:
+                notification_result = asyncio.run(_broadcast(weather_alerts))
             logger.info(
                 "Orchestrator: sent %d weather notifications (%d failed)",
                 notification_result.get("success", 0),
@@ -322,22 +378,10 @@ def run_orchestrated_simulation(
     avg_eta = 0.0
 
     if cascade_result["total_failed_nodes"] > 0:
-        dispatch_reset(storm=(scenario in ("uri", "uri_2021")))
-
         crew_roster = get_crews(scenario=scenario)
-        load_crews(crew_roster.crews)
-
-        graph_nodes = {
-            nid: dict(grid_graph.graph.nodes[nid])
-            for nid in grid_graph.graph.nodes
-        }
-        load_failed_nodes(cascade_result, graph_nodes)
-
-        recommendation = recommend_dispatch()
-        confirmed = dispatch_all(recommendation)
-
-        crews_dispatched = len(confirmed)
-        avg_eta = recommendation.avg_eta_minutes
+        crews_dispatched, avg_eta = _run_on_loop(
+            loop, _dispatch_crews(scenario, cascade_result, crew_roster.crews)
+        )
 
     _update_session(session_id, {
         "status": "completed",
@@ -6,7 +6,7 @@ from typing import Any, Dict, Set
 
 from app.models.utility import OutcomeComparison, ScenarioOutcome
 from app.services import demand_service
-from app.services.cascade_service import run_cascade
+from app.services.cascade_service import run_cascades
 from app.services.grid_graph_service import grid_graph
 
 # Customers per MW of lost capacity
@@ -36,12 +36,26 @@ def get_outcomes(scenario: str = "uri") -> OutcomeComparison:
         scenario=scenario, forecast_hour=36
     )
 
-    result_without = run_cascade(
-        graph=grid_graph.graph,
-        demand_multipliers=multipliers_raw,
-        scenario_label=f"{scenario}_no_mitigation",
-        forecast_hour=36,
-    )
+    # ── With Blackout: 12% demand reduction + crew repair factor ────
+    multipliers_mitigated = {
+        nid: mult * 0.88 for nid, mult in multipliers_raw.items()
+    }
+
+    # The two runs are independent, so they go to the cascade pool together
+    result_without, result_with = run_cascades([
+        {
+            "graph": grid_graph.graph,
+            "demand_multipliers": multipliers_raw,
+            "scenario_label": f"{scenario}_no_mitigation",
+            "forecast_hour": 36,
+        },
+        {
+            "graph": grid_graph.graph,
+            "demand_multipliers": multipliers_mitigated,
+            "scenario_label": f"{scenario}_with_blackout",
+            "forecast_hour": 36,
+        },
+    ])
 
     failed_without = result_without["total_failed_nodes"]
     shed_without = result_without["total_load_shed_mw"]
@@ -49,18 +63,6 @@ def get_outcomes(scenario: str = "uri") -> OutcomeComparison:
     regions_without = _count_affected_zones(result_without["failed_node_ids"])
     steps_without = result_without["cascade_depth"]
 
-    # ── With Blackout: 12% demand reduction + crew repair factor ────
-    multipliers_mitigated = {
-        nid: mult * 0.88 for nid, mult in multipliers_raw.items()
-    }
-
-    result_with = run_cascade(
-        graph=grid_graph.graph,
-        demand_multipliers=multipliers_mitigated,
-        scenario_label=f"{scenario}_with_blackout",
-        forecast_hour=36,
-    )
-
     failed_with = result_with["total_failed_nodes"]
     shed_with = result_with["total_load_shed_mw"]
     customers_with = int(shed_with * _CUSTOMERS_PER_MW)
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import logging
 import requests
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from app.models.utility import (
     NationalOverview,
@@ -16,6 +18,7 @@ from app.models.utility import (
 from app.services import demand_service
 from app.services.demand_service import _fetch_zone_weather
 from app.services.grid_graph_service import grid_graph, ZONE_CENTROIDS
+from app.utils.clock import now_cached
 
 logger = logging.getLogger("blackout.overview_service")
 
@@ -270,7 +273,7 @@ def get_overview(scenario: str = "uri") -> NationalOverview:
         total_load_mw=round(total_load, 1),
         total_capacity_mw=round(total_cap, 1),
         regions=regions,
-        timestamp=datetime.now(timezone.utc),
+        timestamp=now_cached(),
     )
 
 
@@ -281,3 +284,34 @@ def get_region(region_id: str, scenario: str = "uri") -> Optional[RegionOverview
         if r.region_id == region_id:
             return r
     return None
+
+
+# ── Structure-of-arrays view ────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class OverviewSoA:
+    """Per-region overview fields as parallel arrays, in ``regions`` order."""
+
+    region_ids: Tuple[str, ...]
+    names: Tuple[str, ...]
+    conditions: Tuple[str, ...]
+    temp_f: np.ndarray  # float64
+    wind_mph: np.ndarray  # float64
+    is_extreme: np.ndarray  # bool
+    status: np.ndarray  # RegionStatus values as str
+
+
+def overview_soa(overview: NationalOverview) -> OverviewSoA:
+    """Column view of an already-built overview."""
+    regions = overview.regions
+    n = len(regions)
+    return OverviewSoA(
+        region_ids=tuple(r.region_id for r in regions),
+        names=tuple(r.name for r in regions),
+        conditions=tuple(r.weather.condition for r in regions),
+        temp_f=np.fromiter((r.weather.temp_f for r in regions), dtype=np.float64, count=n),
+        wind_mph=np.fromiter((r.weather.wind_mph for r in regions), dtype=np.float64, count=n),
+        is_extreme=np.fromiter((r.weather.is_extreme for r in regions), dtype=bool, count=n),
+        status=np.array([r.status.value for r in regions], dtype=str),
+    )
@@ -438,7 +438,7 @@ class PriceService:
             consumer_kwh = round(max(0.0, price_mwh / 1000.0 * 2.2 + 0.04), 4)
             demand_factor = round(TOD_CURVE.get(hod, 1.0), 2)
 
-            prices.append(HourlyPrice(
+            prices.append(HourlyPrice.model_construct(
                 hour=h,
                 timestamp=now + timedelta(hours=h),
                 price_mwh=round(price_mwh, 2),
@@ -497,7 +497,7 @@ class PriceService:
 
             consumer_kwh = round(max(0.0, price_mwh / 1000.0 * 2.2 + 0.04), 4)
 
-            adjusted.append(HourlyPrice(
+            adjusted.append(HourlyPrice.model_construct(
                 hour=hp.hour,
                 timestamp=hp.timestamp,
                 price_mwh=round(price_mwh, 2),
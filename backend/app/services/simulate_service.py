@@ -1,27 +1,27 @@
 """Simulate Service — chains demand → cascade for the
-POST /api/simulate/cascade endpoint.
+POST /api/simulate/cascade and /api/simulate/cascade/stream endpoints.
 """
 
 from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from app.services import demand_service, overview_service
-from app.services.cascade_service import run_cascade
+from app.services.cascade_service import run_cascade_async, stream_cascade
 from app.services.grid_graph_service import grid_graph
 
 logger = logging.getLogger("blackout.simulate_service")
 
 
-async def run_cascade_simulation(
+def _cascade_inputs(
     start_time_str: str,
     forecast_hour: int,
     region: str,
     scenario: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Full pipeline: compute demand from ERCOT data → run cascade.
+    """Compute demand from ERCOT data → keyword arguments for the cascade.
 
     Parameters
     ----------
@@ -69,13 +69,35 @@ async def run_cascade_simulation(
         }
         logger.info(f"Weather data loaded for {len(weather_by_zone)} zones from '{overview_scenario}' overview")
 
-    # Run the cascade simulation on a deep copy of the grid
-    result = run_cascade(
-        graph=grid_graph.graph,
-        demand_multipliers=multipliers,
-        scenario_label=f"{region.lower()}_{resolved_scenario}",
-        forecast_hour=forecast_hour,
-        weather_by_zone=weather_by_zone,
-    )
+    # The shared graph is read, never mutated
+    return {
+        "graph": grid_graph.graph,
+        "demand_multipliers": multipliers,
+        "scenario_label": f"{region.lower()}_{resolved_scenario}",
+        "forecast_hour": forecast_hour,
+        "weather_by_zone": weather_by_zone,
+    }
 
-    return result
+
+async def run_cascade_simulation(
+    start_time_str: str,
+    forecast_hour: int,
+    region: str,
+    scenario: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Full pipeline: compute demand from ERCOT data → run cascade.
+
+    Parameters are as for ``_cascade_inputs``.
+    """
+    return await run_cascade_async(**_cascade_inputs(start_time_str, forecast_hour, region, scenario))
+
+
+async def stream_cascade_simulation(
+    start_time_str: str,
+    forecast_hour: int,
+    region: str,
+    scenario: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """``run_cascade_simulation`` yielding each step, then the summary."""
+    async for item in stream_cascade(**_cascade_inputs(start_time_str, forecast_hour, region, scenario)):
+        yield item
@@ -62,13 +62,8 @@ _NORMAL_CREWS_FALLBACK: List[dict] = [
 ]
 
 
-def get_crews(scenario: str = "uri") -> CrewOptimizationResponse:
-    """Return crew roster for the given scenario (from Supabase or fallback)."""
-    rows = _fetch_crews_from_supabase(scenario)
-    if rows is None:
-        rows = _URI_CREWS_FALLBACK if scenario == "uri" else _NORMAL_CREWS_FALLBACK
-
-    crews = [
+def _rows_to_crews(rows: List[dict]) -> List[Crew]:
+    return [
         Crew(
             crew_id=r["crew_id"],
             name=r["name"],
@@ -80,7 +75,23 @@ def get_crews(scenario: str = "uri") -> CrewOptimizationResponse:
         )
         for r in rows
     ]
-    return CrewOptimizationResponse(
+
+
+# Fallback rosters never change — build the models once at import.
+# Dispatch takes its own copies (see crew_dispatch_service.load_crews).
+_URI_CREWS: List[Crew] = _rows_to_crews(_URI_CREWS_FALLBACK)
+_NORMAL_CREWS: List[Crew] = _rows_to_crews(_NORMAL_CREWS_FALLBACK)
+
+
+def get_crews(scenario: str = "uri") -> CrewOptimizationResponse:
+    """Return crew roster for the given scenario (from Supabase or fallback)."""
+    rows = _fetch_crews_from_supabase(scenario)
+    if rows is None:
+        crews = list(_URI_CREWS if scenario == "uri" else _NORMAL_CREWS)
+    else:
+        crews = _rows_to_crews(rows)
+
+    return CrewOptimizationResponse.model_construct(
         crews=crews,
         total_deployed=0,
         coverage_pct=0.0,
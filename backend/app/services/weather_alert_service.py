@@ -7,11 +7,13 @@ to maximize consumer savings and grid resilience.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import requests
 
 from app.config import settings
@@ -89,14 +91,12 @@ def _get_peak_temperature(forecast_data: Dict[str, Any]) -> Optional[float]:
 
         max_temp = None
         for step in steps:
-            temp_grid = step.get("temperature_f", [])
-            if temp_grid:
-                # Flatten 2D grid and find max
-                flat_temps = [t for row in temp_grid for t in row]
-                step_max = max(flat_temps) if flat_temps else None
-                if step_max is not None:
-                    if max_temp is None or step_max > max_temp:
-                        max_temp = step_max
+            # Grid may be a numpy array (fresh fetch) or nested lists (disk cache)
+            temp_grid = np.asarray(step.get("temperature_f", []), dtype=float)
+            if temp_grid.size:
+                step_max = float(temp_grid.max())
+                if max_temp is None or step_max > max_temp:
+                    max_temp = step_max
 
         return max_temp
     except Exception as exc:
@@ -113,14 +113,12 @@ def _get_min_temperature(forecast_data: Dict[str, Any]) -> Optional[float]:
 
         min_temp = None
         for step in steps:
-            temp_grid = step.get("temperature_f", [])
-            if temp_grid:
-                # Flatten 2D grid and find min
-                flat_temps = [t for row in temp_grid for t in row]
-                step_min = min(flat_temps) if flat_temps else None
-                if step_min is not None:
-                    if min_temp is None or step_min < min_temp:
-                        min_temp = step_min
+            # Grid may be a numpy array (fresh fetch) or nested lists (disk cache)
+            temp_grid = np.asarray(step.get("temperature_f", []), dtype=float)
+            if temp_grid.size:
+                step_min = float(temp_grid.min())
+                if min_temp is None or step_min < min_temp:
+                    min_temp = step_min
 
         return min_temp
     except Exception as exc:
@@ -479,7 +477,8 @@ async def generate_weather_alerts(
         weather_forecast = await weather_service.get_forecast(start_time, region)
 
         # Fetch 48-hour price forecast
-        price_forecast = price_service.get_price_forecast(
+        price_forecast = await asyncio.to_thread(
+            price_service.get_price_forecast,
             region=region,
             mode=PricingMode.HYBRID,
             scenario=scenario,
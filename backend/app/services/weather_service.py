@@ -18,11 +18,23 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import numpy as np
 
 logger = logging.getLogger("blackout.weather")
 
 OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
 
+# Open-Meteo hourly variables stacked into the grid forecast, in
+# [temperature, wind speed, wind direction, pressure] order.
+_GRID_VARS = ("temperature_2m", "wind_speed_10m", "wind_direction_10m", "surface_pressure")
+
+# Rendered responses kept in memory (one per start_time / city)
+RENDERED_CACHE_MAX = 64
+
+# Shared Open-Meteo connection pool; the grid fetch fans out 5 at a time and
+# the city fetch one request per city.
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=300)
+
 
 # ── Custom exceptions ───────────────────────────────────────────────
 
@@ -105,6 +117,7 @@ async def _fetch_open_meteo(
     lat: float,
     lon: float,
     hours: int = 48,
+    timeout: float = 30.0,
 ) -> Dict[str, Any]:
     """Fetch hourly forecast for a single lat/lon point."""
     params = {
@@ -115,11 +128,18 @@ async def _fetch_open_meteo(
         "wind_speed_unit": "mph",
         "forecast_hours": hours,
     }
-    resp = await client.get(OPEN_METEO_URL, params=params)
+    resp = await client.get(OPEN_METEO_URL, params=params, timeout=timeout)
     resp.raise_for_status()
     return resp.json()
 
 
+def _json_default(obj: Any) -> Any:
+    """Let the disk cache write numpy grids as nested lists."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 # ════════════════════════════════════════════════════════════════════
 #  WeatherService
 # ════════════════════════════════════════════════════════════════════
@@ -141,6 +161,10 @@ class WeatherService:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._gpu_name: str = "N/A (Open-Meteo API)"
+        # cache key → rendered response ``data`` JSON, so repeat hits skip
+        # both the disk read and model re-serialization
+        self._rendered: Dict[str, bytes] = {}
+        self._client: Optional[httpx.AsyncClient] = None
 
     # ── Model lifecycle ─────────────────────────────────────────────
 
@@ -149,6 +173,18 @@ class WeatherService:
         self.model_loaded = True
         logger.info("Weather service ready (Open-Meteo API — no model to load)")
 
+    async def close(self) -> None:
+        """Close the shared HTTP client (app shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _http(self) -> httpx.AsyncClient:
+        """Keep-alive client reused across fetches, so repeat calls skip DNS/TLS setup."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=30.0)
+        return self._client
+
     # ── Public API ──────────────────────────────────────────────────
 
     async def get_forecast(
@@ -233,20 +269,20 @@ class WeatherService:
         )
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                # Batch requests to avoid rate limiting (Open-Meteo allows ~10k/day)
-                results = []
-                batch_size = 5
-                for i in range(0, len(GRID_POINTS), batch_size):
-                    batch = GRID_POINTS[i : i + batch_size]
-                    batch_tasks = [
-                        _fetch_open_meteo(client, lat, lon, hours=steps * 6)
-                        for lat, lon in batch
-                    ]
-                    batch_results = await asyncio.gather(*batch_tasks)
-                    results.extend(batch_results)
-                    if i + batch_size < len(GRID_POINTS):
-                        await asyncio.sleep(0.3)
+            client = self._http()
+            # Batch requests to avoid rate limiting (Open-Meteo allows ~10k/day)
+            results = []
+            batch_size = 5
+            for i in range(0, len(GRID_POINTS), batch_size):
+                batch = GRID_POINTS[i : i + batch_size]
+                batch_tasks = [
+                    _fetch_open_meteo(client, lat, lon, hours=steps * 6, timeout=60.0)
+                    for lat, lon in batch
+                ]
+                batch_results = await asyncio.gather(*batch_tasks)
+                results.extend(batch_results)
+                if i + batch_size < len(GRID_POINTS):
+                    await asyncio.sleep(0.3)
         except httpx.HTTPStatusError as exc:
             raise DataFetchError(
                 f"Open-Meteo API returned {exc.response.status_code}: {exc}"
@@ -270,57 +306,43 @@ class WeatherService:
         total_hours = len(sample_hourly.get("time", []))
         n_steps = min(steps + 1, total_hours // 6 + 1)
 
+        # One dense [var][step][lat][lon] block, filled point by point; each
+        # step's grid is then a contiguous slice handed to the response model
+        # without building nested Python lists.
+        hour_idx = np.arange(n_steps) * 6
+        grids = np.zeros((len(_GRID_VARS), n_steps, n_lats, n_lons))
+        for i, lat in enumerate(GRID_LATS):
+            for j, lon in enumerate(GRID_LONS):
+                hourly = point_data[(lat, lon)].get("hourly", {})
+                n_temps = len(hourly.get("temperature_2m", []))
+                idx = np.minimum(hour_idx, n_temps - 1) if n_temps else np.zeros_like(hour_idx)
+                for v, name in enumerate(_GRID_VARS):
+                    vals = np.asarray(hourly.get(name, []), dtype=np.float64)
+                    ok = idx < len(vals)
+                    grids[v, ok, i, j] = vals[idx[ok]]
+        grids = np.round(grids, 1)
+        temp_grids, wind_grids, wdir_grids, pres_grids = grids
+
+        grid_bounds = {
+            "lat_min": float(GRID_LATS[-1]),
+            "lat_max": float(GRID_LATS[0]),
+            "lon_min": float(GRID_LONS[0]),
+            "lon_max": float(GRID_LONS[-1]),
+        }
         timesteps: List[Dict[str, Any]] = []
         for s in range(n_steps):
-            hour = s * 6
-            hour_idx = hour  # index into hourly arrays
+            hour = int(hour_idx[s])
             ts = start_time + timedelta(hours=hour)
-
-            # Build 2D grids
-            temp_grid: List[List[float]] = []
-            wind_grid: List[List[float]] = []
-            wdir_grid: List[List[float]] = []
-            pres_grid: List[List[float]] = []
-
-            for lat in GRID_LATS:
-                temp_row: List[float] = []
-                wind_row: List[float] = []
-                wdir_row: List[float] = []
-                pres_row: List[float] = []
-                for lon in GRID_LONS:
-                    hourly = point_data[(lat, lon)].get("hourly", {})
-                    temps = hourly.get("temperature_2m", [])
-                    winds = hourly.get("wind_speed_10m", [])
-                    wdirs = hourly.get("wind_direction_10m", [])
-                    press = hourly.get("surface_pressure", [])
-
-                    idx = min(hour_idx, len(temps) - 1) if temps else 0
-
-                    temp_row.append(round(temps[idx], 1) if idx < len(temps) else 0.0)
-                    wind_row.append(round(winds[idx], 1) if idx < len(winds) else 0.0)
-                    wdir_row.append(round(wdirs[idx], 1) if idx < len(wdirs) else 0.0)
-                    pres_row.append(round(press[idx], 1) if idx < len(press) else 0.0)
-
-                temp_grid.append(temp_row)
-                wind_grid.append(wind_row)
-                wdir_grid.append(wdir_row)
-                pres_grid.append(pres_row)
-
             timesteps.append(
                 {
                     "step": s,
                     "hour": hour,
                     "timestamp": ts.isoformat(),
-                    "temperature_f": temp_grid,
-                    "wind_mph": wind_grid,
-                    "wind_dir_deg": wdir_grid,
-                    "pressure_hpa": pres_grid,
-                    "grid_bounds": {
-                        "lat_min": float(GRID_LATS[-1]),
-                        "lat_max": float(GRID_LATS[0]),
-                        "lon_min": float(GRID_LONS[0]),
-                        "lon_max": float(GRID_LONS[-1]),
-                    },
+                    "temperature_f": temp_grids[s],
+                    "wind_mph": wind_grids[s],
+                    "wind_dir_deg": wdir_grids[s],
+                    "pressure_hpa": pres_grids[s],
+                    "grid_bounds": dict(grid_bounds),
                 }
             )
 
@@ -357,12 +379,12 @@ class WeatherService:
         coords = list(CITIES.values())
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                tasks = [
-                    _fetch_open_meteo(client, lat, lon, hours=48)
-                    for lat, lon in coords
-                ]
-                results = await asyncio.gather(*tasks)
+            client = self._http()
+            tasks = [
+                _fetch_open_meteo(client, lat, lon, hours=48, timeout=30.0)
+                for lat, lon in coords
+            ]
+            results = await asyncio.gather(*tasks)
         except (httpx.HTTPError, Exception) as exc:
             raise DataFetchError(f"Open-Meteo API error: {exc}") from exc
 
@@ -409,6 +431,16 @@ class WeatherService:
 
     # ── Caching ─────────────────────────────────────────────────────
 
+    def get_rendered(self, start_time: datetime, suffix: str = "") -> Optional[bytes]:
+        """Rendered response JSON stored by ``set_rendered``, if any."""
+        return self._rendered.get(self._cache_key(start_time) + suffix)
+
+    def set_rendered(self, start_time: datetime, body: bytes, suffix: str = "") -> None:
+        """Keep the rendered response for this forecast until it is re-fetched."""
+        if len(self._rendered) >= RENDERED_CACHE_MAX:
+            self._rendered.pop(next(iter(self._rendered)))
+        self._rendered[self._cache_key(start_time) + suffix] = body
+
     def _cache_key(self, start_time: datetime) -> str:
         return start_time.strftime("%Y%m%dT%H%M%S")
 
@@ -421,9 +453,13 @@ class WeatherService:
             return json.load(f)
 
     def _save_to_cache(self, key: str, data: Dict[str, Any]) -> None:
+        # Drop rendered responses built from the previous copy (a city
+        # forecast key also covers its per-city entries)
+        for stale in [k for k in self._rendered if k == key or k.startswith(key + "/")]:
+            del self._rendered[stale]
         path = self.cache_dir / f"{key}.json"
         with open(path, "w") as f:
-            json.dump(data, f)
+            json.dump(data, f, default=_json_default)
         logger.info("Cached forecast: %s", key)
 
 
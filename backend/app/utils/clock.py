@@ -0,0 +1,46 @@
+"""Coarse wall clock for response timestamps.
+
+``now_cached()`` returns a UTC timestamp refreshed once per second by a
+background task started in the app lifespan.  Use it for envelope fields
+like ``generated_at`` where sub-second precision is meaningless; keep
+``datetime.now(timezone.utc)`` where the exact instant matters (cascade
+start/finish, profile creation).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+REFRESH_INTERVAL_S = 1.0
+
+_now: Optional[datetime] = None
+
+
+def now_cached() -> datetime:
+    """Current UTC time, accurate to ~1 s once the ticker is running."""
+    return _now if _now is not None else datetime.now(timezone.utc)
+
+
+async def _tick() -> None:
+    global _now
+    while True:
+        _now = datetime.now(timezone.utc)
+        await asyncio.sleep(REFRESH_INTERVAL_S)
+
+
+def start_clock() -> asyncio.Task:
+    """Start the background refresher.  Call from inside the running loop."""
+    return asyncio.create_task(_tick())
+
+
+async def stop_clock(task: asyncio.Task) -> None:
+    """Cancel the refresher and fall back to the real clock."""
+    global _now
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    _now = None
@@ -0,0 +1,23 @@
+"""Enum helpers shared by the model modules."""
+
+from __future__ import annotations
+
+from typing import Any, TypeVar
+
+E = TypeVar("E")
+
+
+class FastEnum:
+    """Mixin adding a direct value → member lookup to an ``Enum``.
+
+    ``Cls(value)`` goes through ``EnumMeta.__call__`` before reaching the
+    value map; ``Cls.fv(value)`` reads the map directly and only falls back
+    to the full constructor (aliases, ``_missing_``, errors) on a miss.
+    """
+
+    @classmethod
+    def fv(cls: type[E], value: Any) -> E:
+        try:
+            return cls._value2member_map_[value]  # type: ignore[attr-defined]
+        except KeyError:
+            return cls(value)  # type: ignore[call-arg]
@@ -3,20 +3,48 @@ from typing import Dict
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
 
 from app.config import settings
+from app.response_cache import ResponseCacheMiddleware
 from app.routers import consumer, forecast, grid, notifications, orchestrate, simulate, utility, weather
-from app.schemas.responses import ErrorResponse
+from app.schemas.responses import error_head, error_response
+from app.services import alert_notification_service, claude_service
 from app.services.ercot_data_service import ercot_data
 from app.services.grid_graph_service import grid_graph
-from app.services.grid_service import prewarm_cascade_cache
+from app.services.grid_service import get_topology_json, prewarm_cascade_cache
 from app.services.price_service import price_service
-from app.services.weather_service import weather_service
+from app.services.weather_service import (
+    DataFetchError,
+    GPUOutOfMemoryError,
+    ModelNotLoadedError,
+    weather_service,
+)
+from app.utils.clock import start_clock, stop_clock
+
+
+def _warm_schemas(app: FastAPI) -> None:
+    """Build validator/serializer schemas for every route model up front.
+
+    Pydantic compiles core schemas lazily, so without this the first request
+    to each endpoint (and each ``SuccessResponse[X]`` parametrization) pays
+    the build cost.
+    """
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        if route.response_model is not None:
+            TypeAdapter(route.response_model)
+        if route.body_field is not None:
+            TypeAdapter(route.body_field.type_)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    _warm_schemas(app)
+
     # Startup: load ACTIVSg2000 grid, ERCOT load data, weather model, price model.
     grid_graph.load()
     ercot_data.load()
@@ -26,57 +54,89 @@ async def lifespan(app: FastAPI):
     # Pre-warm cascade probability cache (runs in background)
     prewarm_cascade_cache()
 
+    # Render the static topology payload once, before the first request
+    get_topology_json()
+
+    # Coarse 1 s clock for response timestamps
+    clock_task = start_clock()
+
     yield
-    # Shutdown: nothing to clean up — model memory freed automatically.
+    # Shutdown: stop the clock and close pooled connections; model memory is
+    # freed automatically.
+    await stop_clock(clock_task)
+    await weather_service.close()
+    await alert_notification_service.close_client()
+    await claude_service.close_client()
 
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Blackout API — grid forecasting, simulation, and consumer intelligence",
+    default_response_class=ORJSONResponse,
+    # Interactive docs + OpenAPI schema generation only in debug builds
+    docs_url="/docs" if settings.debug else None,
+    redoc_url="/redoc" if settings.debug else None,
+    openapi_url="/openapi.json" if settings.debug else None,
     lifespan=lifespan,
 )
 
+# Middleware added last runs outermost.  The response cache sits inside CORS
+# so cached bodies never carry another request's CORS headers.
+app.add_middleware(ResponseCacheMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
-app.include_router(weather.router)
-app.include_router(forecast.router)
-app.include_router(grid.router)
-app.include_router(simulate.router)
-app.include_router(consumer.router)
-app.include_router(utility.router)
-app.include_router(orchestrate.router)
-app.include_router(notifications.router)
+for _router in (
+    weather.router,
+    forecast.router,
+    grid.router,
+    simulate.router,
+    consumer.router,
+    utility.router,
+    orchestrate.router,
+    notifications.router,
+):
+    app.include_router(_router)
+
+
+_INTERNAL_ERROR_HEAD = error_head("An unexpected error occurred.", "INTERNAL_SERVER_ERROR")
 
 
 @app.exception_handler(ValueError)
-async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
-    return JSONResponse(
-        status_code=422,
-        content=ErrorResponse(
-            detail=str(exc),
-            error_code="VALIDATION_ERROR",
-        ).model_dump(),
-    )
+async def value_error_handler(request: Request, exc: ValueError) -> Response:
+    return error_response(error_head(str(exc), "VALIDATION_ERROR"), status_code=422)
 
 
-@app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    return JSONResponse(
+@app.exception_handler(ModelNotLoadedError)
+async def model_not_loaded_handler(request: Request, exc: ModelNotLoadedError) -> Response:
+    return error_response(error_head(f"Weather model unavailable: {exc}", "MODEL_NOT_LOADED"), status_code=503)
+
+
+@app.exception_handler(DataFetchError)
+async def data_fetch_error_handler(request: Request, exc: DataFetchError) -> Response:
+    return error_response(error_head(f"Data fetch failed: {exc}", "DATA_FETCH_ERROR"), status_code=502)
+
+
+@app.exception_handler(GPUOutOfMemoryError)
+async def gpu_oom_handler(request: Request, exc: GPUOutOfMemoryError) -> Response:
+    return error_response(
+        error_head(f"GPU out of memory (VRAM used: {exc.vram_used_gb:.2f} GB): {exc}", "GPU_OOM"),
         status_code=500,
-        content=ErrorResponse(
-            detail="An unexpected error occurred.",
-            error_code="INTERNAL_SERVER_ERROR",
-        ).model_dump(),
     )
 
 
+@app.exception_handler(Exception)
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
+    return error_response(_INTERNAL_ERROR_HEAD, status_code=500)
+
+
 @app.get("/health", tags=["health"])
 async def health_check() -> Dict[str, str]:
     return {"status": "ok"}
@@ -0,0 +1,12 @@
+#!/usr/bin/env sh
+# Production launch: uvloop event loop + httptools HTTP parser (both ship
+# with uvicorn[standard]).
+#
+# Keep WEB_CONCURRENCY at 1 unless state is moved out of process — crew
+# dispatch, custom profiles and the response cache live in module memory.
+exec uvicorn main:app \
+    --host "${HOST:-0.0.0.0}" \
+    --port "${PORT:-8000}" \
+    --loop uvloop \
+    --http httptools \
+    --workers "${WEB_CONCURRENCY:-1}"
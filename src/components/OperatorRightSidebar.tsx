@@ -332,10 +332,8 @@ export default function OperatorRightSidebar({
         { method: "POST" }
       );
       if (!initRes.ok) throw new Error(`Init failed: ${initRes.status}`);
-      const initData = await initRes.json();
-      const failedNodes = initData.data?.failed_nodes ?? 0;
 
-      // Step 2: Dispatch all crews
+      // Step 2: Dispatch all crews (the backend waits for init to finish)
       const dispatchRes = await fetch("/api/backend/utility/crews/dispatch/all", {
         method: "POST",
       });
@@ -343,6 +341,11 @@ export default function OperatorRightSidebar({
       const result = await dispatchRes.json();
       const assignments = result.data ?? [];
 
+      // Init runs in the background, so its counts come from the status endpoint
+      const initStatusRes = await fetch("/api/backend/utility/crews/dispatch/init/status");
+      const initStatus = initStatusRes.ok ? await initStatusRes.json() : null;
+      const failedNodes = initStatus?.data?.failed_nodes ?? 0;
+
       // Mark dispatched crew IDs for highlight animation
       const ids = new Set<string>(assignments.map((a: any) => a.crew_id));
       setDispatchedIds(ids);